@@ -2,4 +2,24 @@
 Functions for processing data supplied during the NuRS research project.
 Includes functions for measuring data quality and summarizing data metrics.
 """
-from .api import mine_missing
+import sys
+import types
+
+__version__ = "0.1.0"
+
+
+class _Package(types.ModuleType):
+    """
+    The package module, importing the API on first use so that importing the package
+    (e.g. to run the command line tools) doesn't load pandas and sklearn.  A module
+    subclass rather than a module level __getattr__, which needs python 3.7.
+    """
+
+    def __getattr__(self, name):
+        if name == "mine_missing":
+            from .api import mine_missing  # pylint: disable=import-outside-toplevel
+            return mine_missing
+        raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+
+sys.modules[__name__].__class__ = _Package
@@ -1,47 +1,313 @@
 """
 API bindings to the missing mining functions
 """
+import time
+
 import pandas as pd
 from .missing_classifier import MissingClassifier
 from .missing_results import MissingResults
+from .readers import read_data, read_sheets, read_arrow_table, arrow_missing_mask, ARROW_TYPES
+from .streaming import summarize_csv, summarize_chunks
+from .worker_pool import parallel_imap_unordered
 
 
-def mine_missing_from_file(file_path: str, sheet_name=0) -> MissingResults:
+def mine_missing_from_file(file_path: str, sheet_name=0, n_jobs=1, executor=None,
+                           random_state=None, chunksize=None,
+                           sample_size=100000, cache_dir=None, columns=None,
+                           sidecar_dir=None, profile=False, writer=None, progress=None,
+                           cancel=None, time_budget=None,
+                           screening_alpha=None) -> MissingResults:
     """
     Mine a data set loaded from file for patterns of missingness.
     Parameters
     ----------
     file_path: str
         path to data set
-    sheet_name: Union[int, str] [optional]
-        Sheet ID of the data set to mine
+    sheet_name: Union[int, str, None] [optional]
+        Sheet ID of the data set to mine.  None mines every sheet of the workbook, see
+        mine_missing_from_workbook.
+    n_jobs: int [optional]
+        Number of worker processes to mine columns (or sheets) with.  -1 uses all CPUs.
+    executor: concurrent.futures.Executor [optional]
+        Executor to map the columns over, in place of n_jobs.
+    random_state: int [optional]
+        Seed for reproducible results.
+    chunksize: int [optional]
+        Stream a csv file chunksize rows at a time, mining a uniform sample of at most
+        sample_size rows rather than loading the whole file.
+    sample_size: int [optional]
+        Maximum number of rows mined when streaming.
+    cache_dir: str [optional]
+        Directory of cached results, reused for columns whose data has not changed.
+    columns: list [optional]
+        Only read and mine these columns.  Parquet and feather files are memory mapped
+        and only the requested columns are read.
+    sidecar_dir: str [optional]
+        Directory in which to keep Feather copies of csv and xls(x) sheets, loaded in
+        place of the original on later runs while it is unchanged.
+    profile: bool [optional]
+        Record the time and memory of each stage, see MissingResults.profile_summary.
+    writer: report_writers.ReportWriter [optional]
+        Writer to report each result to as soon as it is ready.  When mining every
+        sheet, results are written sheet by sheet once all sheets are mined.
+    progress: callable [optional]
+        Called as progress(n_done, n_total, result) after each column is mined.
+    cancel: callable [optional]
+        Called after each column (each sheet, when mining every sheet); mining stops
+        once it returns True.
+    time_budget: float [optional]
+        Seconds to mine within, degrading to cheaper models as time runs out and
+        listing the columns left unmined, see MissingClassifier.iter_columns.
+    screening_alpha: float [optional]
+        Skip fitting columns with no association stronger than this adjusted p-value,
+        see MissingClassifier.
 
     Returns
     -------
-    MissingResults
+    Union[MissingResults, dict]
+        A dict of MissingResults keyed by sheet name if sheet_name is None.
     """
-    if file_path.lower().endswith(".csv"):
-        data = pd.read_csv(file_path)
-    elif file_path.lower().endswith((".xls", ".xlsx")):
-        data = pd.read_excel(file_path, sheet_name=sheet_name)
+    if sheet_name is None:
+        results = mine_missing_from_workbook(
+            file_path, n_jobs=n_jobs, executor=executor, random_state=random_state,
+            cache_dir=cache_dir, columns=columns, sidecar_dir=sidecar_dir, profile=profile,
+            progress=progress, cancel=cancel, time_budget=time_budget,
+            screening_alpha=screening_alpha
+        )
+        if writer is not None:
+            for sheet_results in results.values():
+                writer.write_all(sheet_results)
+            unmined = [i for sheet_results in results.values() for i in sheet_results.unmined]
+            if unmined:
+                writer.write_unmined(unmined)
+        return results
+
+    if file_path.lower().endswith(ARROW_TYPES):
+        table = read_arrow_table(file_path, columns=columns)
+        missing_classifier = MissingClassifier(
+            table.to_pandas(), random_state=random_state, missing=arrow_missing_mask(table),
+            profile=profile, screening_alpha=screening_alpha
+        )
+        return missing_classifier.test_all_columns(
+            n_jobs=n_jobs, executor=executor, cache=cache_dir, writer=writer,
+            progress=progress, cancel=cancel, time_budget=time_budget
+        )
+
+    if chunksize is not None:
+        if not file_path.lower().endswith(".csv"):
+            raise TypeError("Expecting file of type csv when streaming in chunks.  Check file type")
+        summary = summarize_csv(
+            file_path, chunksize=chunksize, sample_size=sample_size,
+            random_state=random_state, columns=columns
+        )
+        # Columns missing only outside the sample are reported as unmined.
+        data, mined_columns = summary.sample, list(summary.missing_columns)
     else:
-        raise TypeError("Expecting file of type csv or xls(x).  Check file type")
+        data = read_data(file_path, sheet_name, columns=columns, sidecar_dir=sidecar_dir)
+        mined_columns = None
+
+    return mine_missing(
+        data, n_jobs=n_jobs, executor=executor, random_state=random_state, cache_dir=cache_dir,
+        columns=mined_columns,
+        profile=profile, writer=writer, progress=progress, cancel=cancel,
+        time_budget=time_budget, screening_alpha=screening_alpha
+    )
+
+
+def mine_missing_from_workbook(file_path: str, n_jobs=1, executor=None, random_state=None,
+                               cache_dir=None, columns=None, sidecar_dir=None, profile=False,
+                               progress=None, cancel=None, time_budget=None,
+                               screening_alpha=None) -> dict:
+    """
+    Mine every sheet of an xls(x) workbook for patterns of missingness.
+    The workbook is parsed once and its sheets are mined concurrently by a pool of
+    n_jobs worker processes.
+    Parameters
+    ----------
+    file_path: str
+        path to workbook
+    n_jobs: int [optional]
+        Number of worker processes to mine sheets with.  -1 uses all CPUs.
+    executor: concurrent.futures.Executor [optional]
+        Executor to map the sheets over, in place of n_jobs.
+    random_state: int [optional]
+        Seed for reproducible results.
+    cache_dir: str [optional]
+        Directory of cached results, reused for columns whose data has not changed.
+    columns: list [optional]
+        Only read and mine these columns.
+    sidecar_dir: str [optional]
+        Directory in which to keep Feather copies of each sheet.
+    profile: bool [optional]
+        Record the time and memory of each stage, see MissingResults.profile_summary.
+    progress: callable [optional]
+        Called as progress(n_done, n_total, result) for each column of a sheet once the
+        sheet is mined, n_total counting the columns with missing values of every
+        sheet.
+    cancel: callable [optional]
+        Called after each sheet is mined; mining stops once it returns True, and the
+        columns of the sheets not yet mined are listed as unmined.
+    time_budget: float [optional]
+        Seconds to mine the whole workbook within.  Each sheet is mined within the time
+        left when it starts, see MissingClassifier.iter_columns.
+    screening_alpha: float [optional]
+        Skip fitting columns with no association stronger than this adjusted p-value,
+        see MissingClassifier.
+
+    Returns
+    -------
+    dict
+        MissingResults keyed by sheet name, in workbook order.  See
+        missing_results.combined_markdown for a report on all sheets.
+    """
+    sheets = read_sheets(file_path, columns=columns, sidecar_dir=sidecar_dir)
+    settings = {
+        "random_state": random_state, "cache_dir": cache_dir, "profile": profile,
+        "screening_alpha": screening_alpha,
+        # Wall clock time, which unlike time.perf_counter is shared by worker processes.
+        "deadline": None if time_budget is None else time.time() + time_budget
+    }
+    missing = {name: list(data.columns[data.isna().any()]) for name, data in sheets.items()}
+    n_total = sum(len(i) for i in missing.values())
 
-    missing_classifier = MissingClassifier(data)
-    return missing_classifier.test_all_columns()
+    results, n_done = {}, 0
+    mined = parallel_imap_unordered(
+        _mine_sheet, settings, list(sheets.items()), n_jobs=n_jobs, executor=executor
+    )
+    try:
+        for (name, _), sheet_results in mined:
+            results[name] = sheet_results
+            for result in sheet_results:
+                n_done += 1
+                if progress is not None:
+                    progress(n_done, n_total, result)
+            if cancel is not None and cancel():
+                break
+    finally:
+        mined.close()
+    return {
+        name: results.get(name, MissingResults(unmined=missing[name])) for name in sheets
+    }
 
 
-def mine_missing(data: pd.DataFrame) -> MissingResults:
+def _mine_sheet(settings: dict, sheet) -> MissingResults:
+    """
+    Picklable wrapper of mine_missing for worker processes, mining a (name, data) pair
+    within the time left before settings["deadline"].
+    """
+    settings = dict(settings)
+    deadline = settings.pop("deadline")
+    if deadline is not None:
+        settings["time_budget"] = max(deadline - time.time(), 0)
+    return mine_missing(sheet[1], **settings)
+
+
+def mine_missing(data: pd.DataFrame, n_jobs=1, executor=None, random_state=None,
+                 cache_dir=None, profile=False, writer=None, progress=None,
+                 cancel=None, time_budget=None, screening_alpha=None,
+                 columns=None) -> MissingResults:
     """
     Mine a data set for patterns of missingness
     Parameters
     ----------
     data: pandas.DataFrame
         The data set to be investigated
+    n_jobs: int [optional]
+        Number of worker processes to mine columns with.  -1 uses all CPUs.
+    executor: concurrent.futures.Executor [optional]
+        Executor to map the columns over, in place of n_jobs.
+    random_state: int [optional]
+        Seed for reproducible results.
+    cache_dir: str [optional]
+        Directory of cached results, reused for columns whose data has not changed.
+    profile: bool [optional]
+        Record the time and memory of each stage, see MissingResults.profile_summary.
+    writer: report_writers.ReportWriter [optional]
+        Writer to report each result to as soon as it is ready.
+    progress: callable [optional]
+        Called as progress(n_done, n_total, result) after each column is mined.
+    cancel: callable [optional]
+        Called after each column; mining stops once it returns True.
+    time_budget: float [optional]
+        Seconds to mine within, degrading to cheaper models as time runs out and
+        listing the columns left unmined, see MissingClassifier.iter_columns.
+    screening_alpha: float [optional]
+        Skip fitting columns with no association stronger than this adjusted p-value,
+        see MissingClassifier.
+    columns: list [optional]
+        Columns to mine, by default every column with missing values.  Columns with
+        no missing values in data are reported as unmined.
 
     Returns
     -------
     MissingResults
     """
-    missing_classifier = MissingClassifier(data)
-    return missing_classifier.test_all_columns()
+    missing_classifier = MissingClassifier(
+        data, random_state=random_state, profile=profile, screening_alpha=screening_alpha
+    )
+    return missing_classifier.test_all_columns(
+        n_jobs=n_jobs, executor=executor, cache=cache_dir, writer=writer,
+        progress=progress, cancel=cancel, time_budget=time_budget, columns=columns
+    )
+
+
+def mine_missing_from_sql(table_or_query: str, config_file_path="config.yaml", chunksize=10000,
+                          sample_size=100000, n_jobs=1, executor=None,
+                          random_state=None, cache_dir=None, profile=False, writer=None,
+                          progress=None, cancel=None, time_budget=None,
+                          screening_alpha=None) -> MissingResults:
+    """
+    Mine a database table or query for patterns of missingness.
+    Rows are streamed from the database chunksize at a time and a uniform sample of
+    at most sample_size rows is mined, so memory stays bounded by the chunk and sample
+    sizes.  Columns with missing values only outside the sample are reported as
+    unmined.
+    Parameters
+    ----------
+    table_or_query: str
+        Table name or SQL query.
+    config_file_path: str [optional]
+        yaml file holding 'sql_string' and optional 'pool_size' and 'max_overflow'.
+    chunksize: int [optional]
+        Number of rows streamed at a time.
+    sample_size: int [optional]
+        Maximum number of rows mined.
+    n_jobs: int [optional]
+        Number of worker processes to mine columns with.  -1 uses all CPUs.
+    executor: concurrent.futures.Executor [optional]
+        Executor to map the columns over, in place of n_jobs.
+    random_state: int [optional]
+        Seed for reproducible results.
+    cache_dir: str [optional]
+        Directory of cached results, reused for columns whose data has not changed.
+    profile: bool [optional]
+        Record the time and memory of each stage, see MissingResults.profile_summary.
+    writer: report_writers.ReportWriter [optional]
+        Writer to report each result to as soon as it is ready.
+    progress: callable [optional]
+        Called as progress(n_done, n_total, result) after each column is mined.
+    cancel: callable [optional]
+        Called after each column; mining stops once it returns True.
+    time_budget: float [optional]
+        Seconds to mine the sample within, see mine_missing.
+    screening_alpha: float [optional]
+        Skip fitting columns with no association stronger than this adjusted p-value,
+        see MissingClassifier.
+
+    Returns
+    -------
+    MissingResults
+    """
+    from .sql_engine import NuRS_SQL  # pylint: disable=import-outside-toplevel
+
+    nurs_sql = NuRS_SQL.from_config(config_file_path)
+    summary = summarize_chunks(
+        nurs_sql.read_chunks(table_or_query, chunksize=chunksize),
+        sample_size=sample_size, random_state=random_state
+    )
+    return mine_missing(
+        summary.sample, n_jobs=n_jobs, executor=executor, random_state=random_state,
+        cache_dir=cache_dir, profile=profile, writer=writer, progress=progress,
+        cancel=cancel, time_budget=time_budget, screening_alpha=screening_alpha,
+        columns=list(summary.missing_columns)
+    )
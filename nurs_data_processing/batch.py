@@ -0,0 +1,244 @@
+"""
+Tools for mining many data files in one run, such as every file of a data delivery.
+"""
+import glob
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .missing_results import MissingResults, combined_markdown
+from .readers import CSV_TYPES, EXCEL_TYPES, ARROW_TYPES, file_signature
+from .time_budget import FULL
+from .worker_pool import parallel_imap_unordered
+
+DATA_TYPES = CSV_TYPES + EXCEL_TYPES + ARROW_TYPES
+
+
+def expand_paths(paths) -> list:
+    """
+    Expand a list of files, directories and glob patterns into the data files they
+    name.  Directories contribute the data files (by extension) directly within them.
+    Parameters
+    ----------
+    paths: list of str
+    Returns
+    -------
+    list
+        Sorted, de-duplicated file paths.
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            files.update(
+                os.path.join(path, i) for i in os.listdir(path)
+                if i.lower().endswith(DATA_TYPES)
+            )
+        elif any(i in path for i in "*?["):
+            files.update(i for i in glob.glob(path, recursive=True) if os.path.isfile(i))
+        else:
+            files.add(path)
+    return sorted(files)
+
+
+def unmatched_paths(paths) -> list:
+    """
+    The files, directories and glob patterns of paths that name no data file.
+    Parameters
+    ----------
+    paths: list of str
+    Returns
+    -------
+    list
+    """
+    return [i for i in paths if not any(os.path.isfile(j) for j in expand_paths([i]))]
+
+
+def settings_hash(settings: dict) -> str:
+    """
+    Hash of the mining settings of a batch run, so that reports mined with other
+    settings are not reused.
+    """
+    description = json.dumps(settings, sort_keys=True, default=repr)
+    return hashlib.sha1(description.encode()).hexdigest()
+
+
+def report_name(file_path: str) -> str:
+    """
+    Name of the report on file_path, unique to the file's absolute path.
+    """
+    digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:8]
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return f"{stem}-{digest}.md"
+
+
+class BatchManifest:
+    """
+    Record of the progress of a batch run, stored as JSON so that an interrupted run
+    can resume.  Each file is recorded once finished, with the signature (modification
+    time and size) of the version mined and a hash of the mining settings, so that
+    files changed since, or mined with other settings, are mined again.  Files whose
+    report is partial (with columns degraded or left unmined by a time budget) are
+    mined again too.  The manifest is rewritten after every file.
+
+    Parameters
+    ----------
+    path: str
+        Location of the manifest file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                self.entries = json.load(file)
+
+    def is_done(self, file_path: str, sheet_name=0, settings=None) -> bool:
+        """
+        True if the current version of file_path was mined completely, with the same
+        settings_hash as settings if given.
+        """
+        entry = self.entries.get(os.path.abspath(file_path))
+        return (
+            entry is not None and entry["Status"] == "done" and os.path.isfile(file_path)
+            and entry["Signature"] == file_signature(file_path, sheet_name)
+            and (settings is None or entry.get("Settings") == settings_hash(settings))
+        )
+
+    def record(self, file_path: str, entry: dict) -> None:
+        """
+        Store the outcome of mining file_path and save the manifest.
+        """
+        self.entries[os.path.abspath(file_path)] = entry
+        temporary = self.path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(self.entries, file, indent=2)
+        os.replace(temporary, self.path)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The manifest as a table, one row per file.
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return pd.DataFrame([
+            {"File": entry["File"], "Status": entry["Status"],
+             "Report": entry.get("Report", ""), "Columns": entry.get("Columns", ""),
+             "Error": entry.get("Error", "")}
+            for entry in self.entries.values()
+        ], columns=["File", "Status", "Report", "Columns", "Error"])
+
+
+def _mine_to_report(settings: dict, file_path: str) -> dict:
+    """
+    Mine a single file and write its markdown report, returning the manifest entry.
+    When profiling, the report ends with a summary of the stages of mining.
+    Failures are recorded rather than raised, so one bad file doesn't end the run.
+    """
+    from .api import mine_missing_from_file  # pylint: disable=import-outside-toplevel
+
+    settings = dict(settings)
+    output_dir = settings.pop("output_dir")
+    entry = {"File": file_path, "Settings": settings_hash(settings)}
+    try:
+        entry["Signature"] = file_signature(file_path, settings["sheet_name"])
+        results = mine_missing_from_file(file_path, **settings)
+    except Exception as error:  # pylint: disable=broad-except
+        entry.update(Status="failed", Error=f"{type(error).__name__}: {error}")
+        return entry
+
+    if isinstance(results, dict):
+        markdown = combined_markdown(results)
+        entry["Columns"] = sum(len(i) for i in results.values())
+        results = MissingResults(
+            [j for i in results.values() for j in i],
+            shared_profile=[j for i in results.values() for j in i.shared_profile],
+            unmined=[j for i in results.values() for j in i.unmined]
+        )
+    else:
+        markdown = results.to_markdown()
+        entry["Columns"] = len(results)
+    if settings.get("profile"):
+        summary = results.profile_summary().to_markdown(floatfmt=".4g")
+        markdown += f"# Profile \n{summary}\n"
+    report = os.path.join(output_dir, report_name(file_path))
+    with open(report, "w") as file:
+        file.write(markdown)
+    entry.update(Status="partial" if _is_partial(results) else "done",
+                 Report=os.path.basename(report))
+    return entry
+
+
+def _is_partial(results: MissingResults) -> bool:
+    """
+    True if some columns were left unmined or mined with a degraded strategy.
+    """
+    return bool(results.unmined) or any(
+        i.Strategy not in (None, FULL.Name, "screened") for i in results
+    )
+
+
+def mine_batch(paths, output_dir, n_jobs=1, manifest_path=None, executor=None,
+               **mining_kwargs) -> BatchManifest:
+    """
+    Mine every data file named by paths, writing one markdown report per file to
+    output_dir along with an index.md linking to them.
+    Files are mined concurrently by n_jobs worker processes (each mining its columns
+    sequentially).  Progress is kept in a manifest, and files already mined completely
+    by an earlier run with the same settings, that have not changed since, are skipped.
+    Parameters
+    ----------
+    paths: list of str
+        Files, directories and glob patterns, see expand_paths.
+    output_dir: str
+        Directory to write reports, index and (by default) the manifest to.
+    n_jobs: int [optional]
+        Number of worker processes.  -1 uses all CPUs.
+    manifest_path: str [optional]
+        Location of the progress manifest.  Defaults to output_dir/manifest.json.
+    executor: concurrent.futures.Executor [optional]
+        A user supplied executor.  Takes precedence over n_jobs.
+    mining_kwargs:
+        Passed to mine_missing_from_file, e.g. sheet_name or random_state.
+    Returns
+    -------
+    BatchManifest
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if manifest_path is None:
+        manifest_path = os.path.join(output_dir, "manifest.json")
+    manifest = BatchManifest(manifest_path)
+
+    mining_kwargs.setdefault("sheet_name", 0)
+    settings = dict(mining_kwargs, output_dir=output_dir)
+    to_mine = [
+        i for i in expand_paths(paths)
+        if not manifest.is_done(i, mining_kwargs["sheet_name"], mining_kwargs)
+    ]
+    for file_path, entry in parallel_imap_unordered(
+            _mine_to_report, settings, to_mine, n_jobs=n_jobs, executor=executor):
+        manifest.record(file_path, entry)
+
+    write_index(manifest, os.path.join(output_dir, "index.md"))
+    return manifest
+
+
+def write_index(manifest: BatchManifest, index_path: str) -> None:
+    """
+    Write a markdown table of every file in the manifest, linking to its report.
+    Parameters
+    ----------
+    manifest: BatchManifest
+    index_path: str
+    """
+    table = manifest.to_frame()
+    if len(table):
+        table = table.sort_values("File")
+        table["Report"] = [f"[{i}]({i})" if i else "" for i in table["Report"]]
+    with open(index_path, "w") as file:
+        file.write("# Missingness reports \n")
+        file.write(table.to_markdown(index=False))
+        file.write("\n")
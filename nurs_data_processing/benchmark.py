@@ -0,0 +1,217 @@
+"""
+Benchmarks of each stage of missing mining on synthetic data, written as JSON so that
+runs can be compared across commits.
+
+Run with `python -m nurs_data_processing.benchmark --help` for options.
+"""
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from . import __version__
+from .synthetic import synthetic_data, MECHANISMS
+
+STAGES = ("encoding", "imputation", "prepare_data", "fit", "to_markdown", "missing_chart")
+
+
+def time_call(function, repeat=1):
+    """
+    Time function() in seconds, keeping the fastest of repeat calls.
+    Parameters
+    ----------
+    function: callable
+        Function of no arguments.
+    repeat: int [optional]
+        Number of calls.
+    Returns
+    -------
+    (float, object)
+        The fastest time and the result of the last call.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_stages(data, repeat=1, random_state=0) -> dict:
+    """
+    Time each stage of mining data for patterns of missingness.
+    Parameters
+    ----------
+    data: pd.DataFrame
+        The data set to mine.
+    repeat: int [optional]
+        Number of times to run each stage, keeping the fastest.
+    random_state: int [optional]
+        Seed for the classifier.
+    Returns
+    -------
+    dict
+        Seconds taken by each stage in STAGES.
+    """
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pyplot as plt
+    from sklearn.impute import SimpleImputer
+    from .encoded_label_data import EncodedLabelData
+    from .missing_chart import missing_chart
+    from .missing_classifier import MissingClassifier
+
+    classifier = MissingClassifier(data, random_state=random_state)
+    timings = {}
+    timings["encoding"], _ = time_call(
+        lambda: EncodedLabelData(classifier.categorical_data), repeat
+    )
+    timings["imputation"], _ = time_call(
+        lambda: SimpleImputer().fit_transform(classifier.numeric_data), repeat
+    )
+
+    def prepare_all():
+        classifier._feature_store = None  # pylint: disable=protected-access
+        for col in classifier.missing_columns:
+            classifier.prepare_data(col)
+
+    timings["prepare_data"], _ = time_call(prepare_all, repeat)
+    timings["fit"], results = time_call(classifier.test_all_columns, repeat)
+    timings["to_markdown"], _ = time_call(results.to_markdown, repeat)
+
+    missing_col = classifier.missing_columns[0]
+    feature_col = next(
+        (i for i in classifier.numeric_data.columns if i != missing_col),
+        next(i for i in data.columns if i != missing_col)
+    )
+
+    def chart():
+        missing_chart(data, missing_col, feature_col)
+        plt.close("all")
+
+    timings["missing_chart"], _ = time_call(chart, repeat)
+    return timings
+
+
+def run_benchmarks(rows=(1000,), mechanisms=("MAR",), n_numeric=2, n_categorical=2,
+                   cardinality=6, missing_rate=0.1, repeat=1, random_state=0) -> dict:
+    """
+    Benchmark every combination of row count and missingness mechanism.
+    Parameters
+    ----------
+    rows: iterable of int [optional]
+        Numbers of rows to generate.
+    mechanisms: iterable of str [optional]
+        Missingness mechanisms, see synthetic.synthetic_data.
+    n_numeric, n_categorical, cardinality, missing_rate: [optional]
+        Shape of the synthetic data, see synthetic.synthetic_data.
+    repeat: int [optional]
+        Number of times to run each stage, keeping the fastest.
+    random_state: int [optional]
+        Seed for data generation and mining.
+    Returns
+    -------
+    dict
+        Description of the environment and a list of runs, each with its data
+        configuration and stage timings.
+    """
+    runs = []
+    for n_rows, mechanism in itertools.product(rows, mechanisms):
+        config = {
+            "n_rows": n_rows, "n_numeric": n_numeric, "n_categorical": n_categorical,
+            "cardinality": cardinality, "mechanism": mechanism, "missing_rate": missing_rate
+        }
+        data = synthetic_data(random_state=random_state, **config)
+        runs.append({
+            "config": config,
+            "seconds": benchmark_stages(data, repeat=repeat, random_state=random_state)
+        })
+    return {"environment": environment(), "repeat": repeat, "runs": runs}
+
+
+def environment() -> dict:
+    """
+    Package version, git commit (where available), python version and platform.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "version": __version__,
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    }
+
+
+def benchmark_parser(argv=None) -> argparse.Namespace:
+    """
+    Command line parser for the benchmark suite.
+    Returns
+    -------
+    argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Time each stage of missing mining on synthetic data"
+    )
+    parser.add_argument("--rows", nargs="+", type=int, default=[1000, 10000],
+                        help="Numbers of rows to generate")
+    parser.add_argument("--mechanisms", nargs="+", default=list(MECHANISMS),
+                        choices=MECHANISMS, help="Missingness mechanisms")
+    parser.add_argument("--numeric", type=int, default=4, dest="n_numeric",
+                        help="Number of numeric columns")
+    parser.add_argument("--categorical", type=int, default=4, dest="n_categorical",
+                        help="Number of categorical columns")
+    parser.add_argument("--cardinality", type=int, default=6,
+                        help="Number of classes of each categorical column")
+    parser.add_argument("--missing_rate", "--missing-rate", type=float, default=0.1,
+                        dest="missing_rate", help="Proportion of values removed")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs of each stage, the fastest is kept")
+    parser.add_argument("-r", "--random_state", type=int, default=0, dest="random_state",
+                        help="Seed for data generation and mining")
+    parser.add_argument("-o", "--output", default="benchmark_results.json",
+                        help="File to write JSON results to")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    End point for the benchmark suite.
+    Parameters
+    ----------
+    argv: list of command line arguments.
+
+    Returns
+    -------
+    0
+    """
+    import matplotlib  # pylint: disable=import-outside-toplevel
+    matplotlib.use("Agg")
+
+    args = benchmark_parser(argv)
+    results = run_benchmarks(
+        rows=args.rows, mechanisms=args.mechanisms, n_numeric=args.n_numeric,
+        n_categorical=args.n_categorical, cardinality=args.cardinality,
+        missing_rate=args.missing_rate, repeat=args.repeat, random_state=args.random_state
+    )
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+
+    for run in results["runs"]:
+        config = run["config"]
+        stages = ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in run["seconds"].items())
+        print(f"{config['n_rows']} rows, {config['mechanism']}: {stages}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,13 @@
 """
 CLI end point functions
+
+Mining modules are imported once the arguments are parsed, so that '--help' and
+argument errors don't wait on pandas and sklearn loading.
 """
 
-from ..api import mine_missing_from_file
+import os
+import sys
+
 from .missing_parser import missing_parser
 
 
@@ -15,16 +20,134 @@ def main(argv=None):
 
     Returns
     -------
-    0
+    0, 130 if interrupted, having reported the columns mined so far, or 2 if a path
+    names no file.
     """
     args = missing_parser(argv)
 
-    missing_results = mine_missing_from_file(args.FilePath, args.sheet_name)
-    if args.method.lower() == "markdown":
-        markdown = missing_results.to_markdown()
+    from ..batch import unmatched_paths  # pylint: disable=import-outside-toplevel
+
+    unmatched = unmatched_paths(args.FilePath)
+    if unmatched:
+        print(f"No such file: {', '.join(unmatched)}", file=sys.stderr)
+        return 2
+
+    sheet_name = None if args.all_sheets else args.sheet_name
+    single_file = len(args.FilePath) == 1 and os.path.isfile(args.FilePath[0])
+    if args.output_dir is not None or not single_file:
+        return batch(args, sheet_name)
+
+    # pylint: disable=import-outside-toplevel
+    from ..api import mine_missing_from_file
+    from ..missing_results import MissingResults, combined_markdown
+    from ..report_writers import open_writer, WRITERS
+
+    method = args.method.lower()
+    # A combined markdown report on every sheet is written once all are mined.
+    streamed = method in WRITERS and not (args.all_sheets and method == "markdown")
+    writer = open_writer(args.markdown_path, method) if streamed else None
+    finished = MissingResults()
+
+    def progress(n_done, n_total, result):
+        finished.append(result)
+        if not args.quiet:
+            print(f"[{n_done}/{n_total}] mined column {result.Variable}", file=sys.stderr)
+
+    interrupted = False
+    try:
+        missing_results = mine_missing_from_file(
+            args.FilePath[0], sheet_name,
+            n_jobs=args.n_jobs, random_state=args.random_state,
+            chunksize=args.chunksize, sample_size=args.sample_size,
+            cache_dir=args.cache_dir, columns=args.columns, sidecar_dir=args.sidecar_dir,
+            profile=args.profile, writer=writer, progress=progress,
+            time_budget=args.time_budget, screening_alpha=args.screening_alpha
+        )
+    except KeyboardInterrupt:
+        if args.all_sheets:
+            raise
+        print(f"Interrupted: reporting the {len(finished)} columns mined so far",
+              file=sys.stderr)
+        missing_results, interrupted = finished, True
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if method == "markdown" and args.all_sheets:
         with open(args.markdown_path, "w") as file:
-            file.write(markdown)
-    else:
+            file.write(combined_markdown(missing_results))
+    elif not streamed and args.all_sheets:
+        for name, result in missing_results.items():
+            print(f"Sheet: {name}\n{result}")
+    elif not streamed:
         print(missing_results)
 
+    unmined = [j for i in missing_results.values() for j in i.unmined] \
+        if args.all_sheets else missing_results.unmined
+    if unmined:
+        print(f"Unmined columns: {', '.join(map(str, unmined))}", file=sys.stderr)
+
+    if args.profile:
+        print_profile(missing_results)
+
+    return 130 if interrupted else 0
+
+
+def print_profile(missing_results, n_stages=5):
+    """
+    Print the stages of mining that took longest.
+    Parameters
+    ----------
+    missing_results: Union[MissingResults, dict]
+        Profiled results, or a dict of them keyed by sheet name.
+    n_stages: int [optional]
+        Number of stages to print.
+    """
+    from ..missing_results import MissingResults  # pylint: disable=import-outside-toplevel
+
+    if isinstance(missing_results, dict):
+        missing_results = MissingResults(
+            [j for i in missing_results.values() for j in i],
+            shared_profile=[j for i in missing_results.values() for j in i.shared_profile]
+        )
+    print("Hottest stages:")
+    print(missing_results.profile_summary().head(n_stages).to_markdown(floatfmt=".4g"))
+
+
+def batch(args, sheet_name):
+    """
+    Mine every file named on the command line, writing a report on each.
+    Parameters
+    ----------
+    args: argparse.Namespace
+        Parsed command line arguments.
+    sheet_name: Union[int, str, None]
+        Sheet to mine from excel workbooks, None for every sheet.
+
+    Returns
+    -------
+    0, or 2 if given options that only apply to a single file.
+    """
+    from ..batch import mine_batch  # pylint: disable=import-outside-toplevel
+
+    if args.method or args.markdown_path != ".md":
+        print("-m/--method and -e/--export_path are not used when mining many files: "
+              "a markdown report per file is written to the output directory",
+              file=sys.stderr)
+        return 2
+
+    output_dir = args.output_dir or "missing_reports"
+    manifest = mine_batch(
+        args.FilePath, output_dir, n_jobs=args.n_jobs, manifest_path=args.manifest,
+        sheet_name=sheet_name, random_state=args.random_state,
+        chunksize=args.chunksize, sample_size=args.sample_size,
+        cache_dir=args.cache_dir, columns=args.columns, sidecar_dir=args.sidecar_dir,
+        profile=args.profile, time_budget=args.time_budget, screening_alpha=args.screening_alpha
+    )
+    statuses = manifest.to_frame()["Status"].value_counts()
+    print(
+        f"Mined {statuses.get('done', 0)} files, {statuses.get('partial', 0)} partially, "
+        f"{statuses.get('failed', 0)} failed.  "
+        f"Reports indexed in {os.path.join(output_dir, 'index.md')}"
+    )
     return 0
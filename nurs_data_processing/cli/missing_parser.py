@@ -17,8 +17,9 @@ def missing_parser(argv=None) -> argparse.Namespace:
     )
 
     parser.add_argument(
-        'FilePath', metavar='path',
-        type=str, help='the path to the data set'
+        'FilePath', metavar='path', nargs="+",
+        type=str,
+        help='the path to the data set, or several files, directories and glob patterns'
     )
 
     parser.add_argument(
@@ -30,13 +31,21 @@ def missing_parser(argv=None) -> argparse.Namespace:
         help='Sheet name if calling excel data [optional]'
     )
 
+    parser.add_argument(
+        "-a", "--all_sheets", "--all-sheets",
+        action="store_true",
+        dest="all_sheets",
+        help='Mine every sheet of an excel workbook [optional]'
+    )
+
     parser.add_argument(
         "-m", '--method',
         default="",
         dest="method",
         required=False,
         type=str,
-        help='method for processing results'
+        help="method for processing results: 'markdown', 'jsonl' or 'parquet' to write "
+             "each column's result to the export path as soon as it is mined, otherwise printed"
     )
 
     parser.add_argument(
@@ -47,4 +56,120 @@ def missing_parser(argv=None) -> argparse.Namespace:
         help='File path to write results to'
     )
 
+    parser.add_argument(
+        "-j", "--n_jobs",
+        default=1,
+        dest="n_jobs",
+        required=False,
+        type=int,
+        help='Number of worker processes, -1 for all CPUs [optional]'
+    )
+
+    parser.add_argument(
+        "-r", "--random_state",
+        default=None,
+        dest="random_state",
+        required=False,
+        type=int,
+        help='Seed for reproducible results [optional]'
+    )
+
+    parser.add_argument(
+        "-c", "--chunksize",
+        default=None,
+        dest="chunksize",
+        required=False,
+        type=int,
+        help='Stream csv files this many rows at a time [optional]'
+    )
+
+    parser.add_argument(
+        "--sample_size",
+        default=100000,
+        dest="sample_size",
+        required=False,
+        type=int,
+        help='Maximum number of rows mined when streaming [optional]'
+    )
+
+    parser.add_argument(
+        "--cache_dir", "--cache-dir",
+        default=None,
+        dest="cache_dir",
+        required=False,
+        type=str,
+        help='Directory of cached results to reuse for unchanged data [optional]'
+    )
+
+    parser.add_argument(
+        "--columns",
+        default=None,
+        dest="columns",
+        required=False,
+        type=lambda x: x.split(","),
+        help='Comma separated list of the columns to read and mine [optional]'
+    )
+
+    parser.add_argument(
+        "--sidecar_dir", "--sidecar-dir",
+        default=None,
+        dest="sidecar_dir",
+        required=False,
+        type=str,
+        help='Directory to keep fast loading copies of csv and excel sheets in [optional]'
+    )
+
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        dest="quiet",
+        help='Do not report progress as each column is mined [optional]'
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        dest="profile",
+        help='Time each stage of mining and print the hottest stages [optional]'
+    )
+
+    parser.add_argument(
+        "--time_budget", "--time-budget",
+        default=None,
+        dest="time_budget",
+        required=False,
+        type=float,
+        help='Seconds to mine within, fitting cheaper models as time runs out and '
+             'listing the columns left unmined [optional]'
+    )
+
+    parser.add_argument(
+        "--screening_alpha", "--screening-alpha",
+        default=None,
+        dest="screening_alpha",
+        required=False,
+        type=float,
+        help='Skip fitting columns with no association to any variable at this '
+             'significance level, reporting screening p-values [optional]'
+    )
+
+    parser.add_argument(
+        "-o", "--output_dir", "--output-dir",
+        default=None,
+        dest="output_dir",
+        required=False,
+        type=str,
+        help='Directory to write one report per file and an index to, '
+             'mining many files at once [optional]'
+    )
+
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        dest="manifest",
+        required=False,
+        type=str,
+        help='Progress file of a batch run, used to resume it [optional]'
+    )
+
     return parser.parse_args(argv)
@@ -1,9 +1,54 @@
 """
-Tools for caching results of One Hot Vector encoding on categorical data.
+Tools for caching results of One Hot Vector (or integer code) encoding on categorical data.
 """
+from collections import OrderedDict, namedtuple
 import pandas as pd
+from scipy import sparse
 from sklearn.preprocessing import LabelBinarizer
 
+CacheInfo = namedtuple("CacheInfo", ("Hits", "Misses", "Evictions", "Resident", "Bytes"))
+
+
+class SparseFrame:
+    """
+    A one hot vector encoding held as a scipy.sparse CSR matrix, with the feature
+    names of its columns.
+
+    Parameters
+    ----------
+    values: scipy.sparse.csr_matrix
+        The encoded values.
+    columns: list
+        Feature name of each column of values.
+    """
+
+    def __init__(self, values, columns):
+        self.values = values
+        self.columns = pd.Index(columns, tupleize_cols=False)
+
+    @property
+    def shape(self):
+        """
+        Shape of the encoding, (cases, features).
+        """
+        return self.values.shape
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a pandas DataFrame of sparse columns.
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return pd.DataFrame.sparse.from_spmatrix(self.values, columns=self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the sparse matrix in bytes.
+        """
+        return self.values.data.nbytes + self.values.indices.nbytes + self.values.indptr.nbytes
+
 
 class EncodedLabelData:
     """
@@ -11,42 +56,98 @@ class EncodedLabelData:
     [see https://en.wikipedia.org/wiki/One-hot if unsure what a one-hot
     representation is]
 
+    Columns are encoded densely as pandas DataFrames, or sparsely as SparseFrames.
+    With sparse="auto" a column is encoded sparsely when the density of its one hot
+    encoding (1 / number of classes) falls below density_threshold.
+
+    With lazy=True columns are only encoded when first indexed.  If a memory_budget is
+    set, encodings are evicted once the cached total exceeds it, largest first (the
+    least recently used breaking ties), and re-encoded if indexed again.  Hits, misses
+    and evictions are reported by cache_info().
+
     Parameters
     ----------
     data: pd.DataFrame
         A data set where each column is made up of categorical variables
+    sparse: Union[bool, str] [optional]
+        True, False (the default) or "auto".
+    density_threshold: float [optional]
+        Density below which "auto" switches to a sparse encoding.
+    lazy: bool [optional]
+        Encode columns on first access rather than on construction.
+    memory_budget: int [optional]
+        Maximum number of bytes of encodings to keep cached.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    # pylint: ignore=too-many-instance-attributes
+    def __init__(self, data: pd.DataFrame, sparse=False, density_threshold=0.05,
+                 lazy=False, memory_budget=None):
         self.data = data
-        self.frames = {}
-        self._initialize_values()
+        self.sparse = sparse
+        self.density_threshold = density_threshold
+        self.memory_budget = memory_budget
+        self.frames = OrderedDict()
+        self.sizes = {}
+        self.vocabularies = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if not lazy:
+            self._initialize_values()
         self.columns = self.data.columns
 
     @staticmethod
-    def label_binarize_column(column: pd.Series):
+    def label_binarize_column(column: pd.Series, sparse_output=False):
         """
         Convert a single column of data to a one hot vector encoding.
         Parameters
         ----------
         column: pd.Series
             A column of data, consisting of categorical values.
+        sparse_output: bool [optional]
+            Return a SparseFrame rather than a dense DataFrame.
         Returns
         -------
-        pd.DataFrame
+        Union[pd.DataFrame, SparseFrame]
         """
         name = column.name
-        enc = LabelBinarizer()
+        enc = LabelBinarizer(sparse_output=sparse_output)
         binarized = enc.fit_transform(column.fillna("NaN"))
         if len(enc.classes_) == 2:
             classes = [enc.classes_[1]]
         else:
             classes = enc.classes_
+        columns = [(name, i) for i in classes]
+        if sparse_output:
+            return SparseFrame(binarized.tocsr(), columns)
         return pd.DataFrame(
             binarized,
-            columns=[(name, i) for i in classes]
+            columns=columns
         )
 
+    def use_sparse(self, column: pd.Series) -> bool:
+        """
+        Decide whether column should be given a sparse encoding.
+        Parameters
+        ----------
+        column: pd.Series
+            A column of data, consisting of categorical values.
+        Returns
+        -------
+        bool
+        """
+        if self.sparse != "auto":
+            return bool(self.sparse)
+        n_classes = column.nunique(dropna=False)
+        return n_classes > 2 and 1 / n_classes < self.density_threshold
+
+    @property
+    def is_sparse(self) -> bool:
+        """
+        True if any column has been encoded sparsely.
+        """
+        return any(isinstance(i, SparseFrame) for i in self.frames.values())
+
     def _initialize_values(self):
         """
         Iterates through all self.data columns creating the one-hot-vector
@@ -56,7 +157,198 @@ class EncodedLabelData:
         None
         """
         for col in self.data.columns:
-            self.frames[col] = self.label_binarize_column(self.data[col])
+            self._load(col)
+
+    @staticmethod
+    def encoding_size(frame) -> int:
+        """
+        Memory held by an encoding in bytes.
+        Parameters
+        ----------
+        frame: Union[pd.DataFrame, SparseFrame]
+        Returns
+        -------
+        int
+        """
+        if isinstance(frame, SparseFrame):
+            return frame.nbytes
+        return int(frame.memory_usage(index=False).sum())
+
+    def _load(self, item):
+        """
+        Encode column 'item' and add it to the cache, evicting other encodings if
+        the memory budget is exceeded.
+        Returns
+        -------
+        Union[pd.DataFrame, SparseFrame]
+        """
+        column = self.data[item]
+        frame = self.label_binarize_column(column, sparse_output=self.use_sparse(column))
+        self.vocabularies[item] = set(column.fillna("NaN").unique())
+        self._cache(item, frame)
+        return frame
+
+    def _cache(self, item, frame):
+        """
+        Add an encoding to the cache, evicting others if the memory budget is exceeded.
+        """
+        self.frames[item] = frame
+        self.frames.move_to_end(item)
+        self.sizes[item] = self.encoding_size(frame)
+        self._evict(keep=item)
+
+    def append(self, new_data: pd.DataFrame):
+        """
+        Add rows to the data set.
+        Cached encodings of columns without new classes are extended by encoding only
+        the new rows; columns with new classes are re-encoded when next needed (or
+        now, if not lazy).
+        Parameters
+        ----------
+        new_data: pd.DataFrame
+            Rows with the same columns as self.data.
+        Returns
+        -------
+        None
+        """
+        new_data = new_data[self.data.columns]
+        self.data = pd.concat([self.data, new_data], ignore_index=True)
+        for col in list(self.frames):
+            new_values = new_data[col].fillna("NaN")
+            if set(new_values.unique()) <= self.vocabularies[col]:
+                self._cache(col, self._extend(self.frames[col], new_values, self.vocabularies[col]))
+            else:
+                del self.frames[col]
+                del self.sizes[col]
+                self._load(col)
+
+    @staticmethod
+    def _extend(frame, new_values: pd.Series, vocabulary):
+        """
+        Append the encoding of new_values, all of which are in vocabulary, to frame.
+        """
+        enc = LabelBinarizer(sparse_output=isinstance(frame, SparseFrame))
+        enc.fit(sorted(vocabulary))
+        binarized = enc.transform(new_values)
+        if isinstance(frame, SparseFrame):
+            return SparseFrame(sparse.vstack([frame.values, binarized], format="csr"), frame.columns)
+        return pd.concat(
+            [frame, pd.DataFrame(binarized, columns=frame.columns)], ignore_index=True
+        )
+
+    def _evict(self, keep):
+        """
+        Drop the largest cached encodings, other than 'keep', until within budget.
+        Returns
+        -------
+        None
+        """
+        if self.memory_budget is None:
+            return
+        while sum(self.sizes.values()) > self.memory_budget and len(self.frames) > 1:
+            victim = max(
+                (i for i in self.frames if i != keep),
+                key=lambda i: self.sizes[i]
+            )
+            del self.frames[victim]
+            del self.sizes[victim]
+            self.evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report on the use of the encoding cache.
+        Returns
+        -------
+        CacheInfo
+            Hits, misses, evictions, number of resident encodings and their total bytes.
+        """
+        return CacheInfo(
+            self.hits, self.misses, self.evictions,
+            len(self.frames), sum(self.sizes.values())
+        )
+
+    def __getitem__(self, item):
+        if item in self.frames:
+            self.hits += 1
+            self.frames.move_to_end(item)
+            return self.frames[item]
+        self.misses += 1
+        return self._load(item)
+
+
+class CodedLabelData:
+    """
+    Integer code encodings of the supplied data set.  Each categorical column becomes a
+    single column of pandas Categorical codes, which tree models can split on directly
+    without a one hot vector per class.
+    Missing values are given their own "NaN" category.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        A data set where each column is made up of categorical variables
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.frames = {}
+        self.categories = {}
+        self._initialize_values()
+        self.columns = self.data.columns
+
+    @staticmethod
+    def code_column(column: pd.Series):
+        """
+        Convert a single column of data to integer codes.
+        Parameters
+        ----------
+        column: pd.Series
+            A column of data, consisting of categorical values.
+        Returns
+        -------
+        (pd.DataFrame, pd.Index)
+            The codes, in a column named after the variable, and the category of each code.
+        """
+        categorical = pd.Categorical(column.fillna("NaN"))
+        frame = pd.DataFrame({column.name: categorical.codes})
+        return frame, categorical.categories
+
+    def _initialize_values(self):
+        """
+        Iterates through all self.data columns creating the integer code
+        representation.
+        Returns
+        -------
+        None
+        """
+        for col in self.data.columns:
+            self.frames[col], self.categories[col] = self.code_column(self.data[col])
+
+    def append(self, new_data: pd.DataFrame):
+        """
+        Add rows to the data set, coding only the new rows.
+        New categories are given codes after the existing ones, so existing codes
+        are unchanged.
+        Parameters
+        ----------
+        new_data: pd.DataFrame
+            Rows with the same columns as self.data.
+        Returns
+        -------
+        None
+        """
+        new_data = new_data[self.data.columns]
+        self.data = pd.concat([self.data, new_data], ignore_index=True)
+        for col in self.data.columns:
+            new_values = new_data[col].fillna("NaN")
+            categories = self.categories[col]
+            unseen = pd.Index(new_values.unique()).difference(categories)
+            categories = categories.append(unseen)
+            codes = pd.Categorical(new_values, categories=categories).codes
+            self.frames[col] = pd.concat(
+                [self.frames[col], pd.DataFrame({col: codes})], ignore_index=True
+            )
+            self.categories[col] = categories
 
     def __getitem__(self, item):
         return self.frames[item]
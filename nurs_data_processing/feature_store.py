@@ -0,0 +1,129 @@
+"""
+Tools for building the independent variables of every mined column from one shared matrix.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .encoded_label_data import EncodedLabelData, SparseFrame
+
+
+class FeatureStore:
+    """
+    A single design matrix holding the imputed numeric data followed by the one hot
+    encoded categorical data, with an index from each original variable to the slice of
+    matrix columns it occupies.
+    The independent variables for any missing column are then a column mask of the
+    shared matrix rather than a fresh imputation and concatenation.
+
+    The numeric block is imputed once over all numeric columns, so the imputer should
+    treat columns independently (as sklearn's SimpleImputer does).
+
+    If any categorical variable has a sparse encoding the whole matrix is held as a
+    scipy.sparse CSC matrix, which tree models accept without densifying.
+
+    Parameters
+    ----------
+    numeric_data: pd.DataFrame
+        The numeric variables.
+    encoded_data: EncodedLabelData
+        The encoded categorical variables.
+    numeric_imputer
+        Method by which to impute numeric missing values
+    fill_values: pd.Series [optional]
+        Precomputed value to fill the missing values of each numeric column with, in
+        place of fitting numeric_imputer.
+    """
+
+    def __init__(self, numeric_data: pd.DataFrame, encoded_data: EncodedLabelData,
+                 numeric_imputer, fill_values=None):
+        blocks = []
+        self.slices = {}
+        width = 0
+
+        if numeric_data.shape[1]:
+            if fill_values is not None:
+                imputed = numeric_data.fillna(fill_values).reset_index(drop=True).astype(float)
+            else:
+                imputed = pd.DataFrame(
+                    numeric_imputer.fit_transform(numeric_data),
+                    columns=numeric_data.columns
+                )
+            blocks.append(imputed)
+            for col in numeric_data.columns:
+                self.slices[col] = slice(width, width + 1)
+                width += 1
+
+        for col in encoded_data.columns:
+            frame = encoded_data[col]
+            blocks.append(frame)
+            self.slices[col] = slice(width, width + frame.shape[1])
+            width += frame.shape[1]
+
+        self.sparse = any(isinstance(i, SparseFrame) for i in blocks)
+        if self.sparse:
+            self.matrix = sparse.hstack(
+                [i.values if isinstance(i, SparseFrame) else sparse.csr_matrix(i.values)
+                 for i in blocks],
+                format="csc"
+            )
+            self.columns = pd.Index(
+                [j for i in blocks for j in i.columns], tupleize_cols=False
+            )
+        else:
+            self.matrix = pd.concat(blocks, axis=1) if blocks else pd.DataFrame()
+            self.columns = self.matrix.columns
+
+    def feature_mask(self, excluded_column) -> np.ndarray:
+        """
+        Boolean mask over the matrix columns, False for those encoding excluded_column.
+        Parameters
+        ----------
+        excluded_column: str
+            The variable to leave out.
+        Returns
+        -------
+        numpy.ndarray
+        """
+        mask = np.ones(len(self.columns), dtype=bool)
+        if excluded_column in self.slices:
+            mask[self.slices[excluded_column]] = False
+        return mask
+
+    def design(self, excluded_column):
+        """
+        The design matrix of every variable other than excluded_column, and the
+        names of its columns.
+        The matrix is a pandas.DataFrame, or a scipy.sparse CSC matrix if self.sparse.
+        Parameters
+        ----------
+        excluded_column: str
+            The variable to leave out, typically the column being mined for.
+        Returns
+        -------
+        (Union[pandas.DataFrame, scipy.sparse.csc_matrix], pandas.Index)
+        """
+        if excluded_column not in self.slices:
+            return self.matrix, self.columns
+        mask = self.feature_mask(excluded_column)
+        if self.sparse:
+            return self.matrix[:, mask], self.columns[mask]
+        matrix = self.matrix.iloc[:, mask]
+        return matrix, matrix.columns
+
+    def features(self, excluded_column) -> pd.DataFrame:
+        """
+        The design matrix of every variable other than excluded_column as a
+        pandas.DataFrame.  Sparse matrices are returned with sparse columns.
+        Parameters
+        ----------
+        excluded_column: str
+            The variable to leave out, typically the column being mined for.
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        matrix, columns = self.design(excluded_column)
+        if self.sparse:
+            return pd.DataFrame.sparse.from_spmatrix(matrix, columns=columns)
+        return matrix
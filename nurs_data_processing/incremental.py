@@ -0,0 +1,108 @@
+"""
+Tools for re-mining a data set that grows by appended rows.
+"""
+import time
+from collections import namedtuple
+
+import pandas as pd
+
+from .missing_classifier import MissingClassifier
+from .missing_results import MissingResults
+
+IncrementalReport = namedtuple(
+    "IncrementalReport", ("Results", "Remined", "Skipped", "Runtime")
+)
+
+
+class IncrementalMiner:
+    """
+    Keeps the results of mining a data set up to date as rows are appended.
+    After each append only the columns whose proportion missing moved by more than
+    threshold (or which have become missing for the first time) are mined again; the
+    earlier results are kept for the rest.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Initial data set.
+    threshold: float [optional]
+        Change in the proportion missing that triggers re-mining a column.
+    n_jobs: int [optional]
+        Number of worker processes to mine columns with.
+    classifier_kwargs
+        Further arguments to MissingClassifier.
+    """
+
+    def __init__(self, data: pd.DataFrame, threshold=0.01, n_jobs=1, **classifier_kwargs):
+        self.classifier = MissingClassifier(data, **classifier_kwargs)
+        self.threshold = threshold
+        self.n_jobs = n_jobs
+        self.results = {}
+        self.mined_rates = pd.Series(dtype=float)
+
+    @property
+    def missing_rates(self) -> pd.Series:
+        """
+        Current proportion missing of every column.
+        """
+        return self.classifier.null_counts / len(self.classifier.missing)
+
+    def _mine(self, columns) -> IncrementalReport:
+        """
+        Mine columns, keeping the earlier results of every other missing column.
+        """
+        start = time.perf_counter()
+        rates = self.missing_rates
+        for result in self.classifier.test_all_columns(n_jobs=self.n_jobs, columns=columns):
+            self.results[result.Variable] = result
+            self.mined_rates[result.Variable] = rates[result.Variable]
+
+        missing_results = MissingResults()
+        for col in self.classifier.missing_columns:
+            missing_results.append(self.results[col])
+        skipped = [col for col in self.classifier.missing_columns if col not in set(columns)]
+        return IncrementalReport(
+            missing_results, list(columns), skipped, time.perf_counter() - start
+        )
+
+    def mine(self) -> IncrementalReport:
+        """
+        Mine every missing column.
+        Returns
+        -------
+        IncrementalReport
+        """
+        return self._mine(list(self.classifier.missing_columns))
+
+    def shifted_columns(self) -> list:
+        """
+        Missing columns not yet mined, or whose proportion missing has moved by more
+        than self.threshold since they were mined.
+        Returns
+        -------
+        list
+        """
+        rates = self.missing_rates
+        return [
+            col for col in self.classifier.missing_columns
+            if col not in self.results
+            or abs(rates[col] - self.mined_rates[col]) > self.threshold
+        ]
+
+    def append(self, new_data: pd.DataFrame) -> IncrementalReport:
+        """
+        Add rows to the data set and re-mine the columns whose missingness shifted.
+        Parameters
+        ----------
+        new_data: pd.DataFrame
+            Rows with the same columns as the original data.
+        Returns
+        -------
+        IncrementalReport
+            Results for every missing column, the columns re-mined and skipped, and the
+            runtime in seconds (including updating the data).
+        """
+        start = time.perf_counter()
+        self.classifier.append_rows(new_data)
+        report = self._mine(self.shifted_columns())
+        return report._replace(Runtime=time.perf_counter() - start)
@@ -1,8 +1,8 @@
 """
 Tools for visualizing how missingness of a variable varies across a second variable.
 """
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from scipy import stats
 
 
@@ -32,9 +32,6 @@ def metrics(data: pd.DataFrame, missing_col: str, feature_col: str, ci_width: fl
     missing_sum = data[missing_col].isna().sum()
     n_cases, _ = data.shape
 
-    a_star = 0.5 + missing_sum
-    b_star = 0.5 + n_cases - missing_sum
-
     if data.dtypes[feature_col] == "object":
         result = {
             'Feature': data[feature_col].fillna("NaN").mode().values[0]
@@ -43,16 +40,68 @@ def metrics(data: pd.DataFrame, missing_col: str, feature_col: str, ci_width: fl
         result = {
             'Feature': data[feature_col].mean()
         }
-    alpha = (1 - ci_width) / 2
-    result.update({
-        'Missing': stats.beta.ppf(0.5, a_star, b_star),
-        "Lower": stats.beta.ppf(0.5, a_star, b_star) - stats.beta.ppf(alpha, a_star, b_star),
-        "Upper": stats.beta.ppf(1 - alpha, a_star, b_star) - stats.beta.ppf(0.5, a_star, b_star)
-    })
+    result.update(jeffreys_interval(missing_sum, n_cases, ci_width))
 
     return result
 
 
+def jeffreys_interval(missing_sum, n_cases, ci_width: float = 0.95):
+    """
+    Bayesian median and CI of the proportion missing given 'missing_sum' missing out of
+    'n_cases', based on a Jeffrey's prior of a binomial distribution.
+    Returns a dictionary where "Missing" is the median and "Lower" and "Upper" the
+    distances from it to the bounds of the CI.
+    Accepts arrays of counts, giving arrays of results.
+    Parameters
+    ----------
+    missing_sum: Union[int, numpy.ndarray]
+        Number of missing cases.
+    n_cases: Union[int, numpy.ndarray]
+        Number of cases.
+    ci_width: float [0 < q < 1]
+        Width of the CI.
+
+    Returns
+    -------
+    dict
+    """
+    a_star = 0.5 + missing_sum
+    b_star = 0.5 + n_cases - missing_sum
+
+    alpha = (1 - ci_width) / 2
+    median = stats.beta.ppf(0.5, a_star, b_star)
+    return {
+        'Missing': median,
+        "Lower": median - stats.beta.ppf(alpha, a_star, b_star),
+        "Upper": stats.beta.ppf(1 - alpha, a_star, b_star) - median
+    }
+
+
+def summary_from_counts(feature, n_cases, missing_sum, ci_width: float = 0.95):
+    """
+    Build the per group summary plotted by missing_chart from group counts.
+    Parameters
+    ----------
+    feature: pd.Series
+        The feature summary ("Feature") of each group, indexed by group.
+    n_cases: array-like
+        Number of cases in each group.
+    missing_sum: array-like
+        Number of missing cases in each group.
+    ci_width: float [0 < q < 1]
+        Width of the CI.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    summary = pd.DataFrame({"Feature": feature})
+    summary = summary.assign(**jeffreys_interval(
+        np.asarray(missing_sum), np.asarray(n_cases), ci_width
+    ))
+    return summary
+
+
 def group_vector(data, column, n_bins=10):
     """
     Make a vector out of data[column] on which data can be grouped.
@@ -75,6 +124,115 @@ def group_vector(data, column, n_bins=10):
     return pd.qcut(data[column], q=n_bins)
 
 
+def missing_summary(data: pd.DataFrame, missing_col: str, feature_col: str, n_bins=10,
+                    ci_width: float = 0.95) -> pd.DataFrame:
+    """
+    Summarize the rate at which 'missing_col' is unfilled for every group of
+    group_vector(data, feature_col), giving the same values as applying metrics to each
+    group.
+    Missing counts and group sizes come from one groupby aggregation, and the beta
+    quantiles of all groups are evaluated together.
+    Parameters
+    ----------
+    data: pandas.DataFrame
+        The data set to summarize.
+    missing_col: str
+        The column to calculate missing CI from.
+    feature_col: str
+        The column to group by and summarize as the feature.
+    n_bins: int [optional]
+        Number of quantile bins for numeric features.
+    ci_width: float [0 < q < 1]
+        Width of the CI.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Columns "Feature", "Missing", "Lower" and "Upper", indexed by group.
+    """
+    group_by = group_vector(data, feature_col, n_bins)
+    counts = data[missing_col].isna().groupby(group_by, observed=True).agg(["size", "sum"])
+
+    if data.dtypes[feature_col] == "object":
+        # Each group holds a single value, which is therefore its mode.
+        feature = pd.Series(counts.index, index=counts.index)
+    else:
+        feature = data[feature_col].groupby(group_by, observed=True).mean()
+
+    return summary_from_counts(feature, counts["size"], counts["sum"], ci_width)
+
+
+def missing_summary_table(data: pd.DataFrame, missing_cols=None, feature_cols=None, n_bins=10,
+                          ci_width: float = 0.95) -> pd.DataFrame:
+    """
+    Summarize the missing rate of every missing column across every feature column, as
+    missing_summary would for each pair, in a single tidy table.
+    The grouping vector of each feature column is computed once, and the missing counts
+    of all missing columns come from one aggregation of their indicator matrix.
+    Pairs of a column with itself are left out.
+    Parameters
+    ----------
+    data: pandas.DataFrame
+        The data set to summarize.
+    missing_cols: list [optional]
+        Columns to calculate missing CIs for.  Defaults to those with any missing values.
+    feature_cols: list [optional]
+        Columns to group by.  Defaults to every column.
+    n_bins: int [optional]
+        Number of quantile bins for numeric features.
+    ci_width: float [0 < q < 1]
+        Width of the CI.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per (missing column, feature column, group) with columns "Missing Column",
+        "Feature Column", "Group", "Feature", "N", "Missing Count", "Missing", "Lower"
+        and "Upper".
+    """
+    indicators = data.isna() if missing_cols is None else data[list(missing_cols)].isna()
+    if missing_cols is None:
+        indicators = indicators.loc[:, indicators.any()]
+    if feature_cols is None:
+        feature_cols = data.columns
+    targets = np.asarray(indicators.columns, dtype=object)
+
+    tables = []
+    for feature_col in feature_cols:
+        group_by = group_vector(data, feature_col, n_bins)
+        grouped = indicators.groupby(group_by, observed=True)
+        missing_sums = grouped.sum()
+        sizes = grouped.size()
+
+        if data.dtypes[feature_col] == "object":
+            feature = np.asarray(missing_sums.index, dtype=object)
+        else:
+            feature = data[feature_col].groupby(group_by, observed=True).mean().values
+
+        n_targets = len(targets)
+        tables.append(pd.DataFrame({
+            "Missing Column": np.tile(targets, len(missing_sums)),
+            "Feature Column": feature_col,
+            "Group": np.repeat(np.asarray(missing_sums.index, dtype=object), n_targets),
+            "Feature": np.repeat(feature, n_targets),
+            "N": np.repeat(sizes.values, n_targets),
+            "Missing Count": missing_sums.values.ravel(),
+        }))
+
+    table = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame(
+        columns=["Missing Column", "Feature Column", "Group", "Feature", "N", "Missing Count"]
+    )
+    table = table[table["Missing Column"] != table["Feature Column"]]
+    order = {col: i for i, col in enumerate(targets)}
+    table = table.iloc[
+        np.argsort(table["Missing Column"].map(order).values, kind="stable")
+    ].reset_index(drop=True)
+
+    return table.assign(**jeffreys_interval(
+        table["Missing Count"].values.astype(float), table["N"].values.astype(float), ci_width
+    ))
+
+
 def missing_chart(data, missing_col, feature_col):
     """
     Produce a visual representation of how the missing proportion of data[missing_col]
@@ -87,10 +245,24 @@ def missing_chart(data, missing_col, feature_col):
     feature_col: str
 
     """
-    group_by = group_vector(data, feature_col)
-    summary = pd.DataFrame(
-        {i: metrics(df, missing_col, feature_col) for i, df in data.groupby(group_by)}
-    ).T
+    summary = missing_summary(data, missing_col, feature_col)
+    overall = jeffreys_interval(data[missing_col].isna().sum(), data.shape[0])["Missing"]
+
+    return plot_summary(summary, overall)
+
+
+def plot_summary(summary: pd.DataFrame, overall_missing: float):
+    """
+    Plot a per group summary of missingness, with a dashed line at the overall rate.
+    Parameters
+    ----------
+    summary: pandas.DataFrame
+        Frame with columns "Feature", "Missing", "Lower" and "Upper".
+    overall_missing: float
+        Proportion missing over all groups.
+
+    """
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
 
     plt.errorbar(
         summary["Feature"],
@@ -98,7 +270,7 @@ def missing_chart(data, missing_col, feature_col):
         yerr=summary[["Lower", "Upper"]].values.T
     )
     p = plt.hlines(
-        metrics(data, missing_col, feature_col)["Missing"],
+        overall_missing,
         xmin=min(summary["Feature"]),
         xmax=max(summary["Feature"]),
         linestyles="dashed"
@@ -107,6 +279,8 @@ def missing_chart(data, missing_col, feature_col):
 
 
 if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
     f = pd.read_csv("tests/test_data/missing_data.csv")
 
     p = missing_chart(f, "C", "A")
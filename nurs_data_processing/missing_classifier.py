@@ -1,6 +1,8 @@
 """
 Tools for mining the patterns of missingness in a data set.
 """
+import time
+
 import pandas as pd
 import numpy as np
 
@@ -9,9 +11,16 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import f1_score
 from sklearn.impute import SimpleImputer
 
-from .encoded_label_data import EncodedLabelData
-from .model_result import ClassifierResult
+from .encoded_label_data import EncodedLabelData, CodedLabelData, SparseFrame
+from .feature_store import FeatureStore
+from .sampling import sample_size, stratified_sample_indices, take_rows
+from .model_result import ClassifierResult, CompactResult, FeatureTable
+from .profiling import StageProfiler, NullProfiler
 from .missing_results import MissingResults
+from .result_cache import ResultCache, column_hashes
+from .screening import association_p_values, screening_scores
+from .time_budget import BudgetPlanner, Strategy, FULL
+from .worker_pool import parallel_imap_unordered
 
 
 class MissingClassifier:
@@ -23,25 +32,94 @@ class MissingClassifier:
         Data set for analysis of missing patterns
     numeric_imputer
         Method by which to impute numeric missing values
+    random_state: int [optional]
+        Seed from which a reproducible seed for each column is derived.
+    encoding: str [optional]
+        How categorical variables are presented to the model.  "one_hot" gives a
+        binary feature per class (EncodedLabelData), "codes" gives a single integer
+        feature per variable (CodedLabelData).
+    sparse: Union[bool, str] [optional]
+        One hot encoding mode passed to EncodedLabelData: True, False (dense, the
+        default) or "auto".
+    lazy: bool [optional]
+        Encode categorical columns when first needed rather than on construction.
+    memory_budget: int [optional]
+        Maximum bytes of one hot encodings EncodedLabelData keeps cached.
+    max_rows: int [optional]
+        Maximum number of rows each column is mined on.
+    sample_fraction: float [optional]
+        Fraction of the rows each column is mined on.  When either max_rows or
+        sample_fraction is set, rows are sampled stratified on whether the column is
+        missing, keeping rarely missing columns represented.  The F1-score is then
+        measured on the held out part of the sample.
+    missing: pd.DataFrame [optional]
+        Precomputed missingness mask of data, for example from Arrow validity bitmaps.
+    shared_features: bool [optional]
+        Build the independent variables of every column from one FeatureStore.
+        Defaults to True when numeric_imputer is a SimpleImputer, which imputes each
+        column independently, and no memory_budget is set (the FeatureStore holds
+        every encoding), and False otherwise.
+    profile: bool [optional]
+        Record the wall time, peak memory and row and feature counts of each stage of
+        mining each column, as the Profile of its result.  See
+        MissingResults.profile_summary.
+    screening_alpha: float [optional]
+        Screen every column for association with every variable before mining (see
+        screen), recording the Bonferroni adjusted p-value of its strongest
+        association as the Screening of its result.  Columns scoring above
+        screening_alpha are not fitted, see screened_result.  No screening if None.
     """
 
     # pylint: ignore=too-many-instance-attributes
 
-    def __init__(self, data: pd.DataFrame, numeric_imputer=SimpleImputer()):
+    def __init__(self, data: pd.DataFrame, numeric_imputer=SimpleImputer(),
+                 random_state=None, encoding="one_hot", sparse=False, lazy=False,
+                 memory_budget=None, max_rows=None, sample_fraction=None, missing=None,
+                 shared_features=None, profile=False, screening_alpha=None):
 
+        self.data = data
         self.categorical_data, self.numeric_data = \
             self.divide_by_data_type(data, "object")
 
         self.categorical_columns = set(self.categorical_data.columns)
         self.numeric_columns = set(self.numeric_data.columns)
 
-        self.encoded_categorical_data = EncodedLabelData(self.categorical_data)
+        if encoding == "one_hot":
+            self.encoded_categorical_data = EncodedLabelData(
+                self.categorical_data, sparse=sparse, lazy=lazy, memory_budget=memory_budget
+            )
+        elif encoding == "codes":
+            self.encoded_categorical_data = CodedLabelData(self.categorical_data)
+        else:
+            raise ValueError(f"Expecting encoding of 'one_hot' or 'codes', received '{encoding}'")
+        self.encoding = encoding
+        self.sparse = sparse
 
-        self.missing = data.isna()
-        missing_sum = self.missing.sum() > 0
+        self.missing = data.isna() if missing is None else missing
+        self.null_counts = self.missing.sum()
+        missing_sum = self.null_counts > 0
         self.missing_columns = missing_sum[missing_sum].index
 
+        # Running statistics for mean imputation of data appended by append_rows.
+        self.numeric_sums = self.numeric_data.sum()
+        self.numeric_counts = self.numeric_data.count()
+        self.rows_appended = False
+
         self.numeric_imputer = numeric_imputer
+        self.random_state = random_state
+        self.max_rows = max_rows
+        self.sample_fraction = sample_fraction
+        self.column_positions = {col: i for i, col in enumerate(data.columns)}
+
+        if shared_features is None:
+            shared_features = isinstance(numeric_imputer, SimpleImputer) \
+                and memory_budget is None
+        self.shared_features = shared_features
+        self._feature_store = None
+        self.profile = profile
+        # Profile of building the feature store, which is shared by every column.
+        self.store_profile = []
+        self.screening_alpha = screening_alpha
 
     @staticmethod
     def divide_by_data_type(data: pd.DataFrame, data_type: str):
@@ -64,20 +142,88 @@ class MissingClassifier:
         is_not_data_type = dtypes[dtypes != data_type].index
         return data[is_data_type], data[is_not_data_type]
 
-    def prepare_numeric_data(self, missing_column):
+    @property
+    def feature_store(self) -> FeatureStore:
+        """
+        The shared design matrix, built on first use.
+        Returns
+        -------
+        FeatureStore
+        """
+        if self._feature_store is None:
+            profiler = StageProfiler() if self.profile else NullProfiler()
+            with profiler.stage("feature_store", rows=len(self.data)) as counts:
+                self._feature_store = FeatureStore(
+                    self.numeric_data, self.encoded_categorical_data, self.numeric_imputer,
+                    fill_values=self.numeric_fill_values()
+                )
+                counts["Features"] = len(self._feature_store.columns)
+            self.store_profile = profiler.stages or []
+        return self._feature_store
+
+    def numeric_fill_values(self):
+        """
+        Means of the numeric columns kept up to date by append_rows, used in place of
+        refitting numeric_imputer once rows have been appended if it imputes means.
+        Returns
+        -------
+        Union[pandas.Series, None]
+        """
+        if self.rows_appended and isinstance(self.numeric_imputer, SimpleImputer) \
+                and self.numeric_imputer.strategy == "mean":
+            return self.numeric_sums / self.numeric_counts
+        return None
+
+    def append_rows(self, new_data: pd.DataFrame):
+        """
+        Add rows to the data set, updating the missingness mask, null counts,
+        categorical encodings and numeric imputation statistics from the new rows only.
+        Parameters
+        ----------
+        new_data: pd.DataFrame
+            Rows with the same columns as the original data.
+        Returns
+        -------
+        None
+        """
+        new_data = new_data[self.data.columns]
+        self.data = pd.concat([self.data, new_data], ignore_index=True)
+
+        new_numeric = new_data[self.numeric_data.columns]
+        self.numeric_data = pd.concat([self.numeric_data, new_numeric], ignore_index=True)
+        self.numeric_sums = self.numeric_sums + new_numeric.sum()
+        self.numeric_counts = self.numeric_counts + new_numeric.count()
+
+        self.encoded_categorical_data.append(new_data[self.categorical_data.columns])
+        self.categorical_data = self.encoded_categorical_data.data
+
+        new_missing = new_data.isna()
+        self.missing = pd.concat([self.missing, new_missing], ignore_index=True)
+        self.null_counts = self.null_counts + new_missing.sum()
+        missing_sum = self.null_counts > 0
+        self.missing_columns = missing_sum[missing_sum].index
+
+        self.rows_appended = True
+        self._feature_store = None
+
+    def prepare_numeric_data(self, missing_column, positions=None):
         """
         Prepare numeric independent variables for mining.
         Parameters
         ----------
         missing_column: str
             The column being mined for.
+        positions: numpy.ndarray [optional]
+            Only prepare these rows, imputing from them alone.
         Returns
         -------
         pandas.DataFrame
         """
-        numeric_columns = self.numeric_columns.difference([missing_column])
+        numeric_columns = [i for i in self.numeric_data.columns if i != missing_column]
         if numeric_columns:
             numeric_x = self.numeric_data[numeric_columns]
+            if positions is not None:
+                numeric_x = numeric_x.iloc[positions]
 
             imputed_values = self.numeric_imputer.fit_transform(numeric_x)
 
@@ -88,26 +234,37 @@ class MissingClassifier:
 
         return pd.DataFrame()
 
-    def prepare_categorical_data(self, missing_column):
+    def prepare_categorical_data(self, missing_column, positions=None):
         """
         Prepare categorical independent variables for mining.
         Parameters
         ----------
         missing_column: str
             The column being mined for.
+        positions: numpy.ndarray [optional]
+            Only prepare these rows.
         Returns
         -------
         pandas.DataFrame
         """
-        categorical_columns = self.categorical_columns.difference([missing_column])
+        categorical_columns = [i for i in self.categorical_data.columns if i != missing_column]
         if categorical_columns:
 
             categorical_x = [self.encoded_categorical_data[i] for i in categorical_columns]
+            if positions is not None:
+                categorical_x = [
+                    SparseFrame(i.values[positions], i.columns) if isinstance(i, SparseFrame)
+                    else i.iloc[positions].reset_index(drop=True)
+                    for i in categorical_x
+                ]
+            categorical_x = [
+                i.to_frame() if isinstance(i, SparseFrame) else i for i in categorical_x
+            ]
             return pd.concat(categorical_x, axis=1)
 
         return pd.DataFrame()
 
-    def prepare_data(self, missing_column):
+    def prepare_data(self, missing_column, profiler=None, positions=None):
         """
         Prepare dependent and independent variables for mining.
         Returns a 2-tuple of (independent, dependent).
@@ -115,49 +272,444 @@ class MissingClassifier:
         ----------
         missing_column: str
             The column being mined for.
+        profiler: StageProfiler [optional]
+            Records the imputation, encoding and concat stages.
+        positions: numpy.ndarray [optional]
+            Only prepare these rows, see sample_positions.
         Returns
         -------
         (pandas.DataFrame, pandas.Series)
         """
-        numeric_x = self.prepare_numeric_data(missing_column)
-        categorical_x = self.prepare_categorical_data(missing_column)
-
-        data_x = pd.concat([numeric_x, categorical_x], axis=1)
+        profiler = profiler or NullProfiler()
         data_y = self.missing[missing_column]
+        if positions is not None:
+            data_y = data_y.iloc[positions]
+        if self.shared_features:
+            with profiler.stage("design", rows=len(data_y)) as counts:
+                data_x = self.feature_store.features(missing_column)
+                if positions is not None:
+                    data_x = data_x.iloc[positions]
+                counts["Features"] = data_x.shape[1]
+        else:
+            with profiler.stage("imputation", rows=len(data_y)) as counts:
+                numeric_x = self.prepare_numeric_data(missing_column, positions)
+                counts["Features"] = numeric_x.shape[1]
+            with profiler.stage("encoding", rows=len(data_y)) as counts:
+                categorical_x = self.prepare_categorical_data(missing_column, positions)
+                counts["Features"] = categorical_x.shape[1]
+            with profiler.stage("concat", rows=len(data_y)) as counts:
+                data_x = pd.concat([numeric_x, categorical_x], axis=1)
+                counts["Features"] = data_x.shape[1]
 
         return data_x, data_y
 
-    def test_column(self, missing_column: str) -> ClassifierResult:
+    def prepare_design(self, missing_column, profiler=None, positions=None):
+        """
+        Prepare the independent variables in the form passed to the model.
+        Returns a 3-tuple of (independent, dependent, feature names), where the
+        independent variables stay a scipy.sparse matrix when the encoding is sparse.
+        Parameters
+        ----------
+        missing_column: str
+            The column being mined for.
+        profiler: StageProfiler [optional]
+            Records the stages of preparing the design.
+        positions: numpy.ndarray [optional]
+            Only prepare these rows, see sample_positions.
+        Returns
+        -------
+        (Union[pandas.DataFrame, scipy.sparse.csc_matrix], pandas.Series, pandas.Index)
+        """
+        profiler = profiler or NullProfiler()
+        if self.shared_features:
+            data_y = self.missing[missing_column]
+            with profiler.stage("design", rows=len(data_y)) as counts:
+                data_x, features = self.feature_store.design(missing_column)
+                if positions is not None:
+                    data_x, data_y = take_rows(data_x, positions), take_rows(data_y, positions)
+                counts["Features"] = len(features)
+        else:
+            data_x, data_y = self.prepare_data(missing_column, profiler, positions)
+            features = data_x.columns
+        return data_x, data_y, features
+
+    def column_seed(self, missing_column):
+        """
+        Seed used when mining missing_column.
+        Derived from self.random_state and the position of the column in the data so
+        that results do not depend on the order (or process) in which columns are mined.
+        Parameters
+        ----------
+        missing_column: str
+            The column being mined for.
+        Returns
+        -------
+        Union[int, None]
+        """
+        if self.random_state is None:
+            return None
+        sequence = np.random.SeedSequence(
+            self.random_state,
+            spawn_key=(self.column_positions[missing_column],)
+        )
+        return int(sequence.generate_state(1)[0])
+
+    def sample_positions(self, data_y, seed=None, max_rows=None):
+        """
+        Positions of at most self.max_rows / self.sample_fraction rows, stratified on
+        data_y, or None if no limit is set or every row fits within it.
+        Parameters
+        ----------
+        data_y: pandas.Series
+            Dependent variable.
+        seed: int [optional]
+            Seed for the sample.
+        max_rows: int [optional]
+            Further limit on the rows, on top of self.max_rows.
+        Returns
+        -------
+        Union[numpy.ndarray, None]
+        """
+        limits = [i for i in (self.max_rows, max_rows) if i is not None]
+        n_samples = sample_size(len(data_y), min(limits, default=None), self.sample_fraction)
+        if n_samples >= len(data_y):
+            return None
+        return stratified_sample_indices(data_y, n_samples, seed)
+
+    def sample_rows(self, data_x, data_y, seed=None, max_rows=None):
+        """
+        Reduce the rows to at most self.max_rows / self.sample_fraction, stratified on
+        data_y.  Returns the data unchanged if no limit is set.
+        Parameters
+        ----------
+        data_x: Union[pandas.DataFrame, scipy.sparse.csc_matrix]
+            Independent variables.
+        data_y: pandas.Series
+            Dependent variable.
+        seed: int [optional]
+            Seed for the sample.
+        max_rows: int [optional]
+            Further limit on the rows, on top of self.max_rows.
+        Returns
+        -------
+        (Union[pandas.DataFrame, scipy.sparse.csc_matrix], pandas.Series)
+        """
+        positions = self.sample_positions(data_y, seed, max_rows)
+        if positions is None:
+            return data_x, data_y
+        return take_rows(data_x, positions), take_rows(data_y, positions)
+
+    def test_column(self, missing_column: str, strategy: Strategy = FULL) -> ClassifierResult:
         """
         Test a single column for patterns of missingness.
         Parameters
         ----------
         missing_column: str
             Column to mine for patterns of missingness.
+        strategy: time_budget.Strategy [optional]
+            Limits on the rows sampled and depth of the tree, recorded as the Strategy
+            of the result.
         Returns
         -------
         ClassifierResult
         """
-        data_x, data_y = self.prepare_data(missing_column)
-        train_x, test_x, train_y, test_y = train_test_split(data_x, data_y)
-        model = DecisionTreeClassifier()
-        model.fit(train_x, train_y)
-        model_f1 = f1_score(test_y, model.predict(test_x))
-        return ClassifierResult(missing_column, model, data_x.columns, model_f1)
+        profiler = StageProfiler() if self.profile else NullProfiler()
+        seed = self.column_seed(missing_column)
+        # Rows are sampled before the design is prepared, so that only they are
+        # imputed and encoded.
+        with profiler.stage("sample", rows=len(self.missing)) as counts:
+            positions = self.sample_positions(
+                self.missing[missing_column], seed, strategy.MaxRows
+            )
+            if positions is not None:
+                counts["Rows"] = len(positions)
+        data_x, data_y, features = self.prepare_design(missing_column, profiler, positions)
+        with profiler.stage("split", rows=len(data_y), features=len(features)):
+            train_x, test_x, train_y, test_y = train_test_split(
+                data_x, data_y, random_state=seed
+            )
+        with profiler.stage("fit", rows=len(train_y), features=len(features)):
+            model = DecisionTreeClassifier(random_state=seed, max_depth=strategy.MaxDepth)
+            model.fit(train_x, train_y)
+        with profiler.stage("score", rows=len(test_y), features=len(features)):
+            model_f1 = f1_score(test_y, model.predict(test_x))
+        return ClassifierResult(
+            missing_column, model, features, model_f1,
+            SampleSize=len(data_y), ClassBalance=float(np.mean(data_y)),
+            Profile=profiler.stages, Strategy=strategy.Name
+        )
+
+    def screen(self, columns=None) -> pd.DataFrame:
+        """
+        p-values of the association between the missingness of each column and every
+        other variable, computed for all columns at once (see
+        screening.association_p_values).
+        Parameters
+        ----------
+        columns: list [optional]
+            Columns to screen, by default self.missing_columns.
+        Returns
+        -------
+        pandas.DataFrame
+            Columns screened by variables.
+        """
+        columns = self.missing_columns if columns is None else list(columns)
+        return association_p_values(
+            self.missing[columns], self.numeric_data, self.categorical_data
+        )
+
+    def screened_result(self, missing_column: str) -> ClassifierResult:
+        """
+        Result of a column screened as having no association with any variable, in
+        place of fitting a tree.  It has no model or features, scores 0 and has
+        Strategy "screened".
+        Parameters
+        ----------
+        missing_column: str
+            The screened column.
+        Returns
+        -------
+        ClassifierResult
+        """
+        data_y = self.missing[missing_column]
+        return ClassifierResult(
+            missing_column, None, pd.Index([]), 0.0,
+            SampleSize=len(data_y), ClassBalance=float(np.mean(data_y)), Strategy="screened"
+        )
+
+    def expected_costs(self, columns) -> dict:
+        """
+        Expected cost of mining each column, as rows x features of its design matrix.
+        One hot encoded variables count a feature per class.
+        Parameters
+        ----------
+        columns: list
+            Columns to mine.
+        Returns
+        -------
+        dict
+        """
+        widths = pd.Series(1, index=self.data.columns)
+        if self.encoding == "one_hot" and len(self.categorical_data.columns):
+            widths[self.categorical_data.columns] = self.categorical_data.nunique()
+        n_features = widths.sum()
+        return {col: len(self.data) * max(n_features - widths[col], 1) for col in columns}
+
+    def _mine_within(self, columns, time_budget, start):
+        """
+        Mine columns in this process, cheapest first, as planned by a BudgetPlanner
+        whose budget began at start (a time.perf_counter() value).
+        Yields (column, result) pairs, stopping once the next column cannot be mined in
+        time.
+        """
+        planner = BudgetPlanner(
+            time_budget, self.expected_costs(columns), len(self.data), start=start
+        )
+        order = planner.order()
+        for position, col in enumerate(order):
+            strategy = planner.choose(col, len(order) - position)
+            if strategy is None:
+                return
+            start = time.perf_counter()
+            result = self.test_column(col, strategy)
+            planner.record(col, strategy, time.perf_counter() - start)
+            yield col, result
 
-    def test_all_columns(self):
+    def params(self) -> dict:
         """
-        Mine all columns with some data missing for patterns of missingness
+        The settings of the classifier that affect its results.
+        Returns
+        -------
+        dict
+        """
+        return {
+            "numeric_imputer": repr(self.numeric_imputer),
+            "random_state": self.random_state,
+            "encoding": self.encoding,
+            "sparse": self.sparse,
+            "max_rows": self.max_rows,
+            "sample_fraction": self.sample_fraction,
+            "shared_features": self.shared_features,
+        }
+
+    def iter_columns(self, n_jobs=1, executor=None, cache=None, columns=None,
+                     progress=None, cancel=None, time_budget=None):
+        """
+        Mine columns for patterns of missingness, yielding each result as soon as it is
+        ready.  Cached results come first, then mined results in the order the columns
+        finish (which, in parallel, need not be the order of columns).
+        Closing the generator early, or cancelling, stops outstanding work.
+        Parameters
+        ----------
+        n_jobs: int [optional]
+            Number of worker processes to fit columns with.  -1 uses all CPUs.
+        executor: concurrent.futures.Executor [optional]
+            Executor to map the columns over, in place of n_jobs.
+        cache: Union[ResultCache, str] [optional]
+            Cache (or directory of a cache) of earlier results.  Columns with a cached
+            result for the same data and parameters are not refitted, and are yielded
+            as the CompactResult (without a model) kept in the cache.
+        columns: list [optional]
+            Columns to mine, by default self.missing_columns.  Columns with no missing
+            values in self.data are skipped.
+        progress: callable [optional]
+            Called as progress(n_done, n_total, result) after each column.
+        cancel: callable [optional]
+            Called with no arguments after each column; mining stops once it returns
+            True.
+        time_budget: float [optional]
+            Seconds to mine within.  Columns are then mined one at a time in this
+            process (n_jobs and executor are ignored), cheapest first, falling back to
+            subsampling then depth limited trees as the deadline approaches (see
+            time_budget.BudgetPlanner).  Columns that cannot be mined in time are
+            skipped.  The budget starts when iteration does, so covers screening and
+            building the feature store.
+        Yields
+        -------
+        Union[ClassifierResult, CompactResult]
+        """
+        start = time.perf_counter()
+        columns = self.missing_columns if columns is None \
+            else [col for col in columns if col in self.missing_columns]
+        n_total = len(columns)
+
+        if isinstance(cache, str):
+            cache = ResultCache(cache)
+
+        cached, keys = [], {}
+        if cache is not None:
+            hashes = column_hashes(self.data)
+            params = self.params()
+            for col in columns:
+                keys[col] = cache.key(hashes, col, params)
+                result = cache.get(keys[col])
+                if result is not None:
+                    cached.append(result)
+
+        screening = None
+        if self.screening_alpha is not None and columns:
+            screening = screening_scores(self.screen(columns))
+
+        def annotate(result):
+            if screening is None:
+                return result
+            score = float(screening[result.Variable])
+            if isinstance(result, CompactResult):
+                result.Screening = score
+                return result
+            return result._replace(Screening=score)
+
+        n_done = 0
+
+        def report(result):
+            nonlocal n_done
+            n_done += 1
+            if progress is not None:
+                progress(n_done, n_total, result)
+            return cancel is not None and cancel()
+
+        for result in cached:
+            result = annotate(result)
+            yield result
+            if report(result):
+                return
+
+        done = {i.Variable for i in cached}
+        to_mine = [col for col in columns if col not in done]
+        if screening is not None:
+            for col in [i for i in to_mine if screening[i] > self.screening_alpha]:
+                to_mine.remove(col)
+                result = annotate(self.screened_result(col))
+                yield result
+                if report(result):
+                    return
+
+        if self.shared_features and to_mine:
+            # Built before distributing so workers receive it rather than rebuild it.
+            _ = self.feature_store
+        if time_budget is None:
+            mined = parallel_imap_unordered(
+                _test_column, self, to_mine,
+                n_jobs=n_jobs, executor=executor
+            )
+        else:
+            mined = self._mine_within(to_mine, time_budget, start)
+        try:
+            for col, result in mined:
+                # Degraded results would be served in place of full ones, so are not cached.
+                if cache is not None and result.Strategy == FULL.Name:
+                    # Kept without the model, so entries don't grow with the tree, and
+                    # without the profile, which describes this run.
+                    cache.put(keys[col], CompactResult.from_result(
+                        result._replace(Profile=None), FeatureTable()
+                    ))
+                result = annotate(result)
+                yield result
+                if report(result):
+                    return
+        finally:
+            mined.close()
+
+    def test_all_columns(self, n_jobs=1, executor=None, cache=None, columns=None, writer=None,
+                         progress=None, cancel=None, time_budget=None):
+        """
+        Mine all columns with some data missing for patterns of missingness.
+        Results are returned in the order of self.missing_columns however the
+        columns are distributed.  See iter_columns for results as they complete.
+        Parameters
+        ----------
+        n_jobs: int [optional]
+            Number of worker processes to fit columns with.  -1 uses all CPUs.
+        executor: concurrent.futures.Executor [optional]
+            Executor to map the columns over, in place of n_jobs.
+        cache: Union[ResultCache, str] [optional]
+            Cache (or directory of a cache) of earlier results.  Columns with a cached
+            result for the same data and parameters are not refitted.
+        columns: list [optional]
+            Columns to mine, by default self.missing_columns.  Columns with no missing
+            values in self.data (for example in a sample of a larger data set) are
+            reported as unmined.
+        writer: report_writers.ReportWriter [optional]
+            Writer to report each result to as soon as it is ready, in the order the
+            columns finish.
+        progress: callable [optional]
+            Called as progress(n_done, n_total, result) after each column.
+        cancel: callable [optional]
+            Called after each column; mining stops once it returns True, and only the
+            columns finished so far are returned.
+        time_budget: float [optional]
+            Seconds to mine within, see iter_columns.
         Returns
         -------
         MissingResults
+            With a profile of building the shared feature store, if profiling, and the
+            columns left unmined by cancelling or running out of time.
         """
-        missing_result = MissingResults()
-        for col in self.missing_columns:
-            missing_result.append(self.test_column(col))
+        columns = self.missing_columns if columns is None else list(columns)
+        results = {}
+        mined = self.iter_columns(n_jobs, executor, cache, columns, progress, cancel, time_budget)
+        for result in mined:
+            results[result.Variable] = result
+            if writer is not None:
+                writer.write(result)
+
+        unmined = [col for col in columns if col not in results]
+        if writer is not None and unmined:
+            writer.write_unmined(unmined)
+        missing_result = MissingResults(shared_profile=self.store_profile, unmined=unmined)
+        for col in columns:
+            if col in results:
+                missing_result.append(results[col])
         return missing_result
 
 
+def _test_column(missing_classifier: MissingClassifier, missing_column: str) -> ClassifierResult:
+    """
+    Picklable wrapper of MissingClassifier.test_column for worker processes.
+    """
+    return missing_classifier.test_column(missing_column)
+
+
 if __name__ == '__main__':
 
     N = 1000
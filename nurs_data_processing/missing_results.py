@@ -2,33 +2,50 @@
 Tools for managing multiple missing mining results at the same time.
 """
 from collections import UserList
+from io import StringIO
+import numpy as np
 import pandas as pd
-from nurs_data_processing.model_result import ClassifierResult
+from nurs_data_processing.model_result import (
+    ClassifierResult, CompactResult, FeatureTable, feature_importances
+)
+from nurs_data_processing import report_writers
+
+RESULT_TYPES = (ClassifierResult, CompactResult)
 
 
 class MissingResults(UserList):
 
     """
-    List of ClassifierResult objects.
+    List of ClassifierResult (or CompactResult) objects.
     Parameters
     ----------
     values [optional]
         Initial values of the list
+    shared_profile: list [optional]
+        profiling.StageProfile of stages shared by every result, such as building the
+        feature store.
+    unmined: list [optional]
+        Columns left unmined, for example for lack of time (see
+        MissingClassifier.test_all_columns), reported after the results.
     """
 
+    PROFILE_COLUMNS = ["Variable", "Stage", "Seconds", "PeakBytes", "Rows", "Features"]
+
     # pylint: ignore=too-many-ancestors
-    def __init__(self, value=None):
+    def __init__(self, value=None, shared_profile=None, unmined=None):
         super().__init__(value)
+        self.shared_profile = list(shared_profile or [])
+        self.unmined = list(unmined or [])
 
     def append(self, item: ClassifierResult) -> None:
         """
         Add extra item to self
         Parameters
         ----------
-        item: ClassifierResult
+        item: Union[ClassifierResult, CompactResult]
             the result to be added
         """
-        if isinstance(item, ClassifierResult):
+        if isinstance(item, RESULT_TYPES):
             super().append(item)
         else:
             raise TypeError(f"Expected item of type 'ClassifierResult', but received {type(item)}")
@@ -42,51 +59,137 @@ class MissingResults(UserList):
             the result to be added
 
         """
-        if all(isinstance(item, ClassifierResult) for item in other):
+        if all(isinstance(item, RESULT_TYPES) for item in other):
             super().__add__(other)
         else:
             raise TypeError("Expected all item to be of type 'ClassifierResult'")
 
     def __str__(self):
-        string = ""
+        sections = []
         for i in self:
-            zipped = zip(i.Features, i.Model.feature_importances_)
+            zipped = zip(*feature_importances(i))
             zipped = "\n".join([f"{i}:{j:.3f}" for i, j in zipped])
+            sections.append(
+                f"Column: {i.Variable} \n"
+                f"F1-score: {i.Score:.3f} \n"
+                f"{zipped}\n"
+            )
+        if self.unmined:
+            sections.append(f"Unmined columns: {', '.join(map(str, self.unmined))}\n")
+        return "".join(sections)
 
-            loop_string = f"Column: {i.Variable} \n" \
-                          f"F1-score: {i.Score:.3f} \n" \
-                          f"{zipped}\n"
-            string += loop_string
-
-        return string
-
-    def to_markdown(self, n_features=5):
+    def to_markdown(self, n_features=5, by_variable=False):
         """
         Produce a report on every ClassifierResult in self.
-        Returns the K top performing features.
+        Returns the K top performing features.  For CompactResults only the kept
+        features are reported (and summed when by_variable).
+        See report_writers for writing the report as each result is ready, or as
+        JSON Lines or Parquet.
         Parameters
         ----------
         n_features: int [optional]
             Number of top features to return in report.
+        by_variable: bool [optional]
+            Sum the importances of the one hot features of each categorical variable,
+            reporting a single importance per original variable.
 
         Returns
         -------
         str
         """
-        string = ""
-        for i in self:
-            frm = pd.DataFrame(
-                zip(i.Features, i.Model.feature_importances_),
-                columns=["Feature", "Feature Importance"]
-            )
-            frm = frm.sort_values("Feature Importance", ascending=False)[:n_features]
-            frm["Feature"] = frm["Feature"].apply(self.format_feature_string)
+        buffer = StringIO()
+        with report_writers.MarkdownWriter(buffer, n_features, by_variable) as writer:
+            writer.write_all(self)
+            if self.unmined:
+                writer.write_unmined(self.unmined)
+        return buffer.getvalue()
+
+    def compact(self, top_k=20, keep_model=False):
+        """
+        Compact every result, sharing one table of feature names.
+        Parameters
+        ----------
+        top_k: int [optional]
+            Number of most important features to keep per result, all if None.
+        keep_model: bool [optional]
+            Keep the fitted models.
+        Returns
+        -------
+        MissingResults
+            Of CompactResult.
+        """
+        table = FeatureTable()
+        return MissingResults(
+            [i if isinstance(i, CompactResult)
+             else CompactResult.from_result(i, table, top_k, keep_model) for i in self],
+            shared_profile=self.shared_profile, unmined=self.unmined
+        )
+
+    def to_columnar(self, top_k=20, keep_model=False):
+        """
+        Store the results column-wise, see ColumnarResults.
+        Parameters
+        ----------
+        top_k: int [optional]
+            Number of most important features to keep per result, all if None.
+        keep_model: bool [optional]
+            Keep the fitted models.
+        Returns
+        -------
+        ColumnarResults
+        """
+        return ColumnarResults.from_results(self, top_k=top_k, keep_model=keep_model)
+
+    @staticmethod
+    def aggregate_by_variable(frm: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sum feature importances over the features belonging to each original variable.
+        One hot features are labelled (variable, value), all other features by the
+        variable name alone.
+        Parameters
+        ----------
+        frm: pandas.DataFrame
+            Frame with columns "Feature" and "Feature Importance".
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        variables = frm["Feature"].apply(lambda x: x[0] if isinstance(x, tuple) else x)
+        summed = frm.groupby(variables.values, sort=False)["Feature Importance"].sum()
+        return pd.DataFrame({
+            "Feature": summed.index,
+            "Feature Importance": summed.values
+        })
+
+    def profile_frame(self) -> pd.DataFrame:
+        """
+        Every profiled stage of every result, one row per stage.  Shared stages have no
+        Variable.
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        rows = [(None, *stage) for stage in self.shared_profile]
+        rows += [(i.Variable, *stage) for i in self if i.Profile for stage in i.Profile]
+        return pd.DataFrame(rows, columns=self.PROFILE_COLUMNS)
 
-            loop_string = f"## Column: {i.Variable} \n" \
-                          f"### F1-score: {i.Score:.3f} \n" \
-                          f"{frm.to_markdown(index=False)}\n"
-            string += loop_string
-        return string
+    def profile_summary(self) -> pd.DataFrame:
+        """
+        Total time, number of calls, slowest call and peak memory of each stage over
+        all results, hottest stage first.
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        frame = self.profile_frame()
+        summary = frame.groupby("Stage").agg(
+            Calls=("Seconds", "size"),
+            Seconds=("Seconds", "sum"),
+            MaxSeconds=("Seconds", "max"),
+            PeakBytes=("PeakBytes", "max")
+        )
+        summary["Share"] = summary["Seconds"] / summary["Seconds"].sum()
+        return summary.sort_values("Seconds", ascending=False)
 
     @staticmethod
     def format_feature_string(feature):
@@ -100,7 +203,187 @@ class MissingResults(UserList):
         -------
         str
         """
-        if isinstance(feature, tuple):
-            return f"Variable:{feature[0]}, Value:{feature[1]}"
+        return report_writers.format_feature_string(feature)
+
+
+class ColumnarResults:
+    """
+    Mining results stored column-wise: one array each of variables, scores, sample
+    sizes and class balances, and the kept feature importances of every result
+    concatenated into flat arrays of feature ids and importances, with offsets marking
+    where each result's features start (as in a CSR matrix).  Feature names are held
+    once in a shared FeatureTable.
+
+    Indexing or iterating gives CompactResults viewing the arrays, and to_results
+    converts back to MissingResults for reporting.
+
+    Parameters
+    ----------
+    variables, scores, sample_sizes, class_balances: numpy.ndarray
+        One value per result.
+    offsets: numpy.ndarray
+        Start of each result's features in feature_ids, plus the total.
+    feature_ids, importances: numpy.ndarray
+        Kept features of every result, most important first within each.
+    table: FeatureTable
+        Names of the features.
+    models: list [optional]
+        The fitted model of each result.
+    strategies, screenings: numpy.ndarray [optional]
+        The Strategy and Screening of each result, None and NaN where there are none.
+    unmined, shared_profile: list [optional]
+        As for MissingResults.
+    """
+
+    __slots__ = (
+        "variables", "scores", "sample_sizes", "class_balances", "offsets",
+        "feature_ids", "importances", "table", "models", "strategies", "screenings",
+        "unmined", "shared_profile"
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, variables, scores, sample_sizes, class_balances, offsets,
+                 feature_ids, importances, table, models=None, strategies=None,
+                 screenings=None, unmined=None, shared_profile=None):
+        self.variables = variables
+        self.scores = scores
+        self.sample_sizes = sample_sizes
+        self.class_balances = class_balances
+        self.offsets = offsets
+        self.feature_ids = feature_ids
+        self.importances = importances
+        self.table = table
+        self.models = models
+        self.strategies = np.full(len(variables), None, dtype=object) \
+            if strategies is None else strategies
+        self.screenings = np.full(len(variables), np.nan) if screenings is None else screenings
+        self.unmined = list(unmined or [])
+        self.shared_profile = list(shared_profile or [])
+
+    @classmethod
+    def from_results(cls, results, top_k=20, keep_model=False):
+        """
+        Store results column-wise, along with their unmined columns and shared
+        profile if results is a MissingResults.
+        Parameters
+        ----------
+        results: iterable of Union[ClassifierResult, CompactResult]
+        top_k: int [optional]
+            Number of most important features to keep per result, all if None.
+        keep_model: bool [optional]
+            Keep the fitted models.
+        Returns
+        -------
+        ColumnarResults
+        """
+        table = FeatureTable()
+        compact = [
+            CompactResult.from_result(i, table, top_k, keep_model)
+            if isinstance(i, ClassifierResult)
+            else CompactResult(
+                i.Variable, i.Score, table.ids(i.Features), i.Importances, table,
+                i.SampleSize, i.ClassBalance, i.Model if keep_model else None,
+                strategy=i.Strategy, screening=i.Screening
+            )
+            for i in results
+        ]
+        lengths = [len(i.FeatureIds) for i in compact]
+        return cls(
+            np.array([i.Variable for i in compact], dtype=object),
+            np.array([i.Score for i in compact], dtype=float),
+            np.array([np.nan if i.SampleSize is None else i.SampleSize for i in compact]),
+            np.array([np.nan if i.ClassBalance is None else i.ClassBalance for i in compact]),
+            np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            np.concatenate([i.FeatureIds for i in compact] or [[]]).astype(np.int32),
+            np.concatenate([i.Importances for i in compact] or [[]]).astype(float),
+            table,
+            [i.Model for i in compact] if keep_model else None,
+            np.array([i.Strategy for i in compact], dtype=object),
+            np.array([np.nan if i.Screening is None else i.Screening for i in compact]),
+            getattr(results, "unmined", None),
+            getattr(results, "shared_profile", None)
+        )
+
+    def __len__(self):
+        return len(self.variables)
+
+    def __getitem__(self, index) -> CompactResult:
+        index = range(len(self))[index]
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        sample_size = self.sample_sizes[index]
+        class_balance = self.class_balances[index]
+        screening = self.screenings[index]
+        return CompactResult(
+            self.variables[index], self.scores[index],
+            self.feature_ids[start:stop], self.importances[start:stop], self.table,
+            sample_size=None if np.isnan(sample_size) else int(sample_size),
+            class_balance=None if np.isnan(class_balance) else float(class_balance),
+            model=None if self.models is None else self.models[index],
+            strategy=self.strategies[index],
+            screening=None if np.isnan(screening) else float(screening)
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the arrays of results in bytes, excluding feature names and models.
+        """
+        return sum(
+            getattr(self, i).nbytes for i in
+            ("variables", "scores", "sample_sizes", "class_balances", "offsets",
+             "feature_ids", "importances", "strategies", "screenings")
+        )
+
+    def to_results(self) -> MissingResults:
+        """
+        The results as a MissingResults of CompactResult.
+        Returns
+        -------
+        MissingResults
+        """
+        return MissingResults(list(self), shared_profile=self.shared_profile,
+                              unmined=self.unmined)
+
+    def to_markdown(self, n_features=5, by_variable=False) -> str:
+        """
+        Produce a report on every result, see MissingResults.to_markdown.
+        """
+        return self.to_results().to_markdown(n_features=n_features, by_variable=by_variable)
 
-        return f"Variable:{feature}"
+    def __str__(self):
+        return str(self.to_results())
+
+    def __getstate__(self):
+        return tuple(getattr(self, i) for i in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def combined_markdown(results: dict, n_features=5, by_variable=False) -> str:
+    """
+    Produce a single report on several sets of results, such as the sheets of a
+    workbook.
+    Parameters
+    ----------
+    results: dict
+        MissingResults keyed by the name of the data set they were mined from.
+    n_features: int [optional]
+        Number of top features to return in report.
+    by_variable: bool [optional]
+        Report a single importance per original variable.
+
+    Returns
+    -------
+    str
+    """
+    return "".join(
+        f"# Sheet: {name} \n"
+        f"{result.to_markdown(n_features=n_features, by_variable=by_variable)}\n"
+        for name, result in results.items()
+    )
@@ -3,4 +3,215 @@ Tools for reporting on a single missing mining test.
 """
 from collections import namedtuple
 
-ClassifierResult = namedtuple("ClassifierResult", ("Variable", "Model", "Features", "Score"))
+import numpy as np
+
+ClassifierResult = namedtuple(
+    "ClassifierResult",
+    ("Variable", "Model", "Features", "Score", "SampleSize", "ClassBalance", "Profile",
+     "Strategy", "Screening")
+)
+# Rows the model was mined on, the proportion of them missing, if profiled, a list of
+# profiling.StageProfile, the name of the time_budget.Strategy fitting the model and
+# the adjusted p-value of the column's strongest association, if screened.
+ClassifierResult.__new__.__defaults__ = (None, None, None, None, None)
+
+
+class FeatureTable:
+    """
+    Table of feature names shared by compact results, each result referring to its
+    features by integer id rather than holding its own index of names.
+    """
+
+    __slots__ = ("names", "positions")
+
+    def __init__(self, names=()):
+        self.names = []
+        self.positions = {}
+        self.ids(names)
+
+    def ids(self, names) -> np.ndarray:
+        """
+        Integer id of each name, adding names not yet in the table.
+        Parameters
+        ----------
+        names: iterable
+            Feature names, strings or (variable, value) tuples.
+        Returns
+        -------
+        numpy.ndarray
+        """
+        ids = []
+        for name in names:
+            if name not in self.positions:
+                self.positions[name] = len(self.names)
+                self.names.append(name)
+            ids.append(self.positions[name])
+        return np.array(ids, dtype=np.int32)
+
+    def lookup(self, ids) -> list:
+        """
+        Names of the features with the given ids.
+        """
+        return [self.names[i] for i in ids]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getstate__(self):
+        return self.names
+
+    def __setstate__(self, names):
+        self.names = []
+        self.positions = {}
+        self.ids(names)
+
+
+class CompactResult:
+    """
+    A mining result keeping only what reports need: the top_k feature importances as
+    a numpy array, with the ids of their features in a shared FeatureTable.  The
+    fitted model is optional.  Much smaller, and quicker to pickle, than a
+    ClassifierResult holding a deep tree and a full index of feature names.
+
+    Parameters
+    ----------
+    variable: str
+        The column mined.
+    score: float
+        F1-score of the model.
+    feature_ids: numpy.ndarray
+        FeatureTable ids of the kept features, most important first.
+    importances: numpy.ndarray
+        Importance of each kept feature.
+    table: FeatureTable
+        Names of the features.
+    sample_size: int [optional]
+        Rows the model was mined on.
+    class_balance: float [optional]
+        Proportion of those rows missing.
+    model [optional]
+        The fitted model.
+    profile: list [optional]
+        profiling.StageProfile of mining the column.
+    strategy: str [optional]
+        Name of the time_budget.Strategy fitting the model.
+    screening: float [optional]
+        Adjusted p-value of the column's strongest association.
+    """
+
+    # Attributes are named as the fields of ClassifierResult.
+    # pylint: disable=invalid-name,too-many-instance-attributes,too-many-arguments
+
+    __slots__ = (
+        "Variable", "Score", "FeatureIds", "Importances", "Table",
+        "SampleSize", "ClassBalance", "Model", "Profile", "Strategy",
+        "Screening"
+    )
+
+    def __init__(self, variable, score, feature_ids, importances, table,
+                 sample_size=None, class_balance=None, model=None, profile=None,
+                 strategy=None, screening=None):
+        self.Variable = variable
+        self.Score = score
+        self.FeatureIds = feature_ids
+        self.Importances = importances
+        self.Table = table
+        self.SampleSize = sample_size
+        self.ClassBalance = class_balance
+        self.Model = model
+        self.Profile = profile
+        self.Strategy = strategy
+        self.Screening = screening
+
+    @classmethod
+    def from_result(cls, result: ClassifierResult, table: FeatureTable, top_k=None,
+                    keep_model=False):
+        """
+        Compact a ClassifierResult.
+        Parameters
+        ----------
+        result: ClassifierResult
+        table: FeatureTable
+            Table to add the feature names to.
+        top_k: int [optional]
+            Number of most important features to keep, all of them if None.
+        keep_model: bool [optional]
+            Keep a reference to the fitted model.
+        Returns
+        -------
+        CompactResult
+        """
+        features, importances = feature_importances(result)
+        importances = np.asarray(importances, dtype=float)
+        keep = top_k_indices(importances, top_k)
+        return cls(
+            result.Variable, result.Score,
+            table.ids(features[i] for i in keep), importances[keep], table,
+            sample_size=result.SampleSize, class_balance=result.ClassBalance,
+            model=result.Model if keep_model else None, profile=result.Profile,
+            strategy=result.Strategy, screening=result.Screening
+        )
+
+    @property
+    def Features(self) -> list:
+        """
+        Names of the kept features, most important first.
+        """
+        return self.Table.lookup(self.FeatureIds)
+
+    def __getstate__(self):
+        return tuple(getattr(self, i) for i in self.__slots__)
+
+    def __setstate__(self, state):
+        # States pickled before a slot was added leave it as None.
+        state = tuple(state) + (None,) * (len(self.__slots__) - len(state))
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"CompactResult(Variable={self.Variable!r}, Score={self.Score:.3f}, " \
+               f"Features={len(self.FeatureIds)})"
+
+
+def feature_importances(result):
+    """
+    The features of a result and their importances, for either a ClassifierResult or a
+    CompactResult.
+    Parameters
+    ----------
+    result: Union[ClassifierResult, CompactResult]
+    Returns
+    -------
+    (list, numpy.ndarray)
+    """
+    if isinstance(result, CompactResult):
+        return result.Features, result.Importances
+    if result.Model is None:
+        # Screened out without fitting a model.
+        return list(result.Features), np.zeros(len(result.Features))
+    return list(result.Features), result.Model.feature_importances_
+
+
+def top_k_indices(values, k=None) -> np.ndarray:
+    """
+    Positions of the k largest values, largest first.  Selected with
+    numpy.argpartition, so only the kept values are sorted.  Ties are broken by
+    position, so the selection is deterministic.
+    Parameters
+    ----------
+    values: numpy.ndarray
+    k: int [optional]
+        Number of positions to return, all of them if None.
+    Returns
+    -------
+    numpy.ndarray
+    """
+    if k is None or k >= len(values):
+        keep = np.arange(len(values))
+    elif k <= 0:
+        keep = np.arange(0)
+    else:
+        kth = values[np.argpartition(-values, k - 1)[k - 1]]
+        above = np.flatnonzero(values > kth)
+        keep = np.concatenate([above, np.flatnonzero(values == kth)[:k - len(above)]])
+    return keep[np.lexsort((keep, -values[keep]))]
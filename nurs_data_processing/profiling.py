@@ -0,0 +1,99 @@
+"""
+Tools for recording the time and memory taken by each stage of mining a column.
+"""
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+StageProfile = namedtuple("StageProfile", ("Stage", "Seconds", "PeakBytes", "Rows", "Features"))
+
+# The highest traced memory seen by each open stage of this thread, innermost last,
+# kept so that a nested stage resetting the peak doesn't lose it for enclosing stages.
+_OPEN_STAGES = threading.local()
+
+
+def _open_peaks() -> list:
+    if not hasattr(_OPEN_STAGES, "peaks"):
+        _OPEN_STAGES.peaks = []
+    return _OPEN_STAGES.peaks
+
+
+class StageProfiler:
+    """
+    Records the wall time and peak memory allocated (by tracemalloc) of named stages.
+    Tracing memory slows python allocations down considerably, so profiling is opt-in.
+
+    Each stage is timed with
+
+        with profiler.stage("fit", rows=n_rows) as counts:
+            ...
+            counts["Features"] = n_features
+
+    where row and feature counts can be given up front or filled in during the stage.
+
+    Stages may be nested.  Before python 3.9 (which added tracemalloc.reset_peak) the
+    peak of a nested stage is that since the outermost stage began, an upper bound.
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str, rows=None, features=None):
+        """
+        Profile the enclosed block as stage 'name'.
+        Parameters
+        ----------
+        name: str
+            Name of the stage.
+        rows: int [optional]
+            Number of rows processed.
+        features: int [optional]
+            Number of features processed.
+        Yields
+        -------
+        dict
+            Counts of "Rows" and "Features", which may be updated within the block.
+        """
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline, peak = tracemalloc.get_traced_memory()
+        peaks = _open_peaks()
+        if peaks:
+            peaks[-1] = max(peaks[-1], peak)
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        peaks.append(0)
+        counts = {"Rows": rows, "Features": features}
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, peaks.pop())
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+            if started_tracing:
+                tracemalloc.stop()
+            self.stages.append(StageProfile(
+                name, seconds, max(peak - baseline, 0), counts["Rows"], counts["Features"]
+            ))
+
+
+class NullProfiler:
+    """
+    Stand in for StageProfiler when profiling is off, recording nothing.
+    """
+
+    stages = None
+
+    @contextmanager
+    def stage(self, name: str, rows=None, features=None):  # pylint: disable=unused-argument
+        """
+        Run the enclosed block without profiling it.
+        """
+        yield {"Rows": rows, "Features": features}
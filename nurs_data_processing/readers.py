@@ -0,0 +1,213 @@
+"""
+Tools for loading data sets from file.
+"""
+import hashlib
+import json
+import os
+import warnings
+
+import pandas as pd
+
+CSV_TYPES = (".csv",)
+EXCEL_TYPES = (".xls", ".xlsx")
+PARQUET_TYPES = (".parquet", ".pq")
+FEATHER_TYPES = (".feather", ".arrow", ".ipc")
+ARROW_TYPES = PARQUET_TYPES + FEATHER_TYPES
+
+
+def read_arrow_table(file_path: str, columns=None, memory_map=True):
+    """
+    Read a Parquet or Feather (Arrow IPC) file as a pyarrow Table.
+    Parameters
+    ----------
+    file_path: str
+        path to data set
+    columns: list [optional]
+        Only read these columns.
+    memory_map: bool [optional]
+        Memory map the file rather than reading it into memory.
+    Returns
+    -------
+    pyarrow.Table
+    """
+    if file_path.lower().endswith(PARQUET_TYPES):
+        from pyarrow import parquet  # pylint: disable=import-outside-toplevel
+        return parquet.read_table(file_path, columns=columns, memory_map=memory_map)
+    if file_path.lower().endswith(FEATHER_TYPES):
+        from pyarrow import feather  # pylint: disable=import-outside-toplevel
+        return feather.read_table(file_path, columns=columns, memory_map=memory_map)
+    raise TypeError("Expecting file of type parquet or feather.  Check file type")
+
+
+def arrow_null_counts(table) -> pd.Series:
+    """
+    Null count of every column of a pyarrow Table, read from its metadata.
+    Parameters
+    ----------
+    table: pyarrow.Table
+    Returns
+    -------
+    pd.Series
+    """
+    return pd.Series(
+        [table.column(i).null_count for i in range(table.num_columns)],
+        index=table.column_names
+    )
+
+
+def arrow_missing_mask(table) -> pd.DataFrame:
+    """
+    Missingness mask of a pyarrow Table taken from the validity bitmaps of its
+    columns, without converting their values.
+    Parameters
+    ----------
+    table: pyarrow.Table
+    Returns
+    -------
+    pd.DataFrame
+    """
+    return pd.DataFrame({
+        name: table.column(i).is_null().to_numpy(zero_copy_only=False)
+        for i, name in enumerate(table.column_names)
+    })
+
+
+def sidecar_paths(sidecar_dir: str, file_path: str, sheet_name=0):
+    """
+    Paths of the columnar copy of a sheet (or csv file) and of its metadata.
+    Parameters
+    ----------
+    sidecar_dir: str
+        Directory holding sidecar files.
+    file_path: str
+        path to data set
+    sheet_name: Union[int, str] [optional]
+        Sheet ID of the data set.
+    Returns
+    -------
+    (str, str)
+    """
+    key = hashlib.sha256(f"{os.path.abspath(file_path)}|{sheet_name!r}".encode()).hexdigest()
+    return os.path.join(sidecar_dir, key + ".feather"), os.path.join(sidecar_dir, key + ".json")
+
+
+def file_signature(file_path: str, sheet_name=0) -> dict:
+    """
+    Path, modification time, size and sheet of a file, identifying its current version.
+    """
+    stat = os.stat(file_path)
+    return {
+        "path": os.path.abspath(file_path),
+        "sheet": repr(sheet_name),
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size
+    }
+
+
+def read_with_sidecar(file_path: str, sheet_name=0, columns=None,
+                      sidecar_dir=".nurs_sidecar", reader=None) -> pd.DataFrame:
+    """
+    Load a csv or xls(x) data set, keeping a Feather copy of it in sidecar_dir.
+    Later reads of an unchanged file (same path, modification time and size) load the
+    copy instead.  A copy of a file that has since changed is rebuilt.
+    Data the Feather format cannot hold (e.g. non-string column names or columns of
+    mixed types) is read as normal and not copied.
+    Parameters
+    ----------
+    file_path: str
+        path to data set
+    sheet_name: Union[int, str] [optional]
+        Sheet ID of the data set, for xls(x) files.
+    columns: list [optional]
+        Only return these columns.
+    sidecar_dir: str [optional]
+        Directory holding sidecar files.
+    reader: callable [optional]
+        Function of no arguments loading the sheet, used in place of read_data when
+        there is no up to date copy.
+    Returns
+    -------
+    pd.DataFrame
+    """
+    from pyarrow import feather  # pylint: disable=import-outside-toplevel
+
+    data_path, meta_path = sidecar_paths(sidecar_dir, file_path, sheet_name)
+    signature = file_signature(file_path, sheet_name)
+    if os.path.exists(meta_path) and os.path.exists(data_path):
+        with open(meta_path, "r") as file:
+            if json.load(file) == signature:
+                return feather.read_table(data_path, columns=columns, memory_map=True).to_pandas()
+
+    data = read_data(file_path, sheet_name) if reader is None else reader()
+    try:
+        os.makedirs(sidecar_dir, exist_ok=True)
+        feather.write_feather(data, data_path)
+    except (ValueError, TypeError) as error:
+        warnings.warn(f"Unable to cache '{file_path}' as Feather: {error}")
+    else:
+        with open(meta_path, "w") as file:
+            json.dump(signature, file)
+    return data if columns is None else data[list(columns)]
+
+
+def read_data(file_path: str, sheet_name=0, columns=None, memory_map=True,
+              sidecar_dir=None) -> pd.DataFrame:
+    """
+    Load a data set from a csv, xls(x), parquet or feather file.
+    Parameters
+    ----------
+    file_path: str
+        path to data set
+    sheet_name: Union[int, str] [optional]
+        Sheet ID of the data set, for xls(x) files.
+    columns: list [optional]
+        Only read these columns.
+    memory_map: bool [optional]
+        Memory map parquet and feather files.
+    sidecar_dir: str [optional]
+        Directory in which to keep Feather copies of csv and xls(x) files, see
+        read_with_sidecar.
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if sidecar_dir is not None and file_path.lower().endswith(CSV_TYPES + EXCEL_TYPES):
+        return read_with_sidecar(file_path, sheet_name, columns, sidecar_dir)
+    if file_path.lower().endswith(CSV_TYPES):
+        return pd.read_csv(file_path, usecols=columns)
+    if file_path.lower().endswith(EXCEL_TYPES):
+        return pd.read_excel(file_path, sheet_name=sheet_name, usecols=columns)
+    if file_path.lower().endswith(ARROW_TYPES):
+        return read_arrow_table(file_path, columns, memory_map).to_pandas()
+    raise TypeError("Expecting file of type csv, xls(x), parquet or feather.  Check file type")
+
+
+def read_sheets(file_path: str, columns=None, sidecar_dir=None) -> dict:
+    """
+    Load every sheet of an xls(x) workbook, parsing the workbook once.
+    Parameters
+    ----------
+    file_path: str
+        path to workbook
+    columns: list [optional]
+        Only read these columns.
+    sidecar_dir: str [optional]
+        Directory in which to keep Feather copies of each sheet, see read_with_sidecar.
+    Returns
+    -------
+    dict
+        Data set of each sheet, keyed by sheet name, in workbook order.
+    """
+    if not file_path.lower().endswith(EXCEL_TYPES):
+        raise TypeError("Expecting file of type xls(x) when reading all sheets.  Check file type")
+    if sidecar_dir is None:
+        return pd.read_excel(file_path, sheet_name=None, usecols=columns)
+
+    with pd.ExcelFile(file_path) as workbook:
+        return {
+            name: read_with_sidecar(
+                file_path, name, columns, sidecar_dir,
+                reader=lambda name=name: workbook.parse(name)
+            )
+            for name in workbook.sheet_names
+        }
@@ -0,0 +1,320 @@
+"""
+Tools for writing reports on mining results one column at a time, as each result is
+ready, in markdown, JSON Lines or Parquet format.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from .model_result import feature_importances, top_k_indices
+
+
+def top_features(result, n_features=5, by_variable=False):
+    """
+    The n_features most important features of a result, most important first.
+    Selected with numpy.argpartition (see model_result.top_k_indices), so only the
+    kept features are sorted.  Ties are broken by feature order.
+    Parameters
+    ----------
+    result: Union[ClassifierResult, CompactResult]
+    n_features: int [optional]
+        Number of features to keep, all of them if None.
+    by_variable: bool [optional]
+        Sum the importances of the one hot features of each categorical variable,
+        reporting a single importance per original variable.
+    Returns
+    -------
+    (list, numpy.ndarray)
+        Features and their importances.
+    """
+    features, importances = feature_importances(result)
+    importances = np.asarray(importances, dtype=float)
+    if by_variable:
+        variables = [i[0] if isinstance(i, tuple) else i for i in features]
+        codes, features = pd.factorize(pd.Series(variables, dtype=object))
+        features = list(features)
+        importances = np.bincount(codes, weights=importances, minlength=len(features))
+
+    keep = top_k_indices(importances, n_features)
+    return [features[i] for i in keep], importances[keep]
+
+
+def format_feature_string(feature) -> str:
+    """
+    Convert feature to human readable format.
+    Parameters
+    ----------
+    feature: Union(str, tuple)
+        Label of the feature.
+    Returns
+    -------
+    str
+    """
+    if isinstance(feature, tuple):
+        return f"Variable:{feature[0]}, Value:{feature[1]}"
+    return f"Variable:{feature}"
+
+
+class ReportWriter:
+    """
+    Base class of writers emitting one record per mining result.  Use as a context
+    manager, or call close() once every result is written.
+
+    Parameters
+    ----------
+    path: str
+        File to write to.
+    n_features: int [optional]
+        Number of top features reported per result, all of them if None.
+    by_variable: bool [optional]
+        Report a single importance per original variable.
+    """
+
+    def __init__(self, path, n_features=5, by_variable=False):
+        self.path = path
+        self.n_features = n_features
+        self.by_variable = by_variable
+        self.n_written = 0
+
+    def write(self, result) -> None:
+        """
+        Write the record of a single result.
+        Parameters
+        ----------
+        result: Union[ClassifierResult, CompactResult]
+        """
+        self._write(result, *top_features(result, self.n_features, self.by_variable))
+        self.n_written += 1
+
+    def write_all(self, results) -> None:
+        """
+        Write the record of every result.
+        """
+        for result in results:
+            self.write(result)
+
+    def _write(self, result, features, importances):
+        raise NotImplementedError
+
+    def write_unmined(self, columns) -> None:
+        """
+        Record the columns left unmined, after every result is written.
+        Parameters
+        ----------
+        columns: list
+            Names of the columns.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Finish writing the report.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class MarkdownWriter(ReportWriter):
+    """
+    Writes the report of MissingResults.to_markdown, a section per result.  The path
+    may also be an open text file.
+    """
+
+    def __init__(self, path, n_features=5, by_variable=False):
+        super().__init__(path, n_features, by_variable)
+        self._owns_file = isinstance(path, (str, os.PathLike))
+        # pylint: disable=consider-using-with
+        self.file = open(path, "w") if self._owns_file else path
+
+    @staticmethod
+    def section(result, features, importances) -> str:
+        """
+        The markdown section reporting a single result.
+        """
+        table = tabulate(
+            [(format_feature_string(i), j) for i, j in zip(features, importances)],
+            headers=["Feature", "Feature Importance"], tablefmt="pipe"
+        )
+        strategy = "" if result.Strategy in (None, "full") else \
+            f"### Strategy: {result.Strategy} \n"
+        screening = "" if result.Screening is None else \
+            f"### Screening p-value: {result.Screening:.3g} \n"
+        return f"## Column: {result.Variable} \n" \
+               f"### F1-score: {result.Score:.3f} \n" \
+               f"{strategy}" \
+               f"{screening}" \
+               f"{table}\n"
+
+    def _write(self, result, features, importances):
+        self.file.write(self.section(result, features, importances))
+        self.file.flush()
+
+    def write_unmined(self, columns):
+        listed = "".join(f"- {i}\n" for i in columns)
+        self.file.write(f"## Unmined columns \n{listed}")
+        self.file.flush()
+
+    def close(self):
+        if self._owns_file:
+            self.file.close()
+
+
+def _json_feature(feature):
+    """
+    JSON form of a feature name, [variable, value] for one hot features.
+    """
+    if isinstance(feature, tuple):
+        return [str(i) for i in feature]
+    return str(feature)
+
+
+def _optional(value, cast):
+    """
+    cast(value), or None for missing values.
+    """
+    return None if value is None or pd.isna(value) else cast(value)
+
+
+class JsonLinesWriter(ReportWriter):
+    """
+    Writes one JSON object per result and line, holding its variable, score, sample
+    size, class balance and top features with their importances.
+    """
+
+    def __init__(self, path, n_features=5, by_variable=False):
+        super().__init__(path, n_features, by_variable)
+        self.file = open(path, "w")  # pylint: disable=consider-using-with
+
+    def _write(self, result, features, importances):
+        record = {
+            "Variable": str(result.Variable),
+            "Score": float(result.Score),
+            "SampleSize": _optional(result.SampleSize, int),
+            "ClassBalance": _optional(result.ClassBalance, float),
+            "Strategy": result.Strategy,
+            "Screening": _optional(result.Screening, float),
+            "Features": [
+                {"Feature": _json_feature(i), "Importance": float(j)}
+                for i, j in zip(features, importances)
+            ]
+        }
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def write_unmined(self, columns):
+        for column in columns:
+            self.file.write(json.dumps({"Variable": str(column), "Unmined": True}) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter(ReportWriter):
+    """
+    Writes a tidy table with a row per reported feature of each result, one Parquet
+    row group per result.  One hot features are split into their variable and value.
+    Results without features, such as columns screened out before fitting, are
+    written as a single row with no feature.
+    """
+
+    def __init__(self, path, n_features=5, by_variable=False):
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        from pyarrow import parquet
+
+        super().__init__(path, n_features, by_variable)
+        self.schema = pa.schema([
+            ("Variable", pa.string()),
+            ("Score", pa.float64()),
+            ("SampleSize", pa.int64()),
+            ("ClassBalance", pa.float64()),
+            ("Strategy", pa.string()),
+            ("Screening", pa.float64()),
+            ("Rank", pa.int32()),
+            ("FeatureVariable", pa.string()),
+            ("FeatureValue", pa.string()),
+            ("Importance", pa.float64()),
+        ])
+        self.writer = parquet.ParquetWriter(path, self.schema)
+
+    def _write(self, result, features, importances):
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        n_rows = len(features)
+        if not n_rows:
+            features, importances, n_rows = [None], [None], 1
+        columns = {
+            "Variable": [str(result.Variable)] * n_rows,
+            "Score": [float(result.Score)] * n_rows,
+            "SampleSize": [_optional(result.SampleSize, int)] * n_rows,
+            "ClassBalance": [_optional(result.ClassBalance, float)] * n_rows,
+            "Strategy": [result.Strategy] * n_rows,
+            "Screening": [_optional(result.Screening, float)] * n_rows,
+            "Rank": [None if i is None else rank for rank, i in enumerate(features, start=1)],
+            "FeatureVariable": [
+                None if i is None else str(i[0] if isinstance(i, tuple) else i)
+                for i in features
+            ],
+            "FeatureValue": [str(i[1]) if isinstance(i, tuple) else None for i in features],
+            "Importance": importances,
+        }
+        self.writer.write_table(pa.table(columns, schema=self.schema))
+
+    def write_unmined(self, columns):
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        # A row per column with no score or features.
+        names = [str(i) for i in columns]
+        self.writer.write_table(pa.table(
+            {name: names if name == "Variable" else [None] * len(names)
+             for name in self.schema.names},
+            schema=self.schema
+        ))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {
+    "markdown": MarkdownWriter,
+    "jsonl": JsonLinesWriter,
+    "parquet": ParquetWriter,
+}
+EXTENSIONS = {".md": "markdown", ".jsonl": "jsonl", ".parquet": "parquet"}
+
+
+def open_writer(path, report_format=None, n_features=5, by_variable=False) -> ReportWriter:
+    """
+    Open a report writer.
+    Parameters
+    ----------
+    path: str
+        File to write to.
+    report_format: str [optional]
+        "markdown", "jsonl" or "parquet".  Inferred from the extension of path
+        (.md, .jsonl or .parquet) if not given.
+    n_features: int [optional]
+        Number of top features reported per result.
+    by_variable: bool [optional]
+        Report a single importance per original variable.
+    Returns
+    -------
+    ReportWriter
+    """
+    if report_format is None:
+        extension = os.path.splitext(str(path))[1].lower()
+        if extension not in EXTENSIONS:
+            raise ValueError(f"Cannot infer report format from '{path}', expecting one of "
+                             f"{sorted(EXTENSIONS)}")
+        report_format = EXTENSIONS[extension]
+    if report_format not in WRITERS:
+        raise ValueError(f"Expecting report format of {sorted(WRITERS)}, received '{report_format}'")
+    return WRITERS[report_format](path, n_features=n_features, by_variable=by_variable)
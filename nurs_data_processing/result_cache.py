@@ -0,0 +1,158 @@
+"""
+Tools for keeping missing mining results on disk between runs.
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+
+import pandas as pd
+
+from . import __version__
+
+
+def column_hashes(data: pd.DataFrame) -> dict:
+    """
+    Content hash of every column of data, covering its name, type and values.
+    Parameters
+    ----------
+    data: pd.DataFrame
+    Returns
+    -------
+    dict
+        Hex digest of each column, keyed by column name.
+    """
+    hashes = {}
+    for col in data.columns:
+        digest = hashlib.sha256(f"{col!r}:{data.dtypes[col]}".encode())
+        digest.update(pd.util.hash_pandas_object(data[col], index=False).values.tobytes())
+        hashes[col] = digest.hexdigest()
+    return hashes
+
+
+class ResultCache:
+    """
+    Directory of mining results keyed by the data, the column mined, the classifier
+    parameters and the package version.
+    Entries older than max_age seconds are dropped, and the least recently used entries
+    are dropped once the directory holds more than max_bytes.
+
+    Parameters
+    ----------
+    cache_dir: str
+        Directory to keep results in.  Created if needed.
+    max_bytes: int [optional]
+        Maximum total size of the cached results.
+    max_age: float [optional]
+        Maximum age of a cached result in seconds.
+    """
+
+    suffix = ".pkl"
+
+    def __init__(self, cache_dir, max_bytes=None, max_age=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(data_hashes: dict, missing_column, params: dict) -> str:
+        """
+        Cache key of a result.
+        Parameters
+        ----------
+        data_hashes: dict
+            Output of column_hashes for the mined data set.
+        missing_column: str
+            The column mined for.
+        params: dict
+            Parameters of the classifier that affect the result.
+        Returns
+        -------
+        str
+        """
+        description = json.dumps({
+            "version": __version__,
+            "column": repr(missing_column),
+            "data": [[repr(col), digest] for col, digest in data_hashes.items()],
+            "params": params
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        """
+        File holding the result for key.
+        """
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def get(self, key: str):
+        """
+        Load the result stored for key, or None if there isn't one.
+        Parameters
+        ----------
+        key: str
+        Returns
+        -------
+        Union[CompactResult, ClassifierResult, None]
+        """
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        if self.max_age is not None and time.time() - os.path.getmtime(path) > self.max_age:
+            os.remove(path)
+            return None
+        with open(path, "rb") as file:
+            result = pickle.load(file)
+        os.utime(path)
+        return result
+
+    def put(self, key: str, result) -> None:
+        """
+        Store result under key, then evict entries beyond the limits.
+        Parameters
+        ----------
+        key: str
+        result: Union[CompactResult, ClassifierResult]
+            A CompactResult keeps the entry's size independent of the fitted model.
+        """
+        temporary = self.path(key) + ".tmp"
+        with open(temporary, "wb") as file:
+            pickle.dump(result, file)
+        os.replace(temporary, self.path(key))
+        self.evict()
+
+    def entries(self):
+        """
+        Cached files as (path, size, modified time), oldest first.
+        Returns
+        -------
+        list
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.suffix):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda x: x[2])
+
+    def evict(self) -> None:
+        """
+        Remove entries older than max_age, then the least recently used entries until
+        the cache is within max_bytes.
+        """
+        entries = self.entries()
+        if self.max_age is not None:
+            now = time.time()
+            for path, _, modified in entries:
+                if now - modified > self.max_age:
+                    os.remove(path)
+            entries = [i for i in entries if now - i[2] <= self.max_age]
+        if self.max_bytes is not None:
+            total = sum(i[1] for i in entries)
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                os.remove(path)
+                total -= size
@@ -0,0 +1,82 @@
+"""
+Tools for drawing bounded size samples of the rows of a data set.
+"""
+import math
+import numpy as np
+import pandas as pd
+
+MIN_CLASS_ROWS = 10
+
+
+def sample_size(n_rows: int, max_rows=None, sample_fraction=None) -> int:
+    """
+    Number of rows to sample given a maximum number of rows and/or a fraction.
+    Parameters
+    ----------
+    n_rows: int
+        Number of rows available.
+    max_rows: int [optional]
+        Maximum number of rows.
+    sample_fraction: float [optional]
+        Fraction of the rows to keep (0 < sample_fraction <= 1).
+    Returns
+    -------
+    int
+    """
+    size = n_rows
+    if sample_fraction is not None:
+        size = min(size, math.ceil(n_rows * sample_fraction))
+    if max_rows is not None:
+        size = min(size, max_rows)
+    return size
+
+
+def stratified_sample_indices(labels: pd.Series, n_samples: int, random_state=None):
+    """
+    Positions of a sample of n_samples rows, stratified on labels.
+    Each class is sampled in proportion to its frequency, but keeps at least
+    min(class size, MIN_CLASS_ROWS) rows so that rare classes stay represented.
+    Parameters
+    ----------
+    labels: pd.Series
+        Class of each row.
+    n_samples: int
+        Target number of rows.
+    random_state: int [optional]
+        Seed for the sample.
+    Returns
+    -------
+    numpy.ndarray
+        Sorted row positions.
+    """
+    values = np.asarray(labels)
+    n_rows = len(values)
+    if n_samples >= n_rows:
+        return np.arange(n_rows)
+
+    random = np.random.default_rng(random_state)
+    positions = []
+    for label in np.unique(values):
+        members = np.flatnonzero(values == label)
+        n_class = max(
+            round(n_samples * len(members) / n_rows),
+            min(len(members), MIN_CLASS_ROWS)
+        )
+        positions.append(random.choice(members, size=min(n_class, len(members)), replace=False))
+    return np.sort(np.concatenate(positions))
+
+
+def take_rows(data, positions):
+    """
+    Select rows by position from a pandas object or a scipy.sparse matrix.
+    Parameters
+    ----------
+    data: Union[pd.DataFrame, pd.Series, scipy.sparse.spmatrix]
+    positions: numpy.ndarray
+    Returns
+    -------
+    Union[pd.DataFrame, pd.Series, scipy.sparse.spmatrix]
+    """
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[positions]
+    return data[positions]
@@ -0,0 +1,160 @@
+"""
+Tools for screening every missing column for association with every variable at once,
+ahead of fitting a tree to each of them.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+
+def category_indicators(categorical_data: pd.DataFrame):
+    """
+    Sparse one hot indicators of the classes of every categorical variable, with
+    missing values as a class of their own.
+    Parameters
+    ----------
+    categorical_data: pd.DataFrame
+        The categorical variables.
+    Returns
+    -------
+    (scipy.sparse.csc_matrix, numpy.ndarray)
+        Indicators of shape (rows, classes) and the position of the first class of
+        each variable.
+    """
+    n_rows = len(categorical_data)
+    blocks, starts, width = [], [], 0
+    for col in categorical_data.columns:
+        codes, classes = pd.factorize(categorical_data[col])
+        codes = np.where(codes < 0, len(classes), codes)
+        blocks.append(sparse.csc_matrix(
+            (np.ones(n_rows), (np.arange(n_rows), codes)), shape=(n_rows, len(classes) + 1)
+        ))
+        starts.append(width)
+        width += len(classes) + 1
+    if not blocks:
+        return sparse.csc_matrix((n_rows, 0)), np.array(starts, dtype=int)
+    return sparse.hstack(blocks, format="csc"), np.array(starts, dtype=int)
+
+
+def chi_square_p_values(missing: np.ndarray, indicators, starts) -> np.ndarray:
+    """
+    p-values of the chi-square test of independence between each missingness
+    indicator and each categorical variable, from the counts missing.T @ indicators.
+    Parameters
+    ----------
+    missing: numpy.ndarray
+        Float missingness indicators of shape (rows, targets).
+    indicators: scipy.sparse.csc_matrix
+        Class indicators from category_indicators.
+    starts: numpy.ndarray
+        Position of the first class of each variable.
+    Returns
+    -------
+    numpy.ndarray
+        Of shape (targets, variables).
+    """
+    n_rows = missing.shape[0]
+    if not len(starts):
+        return np.empty((missing.shape[1], 0))
+    observed = np.asarray((indicators.T @ missing).T)
+    class_totals = np.asarray(indicators.sum(axis=0)).ravel()
+    n_missing = missing.sum(axis=0)
+    expected = np.outer(n_missing, class_totals) / n_rows
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # For a 2 x k table the chi-square statistic reduces to the missing row.
+        cells = np.where(class_totals > 0, (observed - expected) ** 2 / class_totals, 0)
+        scale = n_rows ** 2 / (n_missing * (n_rows - n_missing))
+        statistic = np.add.reduceat(cells, starts, axis=1) * scale[:, None]
+    degrees = np.add.reduceat((class_totals > 0).astype(int), starts) - 1
+    p_values = stats.chi2.sf(statistic, np.maximum(degrees, 1))
+    p_values[:, degrees < 1] = 1
+    return np.where(np.isfinite(statistic), p_values, 1)
+
+
+def point_biserial_p_values(missing: np.ndarray, numeric: np.ndarray) -> np.ndarray:
+    """
+    p-values of the point-biserial correlation between each missingness indicator and
+    each numeric variable.
+    Parameters
+    ----------
+    missing: numpy.ndarray
+        Float missingness indicators of shape (rows, targets).
+    numeric: numpy.ndarray
+        Numeric variables of shape (rows, variables), with no missing values.
+    Returns
+    -------
+    numpy.ndarray
+        Of shape (targets, variables).
+    """
+    n_rows = missing.shape[0]
+    missing = missing - missing.mean(axis=0)
+    numeric = numeric - numeric.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = (missing.T @ numeric) / np.outer(
+            np.sqrt((missing ** 2).sum(axis=0)), np.sqrt((numeric ** 2).sum(axis=0))
+        )
+        correlation = np.clip(np.nan_to_num(correlation), -1, 1)
+        statistic = correlation * np.sqrt((n_rows - 2) / (1 - correlation ** 2))
+    return 2 * stats.t.sf(np.abs(statistic), max(n_rows - 2, 1))
+
+
+def association_p_values(missing: pd.DataFrame, numeric_data: pd.DataFrame,
+                         categorical_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    p-values of the association between each missingness indicator (target) and each
+    variable, from a chi-square test for categorical variables and the point-biserial
+    correlation for numeric variables (with missing values filled with the mean).
+    As the mean fill hides numeric variables missing together with the target, each
+    target is also tested against the missingness of every numeric variable with
+    missing values, by a chi-square test reported under "Missing:<variable>".
+    Each target is left untested (NaN) against its own variable.
+    Parameters
+    ----------
+    missing: pd.DataFrame
+        Missingness indicators of the targets.
+    numeric_data: pd.DataFrame
+        The numeric variables.
+    categorical_data: pd.DataFrame
+        The categorical variables.
+    Returns
+    -------
+    pd.DataFrame
+        Targets by variables.
+    """
+    targets = missing.to_numpy(dtype=float)
+    numeric = numeric_data.to_numpy(dtype=float)
+    numeric = np.where(np.isnan(numeric), np.nanmean(numeric, axis=0), numeric)
+    numeric_missing = numeric_data.loc[:, numeric_data.isna().any()].isna()
+    numeric_missing.columns = [f"Missing:{i}" for i in numeric_missing.columns]
+    categorical_data = pd.concat([categorical_data, numeric_missing], axis=1)
+    indicators, starts = category_indicators(categorical_data)
+    p_values = pd.DataFrame(
+        np.hstack([
+            point_biserial_p_values(targets, numeric),
+            chi_square_p_values(targets, indicators, starts)
+        ]),
+        index=missing.columns,
+        columns=list(numeric_data.columns) + list(categorical_data.columns)
+    )
+    for target in p_values.index:
+        for own in (target, f"Missing:{target}"):
+            if own in p_values.columns:
+                p_values.loc[target, own] = np.nan
+    return p_values
+
+
+def screening_scores(p_values: pd.DataFrame) -> pd.Series:
+    """
+    Bonferroni adjusted p-value of the strongest association of each target: the
+    smallest p-value times the number of variables tested, capped at 1.  Targets with
+    no variables to test score 1.
+    Parameters
+    ----------
+    p_values: pd.DataFrame
+        From association_p_values.
+    Returns
+    -------
+    pd.Series
+    """
+    n_tests = p_values.notna().sum(axis=1)
+    return (p_values.min(axis=1) * n_tests).clip(upper=1).fillna(1)
@@ -1,45 +1,151 @@
 """
 Bindings to SQL Alchemy module
 """
+import re
 
+import pandas as pd
 import sqlalchemy
 import yaml
 
+IDENTIFIER = re.compile(r"^\w+(\.\w+)?$")
 
-def make_engine(sql_string):
+
+def make_engine(sql_string, **engine_kwargs):
     """
     Produce engine with 'connect_args' for project compatibility.
     Parameters
     ----------
     sql_string: str
         Connection string
+    engine_kwargs
+        Further arguments to sqlalchemy.create_engine, e.g. pool_size.
     """
+    if sqlalchemy.engine.make_url(sql_string).get_backend_name() == "mysql":
+        engine_kwargs.setdefault("connect_args", {'ssl': {'ssl-mode': 'preferred'}})
     return sqlalchemy.create_engine(
         sql_string,
-        connect_args={'ssl': {'ssl-mode': 'preferred'}}
+        **engine_kwargs
     )
 
 
 class NuRS_SQL:
+    """
+    Connection to a NuRS database.
+    Parameters
+    ----------
+    sql_string: str
+        Connection string
+    pool_size: int [optional]
+        Number of connections kept open in the pool.
+    max_overflow: int [optional]
+        Number of connections allowed beyond pool_size.
+    """
 
-    def __init__(self, sql_string):
+    def __init__(self, sql_string, pool_size=None, max_overflow=None):
         self.sql_string = sql_string
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
         self._engine = None
 
     @classmethod
     def from_config(cls, config_file_path="config.yaml"):
+        """
+        Read connection settings from a yaml file with key 'sql_string' and optional
+        keys 'pool_size' and 'max_overflow'.
+        """
         with open(config_file_path, "r") as f:
             config = yaml.safe_load(f)
         sql_string = config["sql_string"]
-        return cls(sql_string)
+        return cls(
+            sql_string,
+            pool_size=config.get("pool_size"),
+            max_overflow=config.get("max_overflow")
+        )
 
     @property
     def engine(self):
         if self._engine is None:
-            self._engine = make_engine(self.sql_string)
+            pool_kwargs = {
+                key: value for key, value in
+                [("pool_size", self.pool_size), ("max_overflow", self.max_overflow)]
+                if value is not None
+            }
+            self._engine = make_engine(self.sql_string, **pool_kwargs)
 
         return self._engine
 
+    def quote(self, identifier):
+        """
+        Quote a column or table name for this database.
+        """
+        return self.engine.dialect.identifier_preparer.quote(identifier)
+
+    def from_clause(self, table_or_query):
+        """
+        The text following FROM when selecting from a table name ('table' or
+        'schema.table') or, wrapped as a sub-query, from any other query.
+        Parameters
+        ----------
+        table_or_query: str
+        Returns
+        -------
+        str
+        """
+        if IDENTIFIER.match(table_or_query):
+            return ".".join(self.quote(i) for i in table_or_query.split("."))
+        return f"({table_or_query}) AS source"
+
+    def select_statement(self, table_or_query):
+        """
+        Convert a table name ('table' or 'schema.table') into a query selecting every
+        column of it.  Anything else is taken to be a query and returned as is.
+        Parameters
+        ----------
+        table_or_query: str
+        Returns
+        -------
+        sqlalchemy.sql.elements.TextClause
+        """
+        if IDENTIFIER.match(table_or_query):
+            table_or_query = f"SELECT * FROM {self.from_clause(table_or_query)}"
+        return sqlalchemy.text(table_or_query)
+
+    def column_names(self, table_or_query):
+        """
+        Names of the columns of a table or query, read without fetching any rows.
+        Parameters
+        ----------
+        table_or_query: str
+        Returns
+        -------
+        list
+        """
+        statement = sqlalchemy.text(
+            f"SELECT * FROM {self.from_clause(table_or_query)} WHERE 1 = 0"
+        )
+        with self.engine.connect() as connection:
+            return list(connection.execute(statement).keys())
+
+    def read_chunks(self, table_or_query, chunksize=10000):
+        """
+        Stream the rows of a table or query chunksize rows at a time, using a server
+        side cursor where the database driver supports one.
+        Parameters
+        ----------
+        table_or_query: str
+            Table name or SQL query.
+        chunksize: int [optional]
+            Number of rows per chunk.
+        Returns
+        -------
+        generator of pandas.DataFrame
+        """
+        statement = self.select_statement(table_or_query)
+        with self.engine.connect() as connection:
+            connection = connection.execution_options(stream_results=True)
+            for chunk in pd.read_sql(statement, connection, chunksize=chunksize):
+                yield chunk
+
 
 def sql_engine_from_yaml(config_file_path="config.yaml"):
     """
@@ -0,0 +1,206 @@
+"""
+Tools for computing missingness summaries inside the database, so that only aggregates
+(or the few columns needed) are transferred.
+"""
+from decimal import Decimal
+
+import pandas as pd
+import sqlalchemy
+
+from .missing_chart import summary_from_counts, jeffreys_interval, plot_summary
+from .sql_engine import NuRS_SQL
+
+
+def _is_null_sum(nurs_sql: NuRS_SQL, column: str) -> str:
+    """
+    SQL expression counting the nulls of column.
+    """
+    return f"SUM(CASE WHEN {nurs_sql.quote(column)} IS NULL THEN 1 ELSE 0 END)"
+
+
+def null_counts(nurs_sql: NuRS_SQL, table_or_query: str) -> pd.Series:
+    """
+    Count the nulls in every column of a table or query with a single aggregate query.
+    Parameters
+    ----------
+    nurs_sql: NuRS_SQL
+        Database connection.
+    table_or_query: str
+        Table name or SQL query.
+    Returns
+    -------
+    pandas.Series
+        Null count of each column, indexed by column name.
+    """
+    columns = nurs_sql.column_names(table_or_query)
+    sums = ", ".join(
+        f"{_is_null_sum(nurs_sql, col)} AS {nurs_sql.quote(f'c{i}')}"
+        for i, col in enumerate(columns)
+    )
+    statement = sqlalchemy.text(f"SELECT {sums} FROM {nurs_sql.from_clause(table_or_query)}")
+    with nurs_sql.engine.connect() as connection:
+        row = connection.execute(statement).fetchone()
+    return pd.Series([int(i or 0) for i in row], index=columns)
+
+
+def missing_columns(nurs_sql: NuRS_SQL, table_or_query: str) -> pd.Index:
+    """
+    Columns of a table or query with at least one null value.
+    Parameters
+    ----------
+    nurs_sql: NuRS_SQL
+        Database connection.
+    table_or_query: str
+        Table name or SQL query.
+    Returns
+    -------
+    pandas.Index
+    """
+    counts = null_counts(nurs_sql, table_or_query)
+    return counts[counts > 0].index
+
+
+def grouped_missing_counts(nurs_sql: NuRS_SQL, table_or_query: str,
+                           missing_col: str, feature_col: str) -> pd.DataFrame:
+    """
+    Number of cases and of nulls in missing_col for each value of feature_col, computed
+    with GROUP BY.  Null values of feature_col form a group labelled "NaN", and groups
+    are sorted as missing_chart.missing_summary sorts them, whatever the database's
+    collation.
+    Parameters
+    ----------
+    nurs_sql: NuRS_SQL
+        Database connection.
+    table_or_query: str
+        Table name or SQL query.
+    missing_col: str
+        The column to count nulls of.
+    feature_col: str
+        The column to group by.
+    Returns
+    -------
+    pandas.DataFrame
+        Columns "N" and "Missing" indexed by the value of feature_col.
+    """
+    feature = nurs_sql.quote(feature_col)
+    statement = sqlalchemy.text(
+        f"SELECT {feature} AS grp, COUNT(*) AS n, "
+        f"{_is_null_sum(nurs_sql, missing_col)} AS missing "
+        f"FROM {nurs_sql.from_clause(table_or_query)} GROUP BY {feature} ORDER BY {feature}"
+    )
+    with nurs_sql.engine.connect() as connection:
+        counts = pd.read_sql(statement, connection)
+    return pd.DataFrame({
+        "N": counts["n"].astype(int).values,
+        "Missing": counts["missing"].fillna(0).astype(int).values
+    }, index=counts["grp"].fillna("NaN")).sort_index()
+
+
+def is_categorical(nurs_sql: NuRS_SQL, table_or_query: str, column: str, n_rows=100) -> bool:
+    """
+    Infer whether column is categorical from its first n_rows non-null values.
+    Parameters
+    ----------
+    nurs_sql: NuRS_SQL
+        Database connection.
+    table_or_query: str
+        Table name or SQL query.
+    column: str
+        The column to check.
+    n_rows: int [optional]
+        Number of values to infer the type from.
+    Returns
+    -------
+    bool
+    """
+    name = nurs_sql.quote(column)
+    statement = sqlalchemy.text(
+        f"SELECT {name} FROM {nurs_sql.from_clause(table_or_query)} WHERE {name} IS NOT NULL"
+    )
+    with nurs_sql.engine.connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(statement)
+        values = [i[0] for i in result.fetchmany(n_rows)]
+    return infer_categorical(values)
+
+
+def infer_categorical(values) -> bool:
+    """
+    Whether values, as returned by a database driver, are categorical.  DECIMAL and
+    NUMERIC values, which drivers return as decimal.Decimal objects, are numeric.
+    Parameters
+    ----------
+    values: list
+    Returns
+    -------
+    bool
+    """
+    values = pd.Series([float(i) if isinstance(i, Decimal) else i for i in values])
+    return values.dtype == "object"
+
+
+def missing_summary_from_sql(nurs_sql: NuRS_SQL, table_or_query: str, missing_col: str,
+                             feature_col: str, n_bins=10, ci_width: float = 0.95):
+    """
+    The per group summary plotted by missing_chart, computed from the database.
+    Categorical features are aggregated with GROUP BY.  For numeric features only
+    feature_col and the null indicator of missing_col are fetched, and binned into
+    n_bins quantiles locally.
+    Parameters
+    ----------
+    nurs_sql: NuRS_SQL
+        Database connection.
+    table_or_query: str
+        Table name or SQL query.
+    missing_col: str
+        The column to summarize missingness of.
+    feature_col: str
+        The column to group by.
+    n_bins: int [optional]
+        Number of quantile bins for numeric features.
+    ci_width: float [0 < q < 1]
+        Width of the CI.
+    Returns
+    -------
+    (pandas.DataFrame, float)
+        The per group summary, and the median proportion missing over all cases.
+    """
+    if is_categorical(nurs_sql, table_or_query, feature_col):
+        counts = grouped_missing_counts(nurs_sql, table_or_query, missing_col, feature_col)
+        feature = pd.Series(counts.index, index=counts.index)
+        total_missing, total_cases = counts["Missing"].sum(), counts["N"].sum()
+    else:
+        statement = sqlalchemy.text(
+            f"SELECT {nurs_sql.quote(feature_col)} AS feature, "
+            f"CASE WHEN {nurs_sql.quote(missing_col)} IS NULL THEN 1 ELSE 0 END AS missing "
+            f"FROM {nurs_sql.from_clause(table_or_query)}"
+        )
+        with nurs_sql.engine.connect() as connection:
+            values = pd.read_sql(statement, connection)
+        grouped = values.groupby(pd.qcut(values["feature"], q=n_bins), observed=True)
+        counts = pd.DataFrame({"N": grouped.size(), "Missing": grouped["missing"].sum()})
+        feature = grouped["feature"].mean()
+        # Cases with a null feature fall outside every bin but count towards the total.
+        total_missing, total_cases = values["missing"].sum(), len(values)
+
+    summary = summary_from_counts(feature, counts["N"], counts["Missing"], ci_width)
+    overall = jeffreys_interval(total_missing, total_cases, ci_width)["Missing"]
+    return summary, overall
+
+
+def missing_chart_from_sql(nurs_sql: NuRS_SQL, table_or_query: str, missing_col: str,
+                           feature_col: str):
+    """
+    Produce the chart of missing_chart.missing_chart from a database table or query,
+    transferring only the aggregates needed.
+    Parameters
+    ----------
+    nurs_sql: NuRS_SQL
+        Database connection.
+    table_or_query: str
+        Table name or SQL query.
+    missing_col: str
+    feature_col: str
+
+    """
+    summary, overall = missing_summary_from_sql(nurs_sql, table_or_query, missing_col, feature_col)
+    return plot_summary(summary, overall)
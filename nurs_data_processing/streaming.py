@@ -0,0 +1,227 @@
+"""
+Tools for summarizing the missingness of data sets too large to load in one piece.
+"""
+import numpy as np
+import pandas as pd
+
+
+class StreamSummary:
+    """
+    Single pass summary of a data set read as a sequence of chunks.
+    Records the number of rows, the null count and inferred data type of every column,
+    the vocabulary of every categorical column, a uniform random sample of at most
+    sample_size rows for fitting models on and, if keep_mask, a bit packed
+    missingness mask.
+
+    Peak memory is bounded by the chunk size plus the sample size, unless the
+    missingness mask is kept, which costs one bit per cell of the whole data set.
+
+    Parameters
+    ----------
+    sample_size: int [optional]
+        Maximum number of rows to keep in the sample.
+    max_categories: int [optional]
+        Maximum vocabulary size recorded per categorical column.
+    random_state: int [optional]
+        Seed for the sample.
+    keep_mask: bool [optional]
+        Keep the missingness mask of every row, see missing_mask.
+    """
+
+    # pylint: ignore=too-many-instance-attributes
+    def __init__(self, sample_size=100000, max_categories=10000, random_state=None,
+                 keep_mask=False):
+        self.sample_size = sample_size
+        self.keep_mask = keep_mask
+        self.max_categories = max_categories
+        self.random = np.random.default_rng(random_state)
+
+        self.n_rows = 0
+        self.columns = None
+        self.null_counts = None
+        self.dtypes = {}
+        self.vocabularies = {}
+        self.truncated_vocabularies = set()
+        self._mask_chunks = []
+        self._sample = None
+        self._sample_keys = None
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Add the next chunk of rows to the summary.
+        Parameters
+        ----------
+        chunk: pd.DataFrame
+            Rows of the data set, with the same columns as previous chunks.
+        Returns
+        -------
+        None
+        """
+        if self.columns is None:
+            self.columns = chunk.columns
+            self.null_counts = pd.Series(0, index=chunk.columns)
+
+        missing = chunk.isna()
+        self.null_counts += missing.sum()
+        if self.keep_mask:
+            self._mask_chunks.append((len(chunk), np.packbits(missing.values, axis=0)))
+
+        self._update_dtypes(chunk, missing.all())
+        self._update_vocabularies(chunk, missing.all())
+        self._update_sample(chunk)
+        self.n_rows += len(chunk)
+
+    def _update_dtypes(self, chunk, all_null):
+        """
+        Merge the data types of chunk into self.dtypes.  A column is categorical if it is
+        categorical in any chunk, otherwise the widest numeric type seen is kept.
+        Columns entirely null in chunk (which some readers return as object) are taken
+        to be float there, as their values are all NaN.
+        """
+        for col, dtype in chunk.dtypes.items():
+            if all_null[col]:
+                dtype = np.dtype("float64")
+            if col not in self.dtypes:
+                self.dtypes[col] = dtype
+            elif dtype == "object" or self.dtypes[col] == "object":
+                self.dtypes[col] = np.dtype("object")
+            else:
+                self.dtypes[col] = np.result_type(self.dtypes[col], dtype)
+
+    def _update_vocabularies(self, chunk, all_null):
+        """
+        Add the values of each categorical column of chunk to its vocabulary.
+        """
+        for col in chunk.columns[(chunk.dtypes == "object") & ~all_null]:
+            if col in self.truncated_vocabularies:
+                continue
+            vocabulary = self.vocabularies.setdefault(col, set())
+            vocabulary.update(chunk[col].dropna().unique())
+            if len(vocabulary) > self.max_categories:
+                self.truncated_vocabularies.add(col)
+
+    def _update_sample(self, chunk):
+        """
+        Keep the rows with the sample_size smallest random keys seen so far, which is
+        a uniform sample without replacement of all rows.
+        """
+        keys = self.random.random(len(chunk))
+        chunk = chunk.set_axis(pd.RangeIndex(self.n_rows, self.n_rows + len(chunk)))
+        if self._sample is None:
+            sample, sample_keys = chunk, keys
+        else:
+            sample = pd.concat([self._sample, chunk])
+            sample_keys = np.concatenate([self._sample_keys, keys])
+
+        if len(sample) > self.sample_size:
+            keep = np.sort(np.argpartition(sample_keys, self.sample_size)[:self.sample_size])
+            sample, sample_keys = sample.iloc[keep], sample_keys[keep]
+
+        self._sample, self._sample_keys = sample, sample_keys
+
+    @property
+    def sample(self) -> pd.DataFrame:
+        """
+        The sampled rows, in their original order, cast to the data types inferred over
+        the whole data set.
+        Returns
+        -------
+        pd.DataFrame
+        """
+        if self._sample is None:
+            return pd.DataFrame()
+        sample = self._sample.copy()
+        for col, dtype in self.dtypes.items():
+            if dtype == "object":
+                # Chunks may have read some of the values as numbers, whereas reading the
+                # whole file leaves every value of a categorical column as a string.
+                values = sample[col]
+                sample[col] = values.astype(str).where(values.notna(), np.nan).astype(object)
+            elif sample.dtypes[col] != dtype:
+                sample[col] = sample[col].astype(dtype)
+        return sample
+
+    @property
+    def missing_columns(self) -> pd.Index:
+        """
+        Columns with at least one null value anywhere in the data set.
+        Returns
+        -------
+        pd.Index
+        """
+        has_missing = self.null_counts > 0
+        return has_missing[has_missing].index
+
+    def missing_mask(self) -> pd.DataFrame:
+        """
+        Unpack the missingness mask of the whole data set.
+        Returns
+        -------
+        pd.DataFrame
+        """
+        if not self.keep_mask:
+            raise ValueError("The missingness mask is only kept when keep_mask=True")
+        blocks = [
+            np.unpackbits(packed, axis=0, count=n_rows).astype(bool)
+            for n_rows, packed in self._mask_chunks
+        ]
+        values = np.concatenate(blocks) if blocks else np.zeros((0, 0), dtype=bool)
+        return pd.DataFrame(values, columns=self.columns)
+
+
+def summarize_chunks(chunks, sample_size=100000, max_categories=10000,
+                     random_state=None, keep_mask=False) -> StreamSummary:
+    """
+    Summarize an iterable of data frame chunks in a single pass.
+    Parameters
+    ----------
+    chunks: iterable of pd.DataFrame
+        The data set, in pieces.
+    sample_size: int [optional]
+        Maximum number of rows to keep in the sample.
+    max_categories: int [optional]
+        Maximum vocabulary size recorded per categorical column.
+    random_state: int [optional]
+        Seed for the sample.
+    keep_mask: bool [optional]
+        Keep the missingness mask of every row.
+    Returns
+    -------
+    StreamSummary
+    """
+    summary = StreamSummary(sample_size, max_categories, random_state, keep_mask)
+    for chunk in chunks:
+        summary.update(chunk)
+    return summary
+
+
+def summarize_csv(file_path: str, chunksize=100000, sample_size=100000,
+                  max_categories=10000, random_state=None, columns=None,
+                  keep_mask=False) -> StreamSummary:
+    """
+    Summarize a csv file, reading chunksize rows at a time.
+    Parameters
+    ----------
+    file_path: str
+        path to data set
+    chunksize: int [optional]
+        Number of rows read at a time.
+    sample_size: int [optional]
+        Maximum number of rows to keep in the sample.
+    max_categories: int [optional]
+        Maximum vocabulary size recorded per categorical column.
+    random_state: int [optional]
+        Seed for the sample.
+    columns: list [optional]
+        Only read these columns.
+    keep_mask: bool [optional]
+        Keep the missingness mask of every row.
+    Returns
+    -------
+    StreamSummary
+    """
+    reader = pd.read_csv(file_path, chunksize=chunksize, usecols=columns)
+    try:
+        return summarize_chunks(reader, sample_size, max_categories, random_state, keep_mask)
+    finally:
+        reader.close()
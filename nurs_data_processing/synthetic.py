@@ -0,0 +1,91 @@
+"""
+Tools for generating synthetic data sets shaped like NuRS deliveries, with missingness
+injected by a known mechanism, for benchmarks and tests.
+"""
+import numpy as np
+import pandas as pd
+
+MECHANISMS = ("MCAR", "MAR", "MNAR")
+
+
+def synthetic_data(n_rows=1000, n_numeric=2, n_categorical=2, cardinality=6,
+                   mechanism="MAR", missing_rate=0.1, n_missing_columns=None,
+                   random_state=None) -> pd.DataFrame:
+    """
+    Generate a data set of normally distributed numeric columns ("Numeric 0", ...) and
+    uniformly distributed categorical columns ("Categorical 0", ...), then remove
+    values from some of them.
+
+    The missingness mechanism is one of:
+        MCAR - values are missing completely at random.
+        MAR - whether a value is missing depends on another (observed) column.
+        MNAR - whether a value is missing depends on the value itself.
+    For MAR and MNAR each category, or each numeric value, is given a score and the
+    missing_rate of cases with the highest (noisy) scores lose their value.
+
+    Parameters
+    ----------
+    n_rows: int [optional]
+        Number of cases.
+    n_numeric: int [optional]
+        Number of numeric columns.
+    n_categorical: int [optional]
+        Number of categorical columns.
+    cardinality: int [optional]
+        Number of classes of each categorical column.
+    mechanism: str [optional]
+        "MCAR", "MAR" or "MNAR".
+    missing_rate: float [0 < q < 1]
+        Proportion of values removed from each column with missing data.
+    n_missing_columns: int [optional]
+        Number of columns to remove values from, by default half of them (at least one).
+    random_state: int [optional]
+        Seed for reproducible data.
+    Returns
+    -------
+    pd.DataFrame
+    """
+    mechanism = mechanism.upper()
+    if mechanism not in MECHANISMS:
+        raise ValueError(f"mechanism must be one of {MECHANISMS}, not '{mechanism}'")
+    if n_numeric + n_categorical < 1:
+        raise ValueError("Expecting at least one column")
+
+    random = np.random.default_rng(random_state)
+    columns = {f"Numeric {i}": random.normal(size=n_rows) for i in range(n_numeric)}
+    classes = np.array([f"Class {i}" for i in range(cardinality)], dtype=object)
+    columns.update({
+        f"Categorical {i}": classes[random.integers(cardinality, size=n_rows)]
+        for i in range(n_categorical)
+    })
+    data = pd.DataFrame(columns)
+
+    if n_missing_columns is None:
+        n_missing_columns = max(data.shape[1] // 2, 1)
+    names = list(data.columns)
+    masks = {}
+    for position in random.choice(len(names), n_missing_columns, replace=False):
+        target = names[position]
+        if mechanism == "MCAR":
+            masks[target] = random.random(n_rows) < missing_rate
+            continue
+        # MAR is driven by the next column along, MNAR by the column itself.
+        driver = target if mechanism == "MNAR" else names[(position + 1) % len(names)]
+        score = _score(data[driver], random) + random.normal(scale=0.5, size=n_rows)
+        masks[target] = score > np.quantile(score, 1 - missing_rate)
+
+    for target, mask in masks.items():
+        data.loc[mask, target] = None
+    return data
+
+
+def _score(column: pd.Series, random) -> np.ndarray:
+    """
+    Standardized values of a numeric column, or a random standard normal score per
+    class of a categorical column.
+    """
+    if column.dtype == "object":
+        codes, classes = pd.factorize(column)
+        return random.normal(size=len(classes))[codes]
+    values = column.to_numpy(dtype=float)
+    return (values - values.mean()) / (values.std() or 1)
@@ -1,3 +1,5 @@
+import pytest
+import pandas as pd
 from nurs_data_processing.cli import mine_missing_features as mmf
 from .. import test_data_path, test_data_folder
 
@@ -8,3 +10,90 @@ def test_main(test_data_path):
 
 def test_main_to_file(test_data_path):
     mmf.main([test_data_path, "-m", "markdown", "-e", "temp.md"])
+
+
+def test_main_parallel(test_data_path):
+    mmf.main([test_data_path, "-j", "2", "-r", "0"])
+
+
+def test_main_cached(test_data_path, tmp_path):
+    mmf.main([test_data_path, "-r", "0", "--cache-dir", str(tmp_path)])
+    mmf.main([test_data_path, "-r", "0", "--cache-dir", str(tmp_path)])
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_main_columns(test_data_path):
+    mmf.main([test_data_path, "--columns", "A,D"])
+
+
+def test_main_all_sheets(test_data_path, tmp_path):
+    path = str(tmp_path / "workbook.xlsx")
+    data = pd.read_csv(test_data_path, index_col=0)
+    with pd.ExcelWriter(path) as writer:
+        data.to_excel(writer, sheet_name="First", index=False)
+        data.to_excel(writer, sheet_name="Second", index=False)
+    report = str(tmp_path / "report.md")
+    mmf.main([path, "--all-sheets", "-j", "2", "-m", "markdown", "-e", report])
+    with open(report) as file:
+        assert file.read().count("# Sheet:") == 2
+
+
+def test_main_batch(test_data_path, tmp_path):
+    folder = tmp_path / "delivery"
+    folder.mkdir()
+    data = pd.read_csv(test_data_path, index_col=0)
+    for i in range(2):
+        data.to_csv(folder / f"file_{i}.csv")
+    output_dir = tmp_path / "reports"
+    mmf.main([str(folder), "-j", "2", "-o", str(output_dir)])
+    assert (output_dir / "index.md").exists()
+    assert (output_dir / "manifest.json").exists()
+
+
+def test_main_profile(test_data_path, capsys):
+    mmf.main([test_data_path, "--profile"])
+    output = capsys.readouterr().out
+    assert "Hottest stages:" in output
+    assert "| fit" in output
+
+
+@pytest.mark.parametrize("method, name", [("jsonl", "report.jsonl"), ("parquet", "report.parquet")])
+def test_main_report_formats(test_data_path, tmp_path, method, name):
+    path = tmp_path / name
+    mmf.main([test_data_path, "-m", method, "-e", str(path)])
+    assert path.stat().st_size > 0
+
+
+def test_main_progress(test_data_path, capsys):
+    mmf.main([test_data_path])
+    assert "[1/3] mined column A" in capsys.readouterr().err
+    mmf.main([test_data_path, "--quiet"])
+    assert "mined column" not in capsys.readouterr().err
+
+
+def test_main_interrupted(test_data_path, tmp_path, monkeypatch):
+    from nurs_data_processing import api
+
+    def interrupted(*args, progress=None, writer=None, **kwargs):
+        result = api.mine_missing(pd.read_csv(test_data_path, index_col=0))[0]
+        writer.write(result)
+        progress(1, 2, result)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(api, "mine_missing_from_file", interrupted)
+    report = tmp_path / "report.md"
+    assert mmf.main([test_data_path, "-m", "markdown", "-e", str(report)]) == 130
+    assert report.read_text().count("## Column:") == 1
+
+
+def test_main_batch_rejects_export_options(test_data_path, tmp_path, capsys):
+    assert mmf.main([test_data_path, "-o", str(tmp_path), "-m", "jsonl"]) == 2
+    assert "--method" in capsys.readouterr().err
+
+
+def test_main_rejects_missing_paths(tmp_path, capsys):
+    output_dir = tmp_path / "reports"
+    assert mmf.main([str(tmp_path / "nomatch*.csv"), "-o", str(output_dir)]) == 2
+    assert mmf.main([str(tmp_path / "nope.csv")]) == 2
+    assert "No such file" in capsys.readouterr().err
+    assert not output_dir.exists()
@@ -1,7 +1,86 @@
+import os
+import pytest
+import pandas as pd
 from . import test_data_path, test_data_folder
-from ..api import mine_missing, mine_missing_from_file
+from ..api import mine_missing, mine_missing_from_file, mine_missing_from_workbook
 from .utilities import missing_mining_checks
 
 def test_mine_from_file(test_data_path):
     result = mine_missing_from_file(test_data_path)
     missing_mining_checks(result, n=3)
+
+
+def test_mine_from_file_chunked(test_data_path):
+    result = mine_missing_from_file(test_data_path, chunksize=100, sample_size=500, random_state=0)
+    missing_mining_checks(result, n=3)
+
+
+def test_mine_chunked_reports_unsampled_columns(tmp_path):
+    data = pd.DataFrame({"A": range(20000), "B": ["x", "y"] * 10000})
+    data["A"] = data["A"].astype(float)
+    data.loc[data.index[-3:], "A"] = None
+    path = str(tmp_path / "late_nulls.csv")
+    data.to_csv(path, index=False)
+    result = mine_missing_from_file(path, chunksize=1000, sample_size=500, random_state=0)
+    assert len(result) == 0
+    assert result.unmined == ["A"]
+
+
+def test_mine_chunked_requires_csv(test_data_folder):
+    with pytest.raises(TypeError):
+        mine_missing_from_file(f"{test_data_folder}missing_data.xlsx", chunksize=100)
+
+
+def test_mine_from_parquet(test_data_path, tmp_path):
+    path = str(tmp_path / "missing_data.parquet")
+    pd.read_csv(test_data_path, index_col=0).to_parquet(path)
+    result = mine_missing_from_file(path, columns=["A", "C", "D"])
+    missing_mining_checks(result, n=2)
+
+
+def test_mine_from_file_columns(test_data_path):
+    result = mine_missing_from_file(test_data_path, columns=["B", "D"])
+    missing_mining_checks(result, n=1)
+
+
+@pytest.fixture
+def workbook_path(test_data_path, tmp_path):
+    data = pd.read_csv(test_data_path, index_col=0)
+    path = str(tmp_path / "workbook.xlsx")
+    with pd.ExcelWriter(path) as writer:
+        data.to_excel(writer, sheet_name="First", index=False)
+        data[["A", "D"]].to_excel(writer, sheet_name="Second", index=False)
+    return path
+
+
+def test_mine_all_sheets(workbook_path):
+    results = mine_missing_from_file(workbook_path, sheet_name=None, n_jobs=2, random_state=0)
+    assert list(results) == ["First", "Second"]
+    missing_mining_checks(results["First"], n=3)
+    missing_mining_checks(results["Second"], n=1)
+
+
+def test_mine_workbook_sidecar(workbook_path, tmp_path):
+    sidecar_dir = str(tmp_path / "sidecar")
+    first = mine_missing_from_workbook(workbook_path, random_state=0, sidecar_dir=sidecar_dir)
+    second = mine_missing_from_workbook(workbook_path, random_state=0, sidecar_dir=sidecar_dir)
+    assert len(os.listdir(sidecar_dir)) == 4
+    assert [i.Score for i in first["First"]] == [i.Score for i in second["First"]]
+
+
+def test_mine_workbook_hooks(workbook_path):
+    calls = []
+    results = mine_missing_from_workbook(
+        workbook_path, random_state=0, progress=lambda *args: calls.append(args[:2]),
+        cancel=lambda: True, screening_alpha=0.05
+    )
+    assert calls == [(1, 4), (2, 4), (3, 4)]
+    assert all(i.Screening is not None for i in results["First"])
+    assert len(results["Second"]) == 0
+    assert results["Second"].unmined == ["A"]
+
+
+def test_mine_workbook_time_budget(workbook_path):
+    results = mine_missing_from_workbook(workbook_path, time_budget=0)
+    assert [len(i) for i in results.values()] == [0, 0]
+    assert results["First"].unmined == ["A", "B", "C"]
@@ -0,0 +1,104 @@
+import os
+import shutil
+
+from ..batch import BatchManifest, expand_paths, mine_batch, report_name, unmatched_paths
+from . import test_data_path, test_data_folder
+
+
+def make_delivery(test_data_path, folder, n_files=3):
+    os.makedirs(folder, exist_ok=True)
+    for i in range(n_files):
+        shutil.copy(test_data_path, os.path.join(folder, f"file_{i}.csv"))
+    with open(os.path.join(folder, "notes.txt"), "w") as file:
+        file.write("not data")
+    return folder
+
+
+def test_expand_paths(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"))
+    assert len(expand_paths([folder])) == 3
+    assert len(expand_paths([os.path.join(folder, "file_[01].csv")])) == 2
+    assert expand_paths([folder, os.path.join(folder, "*.csv")]) == expand_paths([folder])
+    missing = [os.path.join(folder, "nope.csv"), os.path.join(folder, "nomatch*.csv")]
+    assert unmatched_paths([folder] + missing) == missing
+
+
+def test_mine_batch(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"))
+    output_dir = str(tmp_path / "reports")
+    manifest = mine_batch([folder], output_dir, n_jobs=2, random_state=0)
+
+    table = manifest.to_frame()
+    assert (table["Status"] == "done").all()
+    assert len(table) == 3
+    for file_path in expand_paths([folder]):
+        assert os.path.exists(os.path.join(output_dir, report_name(file_path)))
+    with open(os.path.join(output_dir, "index.md")) as file:
+        assert file.read().count(".md)") == 3
+
+
+def test_mine_batch_resumes(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"))
+    output_dir = str(tmp_path / "reports")
+    first = os.path.join(folder, "file_0.csv")
+    mine_batch([first], output_dir, random_state=0)
+    report = os.path.join(output_dir, report_name(first))
+    modified = os.path.getmtime(report)
+
+    manifest = mine_batch([folder], output_dir, random_state=0)
+    assert len(manifest.entries) == 3
+    assert os.path.getmtime(report) == modified
+
+
+def test_mine_batch_records_failures(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"), n_files=1)
+    broken = os.path.join(folder, "broken.xlsx")
+    with open(broken, "w") as file:
+        file.write("not a workbook")
+
+    manifest = mine_batch([folder], str(tmp_path / "reports"))
+    table = manifest.to_frame().set_index("File")
+    assert table.loc[broken, "Status"] == "failed"
+    assert not manifest.is_done(broken)
+    assert BatchManifest(manifest.path).entries == manifest.entries
+
+
+def test_mine_batch_records_missing_files(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"), n_files=1)
+    missing = os.path.join(folder, "nope.csv")
+    output_dir = str(tmp_path / "reports")
+    manifest = mine_batch([folder, missing], output_dir)
+    table = manifest.to_frame().set_index("File")
+    assert table.loc[missing, "Status"] == "failed"
+    assert "FileNotFoundError" in table.loc[missing, "Error"]
+    assert os.path.exists(os.path.join(output_dir, "index.md"))
+
+
+def test_mine_batch_profile(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"), n_files=1)
+    output_dir = str(tmp_path / "reports")
+    mine_batch([folder], output_dir, profile=True)
+    report = os.path.join(output_dir, report_name(expand_paths([folder])[0]))
+    with open(report) as file:
+        assert "# Profile" in file.read()
+
+
+def test_mine_batch_remines_on_new_settings(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"), n_files=1)
+    output_dir = str(tmp_path / "reports")
+    file_path = expand_paths([folder])[0]
+    manifest = mine_batch([folder], output_dir, random_state=0)
+    assert manifest.is_done(file_path, 0, {"random_state": 0, "sheet_name": 0})
+    assert not manifest.is_done(file_path, 0, {"random_state": 1, "sheet_name": 0})
+
+    report = os.path.join(output_dir, report_name(file_path))
+    os.utime(report, (0, 0))
+    mine_batch([folder], output_dir, random_state=1)
+    assert os.path.getmtime(report) > 0
+
+
+def test_mine_batch_partial_not_done(test_data_path, tmp_path):
+    folder = make_delivery(test_data_path, str(tmp_path / "delivery"), n_files=1)
+    manifest = mine_batch([folder], str(tmp_path / "reports"), time_budget=0)
+    assert list(manifest.to_frame()["Status"]) == ["partial"]
+    assert not manifest.is_done(expand_paths([folder])[0])
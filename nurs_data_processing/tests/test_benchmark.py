@@ -0,0 +1,19 @@
+import json
+
+from ..benchmark import STAGES, benchmark_stages, main
+from ..synthetic import synthetic_data
+
+
+def test_benchmark_stages():
+    timings = benchmark_stages(synthetic_data(n_rows=200, random_state=0))
+    assert tuple(timings) == STAGES
+    assert all(i >= 0 for i in timings.values())
+
+
+def test_benchmark_main(tmp_path):
+    output = tmp_path / "results.json"
+    main(["--rows", "100", "200", "--mechanisms", "MCAR", "--repeat", "1", "-o", str(output)])
+    with open(output) as file:
+        results = json.load(file)
+    assert [i["config"]["n_rows"] for i in results["runs"]] == [100, 200]
+    assert set(results["environment"]) >= {"version", "commit", "python"}
@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 import pandas as pd
-from ..encoded_label_data import EncodedLabelData
+from ..encoded_label_data import EncodedLabelData, CodedLabelData, SparseFrame
 
 
 @pytest.fixture
@@ -29,3 +29,89 @@ def test_binarizer_nans(eld_fixture: EncodedLabelData):
     binarized = eld_fixture.label_binarize_column(value)
     assert ("Test", "NaN") in binarized.columns
     assert all(map(all, binarized.values == np.identity(4)))
+
+
+def test_binarizer_sparse(eld_fixture: EncodedLabelData):
+    value = pd.Series(list("ABC"), name="Test")
+    binarized = eld_fixture.label_binarize_column(value, sparse_output=True)
+    assert isinstance(binarized, SparseFrame)
+    assert ("Test", "A") in binarized.columns
+    assert all(map(all, binarized.values.toarray() == np.identity(3)))
+
+
+def test_sparse_auto():
+    eld = EncodedLabelData(pd.DataFrame({
+        "Wide": [f"value {i}" for i in range(100)],
+        "Narrow": np.random.choice(list("ABC"), 100)
+    }), sparse="auto")
+    assert isinstance(eld["Wide"], SparseFrame)
+    assert eld["Wide"].shape == (100, 100)
+    assert isinstance(eld["Narrow"], pd.DataFrame)
+    assert eld.is_sparse
+
+
+def test_sparse_forced(eld_fixture: EncodedLabelData):
+    eld = EncodedLabelData(eld_fixture.data, sparse=True)
+    assert isinstance(eld["A"], SparseFrame)
+    assert not EncodedLabelData(eld_fixture.data, sparse=False).is_sparse
+
+
+def test_coded_label_data(eld_fixture: EncodedLabelData):
+    coded = CodedLabelData(eld_fixture.data)
+    assert coded["A"].shape == (40, 1)
+    assert list(coded["A"].columns) == ["A"]
+    assert coded["A"]["A"].min() >= 0
+
+
+def test_code_column_nans():
+    value = pd.Series(["A", "B", None, "A"], name="Test")
+    frame, categories = CodedLabelData.code_column(value)
+    assert "NaN" in categories
+    assert len(set(frame["Test"])) == 3
+
+
+def test_lazy_encoding(eld_fixture: EncodedLabelData):
+    eld = EncodedLabelData(eld_fixture.data, lazy=True)
+    assert eld.cache_info().Resident == 0
+    assert eld["A"].shape == (40, 3)
+    eld["A"]
+    info = eld.cache_info()
+    assert (info.Hits, info.Misses, info.Resident) == (1, 1, 1)
+
+
+def test_memory_budget_evicts_largest():
+    data = pd.DataFrame({
+        "Small": np.random.choice(list("AB"), 100),
+        "Large": [f"value {i % 10}" for i in range(100)],
+        "Medium": np.random.choice(list("ABCD"), 100),
+    })
+    eld = EncodedLabelData(data, sparse=False, lazy=True)
+    sizes = {col: eld.encoding_size(eld[col]) for col in data.columns}
+
+    budget = sizes["Small"] + sizes["Medium"]
+    eld = EncodedLabelData(data, sparse=False, lazy=True, memory_budget=budget)
+    eld["Large"]
+    eld["Small"]
+    eld["Medium"]
+    assert set(eld.frames) == {"Small", "Medium"}
+    assert eld.cache_info().Evictions == 1
+    assert eld.cache_info().Bytes <= budget
+    assert eld["Large"].shape == (100, 10)
+    assert eld.cache_info().Misses == 4
+
+
+@pytest.mark.parametrize("sparse", [True, False])
+def test_append(sparse):
+    data = pd.DataFrame({"A": list("ABCA"), "B": list("XYXY")})
+    new_data = pd.DataFrame({"A": ["C", None], "B": ["X", "X"]})
+    eld = EncodedLabelData(data, sparse=sparse)
+    eld.append(new_data)
+    rebuilt = EncodedLabelData(pd.concat([data, new_data], ignore_index=True), sparse=sparse)
+    for col in ["A", "B"]:
+        appended, expected = eld[col], rebuilt[col]
+        assert list(appended.columns) == list(expected.columns)
+        if sparse:
+            appended, expected = appended.values.toarray(), expected.values.toarray()
+        else:
+            appended, expected = appended.values, expected.values
+        assert (appended == expected).all()
@@ -0,0 +1,41 @@
+import pytest
+from sklearn.impute import SimpleImputer
+from ..encoded_label_data import EncodedLabelData
+from ..feature_store import FeatureStore
+from ..missing_classifier import MissingClassifier
+from .fixtures import missing_data
+
+
+@pytest.fixture
+def feature_store(missing_data):
+    categorical, numeric = MissingClassifier.divide_by_data_type(missing_data, "object")
+    return FeatureStore(numeric, EncodedLabelData(categorical), SimpleImputer())
+
+
+def test_slices(feature_store):
+    assert feature_store.slices["Numeric"] == slice(0, 1)
+    assert feature_store.slices["Categorical"] == slice(1, 2)
+    assert feature_store.slices["Missing"] == slice(2, 6)
+    assert len(feature_store.columns) == 6
+
+
+def test_features(feature_store):
+    features = feature_store.features("Missing")
+    assert list(features.columns) == ["Numeric", ("Categorical", "B")]
+
+
+def test_features_unknown_column(feature_store):
+    features = feature_store.features("Other")
+    assert features.shape[1] == 6
+
+
+def test_sparse_design(missing_data, feature_store):
+    categorical, numeric = MissingClassifier.divide_by_data_type(missing_data, "object")
+    sparse_store = FeatureStore(
+        numeric, EncodedLabelData(categorical, sparse=True), SimpleImputer()
+    )
+    assert sparse_store.sparse
+    matrix, columns = sparse_store.design("Missing")
+    dense, dense_columns = feature_store.design("Missing")
+    assert list(columns) == list(dense_columns)
+    assert (matrix.toarray() == dense.values).all()
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ..incremental import IncrementalMiner
+from ..missing_classifier import MissingClassifier
+from .utilities import missing_mining_checks
+from . import test_data_path, test_data_folder
+
+
+@pytest.fixture
+def test_data(test_data_path):
+    return pd.read_csv(test_data_path, index_col=0)
+
+
+def test_mine(test_data):
+    report = IncrementalMiner(test_data.iloc[:800], random_state=0).mine()
+    missing_mining_checks(report.Results, n=3)
+    assert report.Remined == ["A", "B", "C"]
+    assert report.Skipped == []
+
+
+def test_append_skips_stable_columns(test_data):
+    miner = IncrementalMiner(test_data.iloc[:800], threshold=0.01, random_state=0)
+    first = miner.mine()
+
+    new_rows = test_data.iloc[800:].copy()
+    new_rows["C"] = np.nan
+    report = miner.append(new_rows)
+    assert report.Remined == ["C"]
+    assert report.Skipped == ["A", "B"]
+    assert report.Runtime > 0
+    missing_mining_checks(report.Results, n=3)
+    assert report.Results[0] is first.Results[0]
+
+
+def test_append_new_missing_column(test_data):
+    data = test_data.iloc[:800].fillna({"A": 0.0})
+    miner = IncrementalMiner(data, threshold=1.0, random_state=0)
+    miner.mine()
+    report = miner.append(test_data.iloc[800:])
+    assert "A" in report.Remined
+
+
+def test_append_rows_matches_rebuild(test_data):
+    classifier = MissingClassifier(test_data.iloc[:800], random_state=0)
+    classifier.append_rows(test_data.iloc[800:])
+    rebuilt = MissingClassifier(test_data.reset_index(drop=True), random_state=0)
+
+    assert all(classifier.null_counts == rebuilt.null_counts)
+    for col in rebuilt.missing_columns:
+        appended_x, appended_y = classifier.prepare_data(col)
+        rebuilt_x, rebuilt_y = rebuilt.prepare_data(col)
+        assert list(appended_x.columns) == list(rebuilt_x.columns)
+        assert np.allclose(appended_x.values, rebuilt_x.values)
+        assert (appended_y.values == rebuilt_y.values).all()
+
+
+def test_append_rows_codes(test_data):
+    classifier = MissingClassifier(test_data.iloc[:800], encoding="codes")
+    new_rows = test_data.iloc[800:].copy()
+    new_rows.loc[new_rows.index[0], "D"] = "Unseen"
+    classifier.append_rows(new_rows)
+    codes = classifier.encoded_categorical_data["D"]["D"]
+    categories = classifier.encoded_categorical_data.categories["D"]
+    assert len(codes) == len(test_data)
+    assert categories[codes.iloc[800]] == "Unseen"
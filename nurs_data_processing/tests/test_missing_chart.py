@@ -1,5 +1,12 @@
-from ..missing_chart import metrics, group_vector
+import numpy as np
+import pandas as pd
+import pytest
+from ..missing_chart import (
+    metrics, group_vector, jeffreys_interval, summary_from_counts, missing_summary,
+    missing_summary_table, missing_chart
+)
 from .fixtures import missing_data
+from . import test_data_path, test_data_folder
 
 
 def test_categorical_metrics(missing_data):
@@ -30,3 +37,67 @@ def test_group_vector_numeric(missing_data):
     vector = group_vector(missing_data, "Numeric")
     unique = vector.unique()
     assert len(unique) == 10
+
+
+def test_jeffreys_interval_arrays():
+    result = jeffreys_interval(np.array([0, 5, 10]), np.array([10, 10, 10]))
+    assert result["Missing"].shape == (3,)
+    assert np.isclose(result["Missing"][1], 0.5)
+    assert np.isclose(result["Lower"][1], result["Upper"][1])
+
+
+def test_summary_from_counts():
+    feature = pd.Series(["A", "B"], index=["A", "B"])
+    summary = summary_from_counts(feature, [10, 20], [1, 2])
+    assert list(summary.columns) == ["Feature", "Missing", "Lower", "Upper"]
+    assert np.isclose(
+        summary.loc["A", "Missing"], jeffreys_interval(1, 10)["Missing"]
+    )
+
+
+@pytest.mark.parametrize("feature_col", ["Categorical", "Numeric", "Missing"])
+def test_missing_summary_matches_metrics(missing_data, feature_col):
+    summary = missing_summary(missing_data, "Missing", feature_col)
+    expected = pd.DataFrame({
+        i: metrics(df, "Missing", feature_col)
+        for i, df in missing_data.groupby(group_vector(missing_data, feature_col))
+    }).T
+    assert list(summary.index) == list(expected.index)
+    for col in ["Missing", "Lower", "Upper"]:
+        assert np.allclose(summary[col], expected[col].astype(float))
+    if feature_col == "Numeric":
+        assert np.allclose(summary["Feature"], expected["Feature"].astype(float))
+    else:
+        assert list(summary["Feature"]) == list(expected["Feature"])
+
+
+def test_missing_chart(missing_data):
+    lines = missing_chart(missing_data, "Missing", "Numeric")
+    assert len(lines.get_segments()) == 1
+
+
+def test_missing_summary_table(test_data_path):
+    data = pd.read_csv(test_data_path, index_col=0)
+    table = missing_summary_table(data)
+    assert list(table["Missing Column"].unique()) == ["A", "B", "C"]
+    assert not (table["Missing Column"] == table["Feature Column"]).any()
+
+    pair = table[(table["Missing Column"] == "C") & (table["Feature Column"] == "A")]
+    expected = missing_summary(data, "C", "A")
+    assert list(pair["Group"]) == list(expected.index)
+    assert np.allclose(pair["Missing"], expected["Missing"])
+    assert np.allclose(pair["Upper"], expected["Upper"])
+    assert np.allclose(pair["Feature"].astype(float), expected["Feature"])
+
+    pair = table[(table["Missing Column"] == "A") & (table["Feature Column"] == "D")]
+    expected = missing_summary(data, "A", "D")
+    assert list(pair["Feature"]) == list(expected["Feature"])
+    assert np.allclose(pair["Lower"], expected["Lower"])
+
+
+def test_missing_summary_table_selection(missing_data):
+    table = missing_summary_table(
+        missing_data, missing_cols=["Missing"], feature_cols=["Categorical"]
+    )
+    assert len(table) == 2
+    assert table["N"].sum() == len(missing_data)
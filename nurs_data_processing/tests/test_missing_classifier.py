@@ -1,8 +1,15 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+import pandas as pd
 from ..missing_classifier import MissingClassifier
 from ..missing_results import MissingResults
+from ..synthetic import synthetic_data
+from ..time_budget import SHALLOW
 from .fixtures import missing_data
+from . import test_data_path, test_data_folder
 from sklearn import base
+from scipy import sparse
 
 
 @pytest.fixture
@@ -34,3 +41,199 @@ def test_all_columns(missing_classifier):
     results = missing_classifier.test_all_columns()
     assert isinstance(results, MissingResults)
     assert len(results) == 1
+
+
+def test_column_seed_reproducible(missing_data):
+    first = MissingClassifier(missing_data, random_state=42)
+    second = MissingClassifier(missing_data, random_state=42)
+    assert first.column_seed("Missing") == second.column_seed("Missing")
+    assert first.column_seed("Missing") != first.column_seed("Numeric")
+    assert MissingClassifier(missing_data).column_seed("Missing") is None
+
+
+def test_all_columns_parallel(test_data_path):
+    data = pd.read_csv(test_data_path, index_col=0)
+    classifier = MissingClassifier(data, random_state=0)
+    sequential = classifier.test_all_columns()
+    parallel = classifier.test_all_columns(n_jobs=2)
+    assert [i.Variable for i in parallel] == list(classifier.missing_columns)
+    for seq, par in zip(sequential, parallel):
+        assert seq.Score == par.Score
+        assert all(seq.Model.feature_importances_ == par.Model.feature_importances_)
+
+
+def test_all_columns_executor(missing_classifier):
+    with ThreadPoolExecutor(2) as executor:
+        results = missing_classifier.test_all_columns(executor=executor)
+    assert len(results) == 1
+
+
+def test_shared_features_match(test_data_path):
+    data = pd.read_csv(test_data_path, index_col=0)
+    shared = MissingClassifier(data, random_state=0)
+    rebuilt = MissingClassifier(data, random_state=0, shared_features=False)
+    for col in shared.missing_columns:
+        shared_x, _ = shared.prepare_data(col)
+        rebuilt_x, _ = rebuilt.prepare_data(col)
+        pd.testing.assert_frame_equal(shared_x, rebuilt_x)
+        assert shared.test_column(col).Score == rebuilt.test_column(col).Score
+
+
+def test_column_sparse(missing_data):
+    classifier = MissingClassifier(missing_data, sparse=True)
+    data_x, _, features = classifier.prepare_design("Missing")
+    assert sparse.issparse(data_x)
+    result = classifier.test_column("Missing")
+    assert len(result.Features) == 2
+    assert len(result.Model.feature_importances_) == 2
+
+
+def test_column_codes(missing_data):
+    classifier = MissingClassifier(missing_data, encoding="codes")
+    result = classifier.test_column("Missing")
+    assert list(result.Features) == ["Numeric", "Categorical"]
+
+
+def test_unknown_encoding(missing_data):
+    with pytest.raises(ValueError):
+        MissingClassifier(missing_data, encoding="other")
+
+
+def test_lazy_classifier(missing_data):
+    classifier = MissingClassifier(missing_data, lazy=True, memory_budget=10 ** 6)
+    assert classifier.encoded_categorical_data.cache_info().Resident == 0
+    assert not classifier.shared_features
+    result = classifier.test_column("Missing")
+    assert len(result.Features) == 2
+
+
+def test_column_subsampled(test_data_path):
+    data = pd.read_csv(test_data_path, index_col=0)
+    classifier = MissingClassifier(data, random_state=0, max_rows=200)
+    result = classifier.test_column("C")
+    assert abs(result.SampleSize - 200) <= 10
+    assert 0 < result.ClassBalance < 1
+
+    full = MissingClassifier(data, random_state=0).test_column("C")
+    assert full.SampleSize == len(data)
+
+
+def test_column_subsampled_before_design(test_data_path):
+    data = pd.read_csv(test_data_path, index_col=0)
+    classifier = MissingClassifier(data, random_state=0, max_rows=200, memory_budget=10 ** 6,
+                                   profile=True)
+    assert not classifier.shared_features
+    result = classifier.test_column("C")
+    rows = {i.Stage: i.Rows for i in result.Profile}
+    assert rows["imputation"] == rows["encoding"] == result.SampleSize < len(data)
+
+
+def test_column_profiled(missing_data):
+    classifier = MissingClassifier(missing_data, profile=True)
+    stages = [i.Stage for i in classifier.test_column("Missing").Profile]
+    assert stages == ["sample", "design", "split", "fit", "score"]
+    assert MissingClassifier(missing_data).test_column("Missing").Profile is None
+
+
+def test_column_profiled_unshared(missing_data):
+    classifier = MissingClassifier(missing_data, profile=True, shared_features=False)
+    profile = classifier.test_column("Missing").Profile
+    assert [i.Stage for i in profile[:4]] == ["sample", "imputation", "encoding", "concat"]
+    assert profile[3].Features == 2
+
+
+def test_all_columns_profiled(missing_data):
+    results = MissingClassifier(missing_data, profile=True).test_all_columns()
+    assert [i.Stage for i in results.shared_profile] == ["feature_store"]
+
+
+@pytest.fixture
+def synthetic_classifier():
+    data = synthetic_data(n_rows=300, n_numeric=3, n_categorical=3, n_missing_columns=4,
+                          random_state=0)
+    return MissingClassifier(data, random_state=0)
+
+
+def test_iter_columns(synthetic_classifier):
+    calls = []
+    results = list(synthetic_classifier.iter_columns(
+        progress=lambda n_done, n_total, result: calls.append((n_done, n_total, result.Variable))
+    ))
+    assert [i.Variable for i in results] == list(synthetic_classifier.missing_columns)
+    assert [i[:2] for i in calls] == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_iter_columns_parallel(synthetic_classifier, n_jobs):
+    with ThreadPoolExecutor(2) as executor:
+        threaded = {i.Variable: i.Score for i in synthetic_classifier.iter_columns(executor=executor)}
+    pooled = {i.Variable: i.Score for i in synthetic_classifier.iter_columns(n_jobs=n_jobs)}
+    assert threaded == pooled
+
+
+def test_iter_columns_closed_early(synthetic_classifier):
+    columns = synthetic_classifier.iter_columns(n_jobs=2)
+    first = next(columns)
+    columns.close()
+    assert first.Variable in synthetic_classifier.missing_columns
+
+
+def test_all_columns_cancelled(synthetic_classifier):
+    calls = []
+    results = synthetic_classifier.test_all_columns(
+        progress=lambda *args: calls.append(args), cancel=lambda: len(calls) == 2
+    )
+    assert len(results) == 2
+    assert [i.Variable for i in results] == list(synthetic_classifier.missing_columns[:2])
+
+
+def test_column_shallow(synthetic_classifier):
+    col = synthetic_classifier.missing_columns[0]
+    result = synthetic_classifier.test_column(col, SHALLOW)
+    assert result.Strategy == "shallow"
+    assert result.Model.get_depth() <= SHALLOW.MaxDepth
+    assert synthetic_classifier.test_column(col).Strategy == "full"
+
+
+def test_all_columns_time_budget(synthetic_classifier):
+    results = synthetic_classifier.test_all_columns(time_budget=600)
+    assert [i.Variable for i in results] == list(synthetic_classifier.missing_columns)
+    assert {i.Strategy for i in results} == {"full"}
+    assert results.unmined == []
+
+
+def test_all_columns_out_of_time(synthetic_classifier):
+    results = synthetic_classifier.test_all_columns(time_budget=0)
+    assert len(results) == 0
+    assert results.unmined == list(synthetic_classifier.missing_columns)
+    assert "## Unmined columns" in results.to_markdown()
+
+
+def test_all_columns_screened():
+    data = synthetic_data(n_rows=300, n_numeric=3, n_categorical=3, n_missing_columns=3,
+                          mechanism="MCAR", random_state=0)
+    classifier = MissingClassifier(data, random_state=0, screening_alpha=1e-6)
+    results = classifier.test_all_columns()
+    assert [i.Variable for i in results] == list(classifier.missing_columns)
+    assert {i.Strategy for i in results} == {"screened"}
+    assert all(i.Screening > 1e-6 for i in results)
+    assert "### Strategy: screened" in results.to_markdown()
+
+
+def test_all_columns_screening_keeps_signal(synthetic_classifier):
+    synthetic_classifier.screening_alpha = 0.05
+    results = synthetic_classifier.test_all_columns()
+    assert {i.Strategy for i in results} == {"full"}
+    assert all(i.Screening < 0.05 for i in results)
+    assert "### Screening p-value:" in results.to_markdown()
+
+
+def test_all_columns_time_budget_holds():
+    data = synthetic_data(n_rows=50000, n_numeric=6, n_categorical=6, n_missing_columns=12,
+                          random_state=0)
+    classifier = MissingClassifier(data, random_state=0)
+    start = time.perf_counter()
+    results = classifier.test_all_columns(time_budget=1)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 2
+    assert len(results) + len(results.unmined) == 12
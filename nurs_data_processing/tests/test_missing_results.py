@@ -1,6 +1,9 @@
+import pickle
 import pytest
-from ..missing_results import MissingResults
-from ..model_result import ClassifierResult
+import pandas as pd
+from ..missing_results import MissingResults, combined_markdown
+from ..missing_classifier import MissingClassifier
+from ..model_result import ClassifierResult, CompactResult, FeatureTable
 from .test_missing_classifier import missing_classifier, missing_data
 
 @pytest.fixture
@@ -54,3 +57,97 @@ def test_format_string_1(model_result):
 def test_format_string_2(model_result):
     string = model_result.format_feature_string(("A", "1"))
     assert string == "Variable:A, Value:1"
+
+
+def test_aggregate_by_variable(model_result):
+    frm = pd.DataFrame({
+        "Feature": ["A", ("B", "x"), ("B", "y")],
+        "Feature Importance": [0.2, 0.3, 0.5]
+    })
+    summed = model_result.aggregate_by_variable(frm)
+    assert list(summed["Feature"]) == ["A", "B"]
+    assert list(summed["Feature Importance"]) == [0.2, 0.8]
+
+
+def test_to_markdown_by_variable(model_result):
+    markdown = model_result.to_markdown(by_variable=True)
+    assert "Value:" not in markdown
+
+
+def test_combined_markdown(model_result):
+    markdown = combined_markdown({"First": model_result, "Second": model_result})
+    assert markdown.count("# Sheet:") == 2
+    assert "## Column: Missing" in markdown
+
+
+def test_profile_summary(missing_data):
+    results = MissingClassifier(missing_data, profile=True).test_all_columns()
+    frame = results.profile_frame()
+    assert len(frame) == 1 + 5 * len(results)
+    summary = results.profile_summary()
+    assert summary.loc["fit", "Calls"] == len(results)
+    assert summary["Seconds"].is_monotonic_decreasing
+    assert summary["Share"].sum() == pytest.approx(1)
+
+
+def test_profile_summary_unprofiled(model_result):
+    assert model_result.profile_summary().empty
+
+
+@pytest.fixture
+def mined_results(missing_data):
+    return MissingClassifier(missing_data, random_state=0).test_all_columns()
+
+
+def test_compact(mined_results):
+    compact = mined_results.compact(top_k=1)
+    assert all(isinstance(i, CompactResult) and i.Model is None for i in compact)
+    assert len({id(i.Table) for i in compact}) == 1
+    for full, small in zip(mined_results, compact):
+        best = full.Model.feature_importances_.argmax()
+        assert small.Features == [full.Features[best]]
+        assert small.Score == full.Score
+    assert compact.to_markdown(n_features=1) == mined_results.to_markdown(n_features=1)
+
+
+def test_compact_keeps_model(mined_results):
+    compact = mined_results.compact(top_k=None, keep_model=True)
+    assert compact[0].Model is mined_results[0].Model
+    assert str(compact) == str(mined_results)
+
+
+def test_compact_pickles_smaller(mined_results):
+    compact = mined_results.compact()
+    restored = pickle.loads(pickle.dumps(compact))
+    assert len(pickle.dumps(compact)) < len(pickle.dumps(mined_results))
+    assert restored.to_markdown() == compact.to_markdown()
+
+
+def test_columnar(mined_results):
+    columnar = mined_results.to_columnar(top_k=2)
+    assert len(columnar) == len(mined_results)
+    assert columnar.offsets[-1] == len(columnar.importances)
+    assert columnar[-1].Variable == mined_results[-1].Variable
+    assert columnar[0].SampleSize == mined_results[0].SampleSize
+    assert columnar.to_markdown(n_features=2) == mined_results.to_markdown(n_features=2)
+    restored = pickle.loads(pickle.dumps(columnar))
+    assert restored.to_markdown() == columnar.to_markdown()
+    with pytest.raises(IndexError):
+        columnar[len(columnar)]
+
+
+def test_columnar_keeps_strategy(missing_classifier):
+    mined = missing_classifier.test_column("Missing")._replace(Screening=0.01)
+    results = MissingResults([missing_classifier.screened_result("Missing"), mined],
+                             unmined=["Other"])
+    columnar = results.to_columnar()
+    assert [i.Strategy for i in columnar] == [i.Strategy for i in results]
+    assert [i.Screening for i in columnar] == [None, 0.01]
+    assert columnar.to_results().unmined == ["Other"]
+    assert columnar.to_markdown() == results.to_markdown()
+
+
+def test_feature_table():
+    table = FeatureTable(["A", ("B", "x")])
+    assert list(table.ids([("B", "x"), "C"])) == [1, 2]
+    assert pickle.loads(pickle.dumps(table)).lookup([2, 0]) == ["C", "A"]
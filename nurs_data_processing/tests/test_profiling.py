@@ -0,0 +1,52 @@
+import tracemalloc
+
+import numpy as np
+
+from ..profiling import StageProfiler, NullProfiler
+
+
+def test_stage_profiler():
+    profiler = StageProfiler()
+    with profiler.stage("allocate", rows=10) as counts:
+        values = np.ones(1000000)
+        counts["Features"] = 3
+    with profiler.stage("nothing"):
+        pass
+
+    allocate, nothing = profiler.stages
+    assert allocate.Stage == "allocate"
+    assert allocate.PeakBytes >= values.nbytes
+    assert (allocate.Rows, allocate.Features) == (10, 3)
+    assert nothing.Seconds >= 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_null_profiler():
+    profiler = NullProfiler()
+    with profiler.stage("anything") as counts:
+        counts["Rows"] = 1
+    assert profiler.stages is None
+
+
+def test_nested_stages_keep_outer_peak():
+    profiler = StageProfiler()
+    with profiler.stage("outer"):
+        values = np.ones(1000000)
+        del values
+        with profiler.stage("inner"):
+            pass
+    inner, outer = profiler.stages
+    assert outer.PeakBytes >= 8000000
+    assert not tracemalloc.is_tracing()
+
+
+def test_stage_profiler_without_reset_peak(monkeypatch):
+    # tracemalloc.reset_peak is only available from python 3.9.
+    monkeypatch.delattr(tracemalloc, "reset_peak")
+    profiler = StageProfiler()
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            values = np.ones(1000000)
+    inner, outer = profiler.stages
+    assert inner.PeakBytes >= values.nbytes
+    assert outer.PeakBytes >= values.nbytes
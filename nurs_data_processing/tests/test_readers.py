@@ -0,0 +1,91 @@
+import os
+import pandas as pd
+import pytest
+from ..readers import (
+    read_data, read_arrow_table, arrow_missing_mask, arrow_null_counts, sidecar_paths
+)
+from . import test_data_path, test_data_folder
+
+
+@pytest.fixture
+def test_data(test_data_path):
+    return pd.read_csv(test_data_path, index_col=0)
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def arrow_path(request, test_data, tmp_path):
+    path = str(tmp_path / f"missing_data.{request.param}")
+    if request.param == "parquet":
+        test_data.to_parquet(path)
+    else:
+        test_data.reset_index(drop=True).to_feather(path)
+    return path
+
+
+def test_read_arrow(arrow_path, test_data):
+    data = read_data(arrow_path)
+    assert list(data.columns[-4:]) == ["A", "B", "C", "D"]
+    assert all(data[["A", "B", "C", "D"]].isna().sum() == test_data.isna().sum())
+
+
+def test_read_arrow_projection(arrow_path):
+    table = read_arrow_table(arrow_path, columns=["A", "D"])
+    assert table.column_names == ["A", "D"]
+
+
+def test_arrow_missing_mask(arrow_path, test_data):
+    table = read_arrow_table(arrow_path, columns=["A", "B", "C", "D"])
+    mask = arrow_missing_mask(table)
+    assert (mask.values == test_data.isna().values).all()
+    assert arrow_null_counts(table).to_dict() == test_data.isna().sum().to_dict()
+
+
+def test_read_csv_projection(test_data_path):
+    data = read_data(test_data_path, columns=["A", "C"])
+    assert list(data.columns) == ["A", "C"]
+
+
+def test_read_unknown_type():
+    with pytest.raises(TypeError):
+        read_data("data.txt")
+
+
+@pytest.fixture
+def workbook_path(test_data, tmp_path):
+    path = str(tmp_path / "missing_data.xlsx")
+    with pd.ExcelWriter(path) as writer:
+        test_data.to_excel(writer, sheet_name="First", index=False)
+        test_data[["A", "D"]].to_excel(writer, sheet_name="Second", index=False)
+    return path
+
+
+def test_sidecar_excel(workbook_path, tmp_path, monkeypatch):
+    sidecar_dir = str(tmp_path / "sidecar")
+    first = read_data(workbook_path, "Second", sidecar_dir=sidecar_dir)
+    assert list(first.columns) == ["A", "D"]
+    data_path, meta_path = sidecar_paths(sidecar_dir, workbook_path, "Second")
+    assert os.path.exists(data_path) and os.path.exists(meta_path)
+
+    monkeypatch.setattr(pd, "read_excel", lambda *args, **kwargs: pytest.fail("re-read workbook"))
+    cached = read_data(workbook_path, "Second", sidecar_dir=sidecar_dir)
+    assert cached.isna().sum().to_dict() == first.isna().sum().to_dict()
+    assert list(read_data(workbook_path, "Second", columns=["D"], sidecar_dir=sidecar_dir).columns) == ["D"]
+
+
+def test_sidecar_stale(test_data_path, tmp_path):
+    path = str(tmp_path / "data.csv")
+    sidecar_dir = str(tmp_path / "sidecar")
+    pd.read_csv(test_data_path).to_csv(path, index=False)
+    assert len(read_data(path, sidecar_dir=sidecar_dir)) == 1000
+
+    pd.read_csv(test_data_path).iloc[:10].to_csv(path, index=False)
+    assert len(read_data(path, sidecar_dir=sidecar_dir)) == 10
+    assert len(read_data(path, sidecar_dir=sidecar_dir)) == 10
+
+
+def test_sidecar_unsupported(tmp_path):
+    path = str(tmp_path / "mixed.xlsx")
+    pd.DataFrame({"A": [1, "x"]}).to_excel(path, index=False)
+    with pytest.warns(UserWarning):
+        data = read_data(path, sidecar_dir=str(tmp_path / "sidecar"))
+    assert list(data["A"]) == [1, "x"]
@@ -0,0 +1,126 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..missing_classifier import MissingClassifier
+from ..model_result import top_k_indices
+from ..synthetic import synthetic_data
+from ..report_writers import (
+    MarkdownWriter, JsonLinesWriter, ParquetWriter, open_writer, top_features
+)
+from .fixtures import missing_data
+
+
+@pytest.fixture
+def mined_results(missing_data):
+    return MissingClassifier(missing_data, random_state=0).test_all_columns()
+
+
+def test_top_k_indices():
+    values = np.array([0.1, 0.5, 0.0, 0.5, 0.2, 0.0])
+    assert list(top_k_indices(values, 3)) == [1, 3, 4]
+    assert list(top_k_indices(values, 5)) == [1, 3, 4, 0, 2]
+    assert list(top_k_indices(values)) == [1, 3, 4, 0, 2, 5]
+    assert len(top_k_indices(values, 0)) == 0
+
+
+def test_top_features(mined_results):
+    result = mined_results[0]
+    features, importances = top_features(result, n_features=2)
+    assert len(features) == 2
+    assert importances[0] == result.Model.feature_importances_.max()
+    variables, summed = top_features(result, n_features=None, by_variable=True)
+    assert len(set(variables)) == len(variables)
+    assert summed.sum() == pytest.approx(1)
+
+
+def test_markdown_writer_streams(mined_results):
+    buffer = io.StringIO()
+    writer = MarkdownWriter(buffer)
+    writer.write(mined_results[0])
+    assert buffer.getvalue().count("## Column:") == 1
+    writer.write_all(mined_results[1:])
+    assert buffer.getvalue() == mined_results.to_markdown()
+
+
+def test_jsonl_writer(mined_results, tmp_path):
+    path = tmp_path / "report.jsonl"
+    with JsonLinesWriter(path, n_features=1) as writer:
+        writer.write_all(mined_results)
+    records = [json.loads(i) for i in path.read_text().splitlines()]
+    assert [i["Variable"] for i in records] == [i.Variable for i in mined_results]
+    assert all(len(i["Features"]) == 1 for i in records)
+    assert records[0]["Score"] == pytest.approx(mined_results[0].Score)
+
+
+def test_writers_list_unmined(mined_results, tmp_path):
+    buffer = io.StringIO()
+    MarkdownWriter(buffer).write_unmined(["A", "B"])
+    assert buffer.getvalue() == "## Unmined columns \n- A\n- B\n"
+
+    path = tmp_path / "report.jsonl"
+    with JsonLinesWriter(path) as writer:
+        writer.write(mined_results[0])
+        writer.write_unmined(["A"])
+    records = [json.loads(i) for i in path.read_text().splitlines()]
+    assert records[0]["Strategy"] == "full"
+    assert records[1] == {"Variable": "A", "Unmined": True}
+
+
+def test_parquet_writer(mined_results, tmp_path):
+    path = tmp_path / "report.parquet"
+    with ParquetWriter(path, n_features=2) as writer:
+        writer.write_all(mined_results)
+    table = pd.read_parquet(path)
+    assert len(table) == 2 * len(mined_results)
+    assert list(table.groupby("Variable")["Rank"].max()) == [2] * len(mined_results)
+    assert table["FeatureValue"].isna().any()
+
+
+def test_open_writer(tmp_path):
+    with open_writer(tmp_path / "report.jsonl") as writer:
+        assert isinstance(writer, JsonLinesWriter)
+    with pytest.raises(ValueError):
+        open_writer(tmp_path / "report.txt")
+    with pytest.raises(ValueError):
+        open_writer(tmp_path / "report.md", "html")
+
+
+def test_all_columns_writer(missing_data):
+    buffer = io.StringIO()
+    results = MissingClassifier(missing_data).test_all_columns(writer=MarkdownWriter(buffer))
+    assert buffer.getvalue().count("## Column:") == len(results)
+
+
+@pytest.fixture
+def screened_result():
+    data = synthetic_data(n_rows=300, n_numeric=2, n_categorical=2, n_missing_columns=1,
+                          mechanism="MCAR", random_state=0)
+    results = MissingClassifier(data, random_state=0, screening_alpha=1e-6).test_all_columns()
+    assert results[0].Strategy == "screened"
+    return results[0]
+
+
+def test_writers_report_screened(screened_result, tmp_path):
+    buffer = io.StringIO()
+    MarkdownWriter(buffer).write(screened_result)
+    assert f"## Column: {screened_result.Variable}" in buffer.getvalue()
+    assert "### Screening p-value:" in buffer.getvalue()
+
+    path = tmp_path / "report.jsonl"
+    with JsonLinesWriter(path) as writer:
+        writer.write(screened_result)
+    record = json.loads(path.read_text())
+    assert record["Screening"] == pytest.approx(screened_result.Screening)
+    assert record["Features"] == []
+
+    path = tmp_path / "report.parquet"
+    with ParquetWriter(path) as writer:
+        writer.write(screened_result)
+    table = pd.read_parquet(path)
+    assert list(table["Variable"]) == [screened_result.Variable]
+    assert table["Screening"][0] == pytest.approx(screened_result.Screening)
+    assert table["FeatureVariable"].isna().all()
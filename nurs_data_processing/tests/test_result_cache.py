@@ -0,0 +1,66 @@
+import os
+import time
+import pytest
+from ..missing_classifier import MissingClassifier
+from ..model_result import ClassifierResult, CompactResult
+from ..result_cache import ResultCache, column_hashes
+from .fixtures import missing_data
+
+
+def test_column_hashes(missing_data):
+    hashes = column_hashes(missing_data)
+    changed = missing_data.copy()
+    changed.loc[0, "Numeric"] += 1
+    changed_hashes = column_hashes(changed)
+    assert hashes["Numeric"] != changed_hashes["Numeric"]
+    assert hashes["Missing"] == changed_hashes["Missing"]
+
+
+def test_key(missing_data):
+    hashes = column_hashes(missing_data)
+    key = ResultCache.key(hashes, "Missing", {"random_state": 1})
+    assert key == ResultCache.key(hashes, "Missing", {"random_state": 1})
+    assert key != ResultCache.key(hashes, "Missing", {"random_state": 2})
+    assert key != ResultCache.key(hashes, "Numeric", {"random_state": 1})
+
+
+def test_put_get(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    assert cache.get("key") is None
+    cache.put("key", ClassifierResult("A", None, ["B"], 0.5))
+    assert cache.get("key").Score == 0.5
+
+
+def test_evict_by_size(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put("first", ClassifierResult("A", None, ["B"], 0.5))
+    size = cache.entries()[0][1]
+    os.utime(cache.path("first"), (time.time() - 10, time.time() - 10))
+
+    cache.max_bytes = size
+    cache.put("second", ClassifierResult("A", None, ["B"], 0.5))
+    assert cache.get("first") is None
+    assert cache.get("second") is not None
+
+
+def test_evict_by_age(tmp_path):
+    cache = ResultCache(str(tmp_path), max_age=60)
+    cache.put("old", ClassifierResult("A", None, ["B"], 0.5))
+    os.utime(cache.path("old"), (time.time() - 120, time.time() - 120))
+    assert cache.get("old") is None
+    assert not os.path.exists(cache.path("old"))
+
+
+def test_all_columns_cached(missing_data, tmp_path):
+    first = MissingClassifier(missing_data, random_state=0).test_all_columns(cache=str(tmp_path))
+
+    classifier = MissingClassifier(missing_data, random_state=0)
+    classifier.test_column = lambda col: pytest.fail("cached column was refitted")
+    second = classifier.test_all_columns(cache=str(tmp_path))
+    assert [i.Score for i in first] == [i.Score for i in second]
+    assert all(isinstance(i, CompactResult) and i.Model is None for i in second)
+    assert [set(i.Features) for i in second] == [set(i.Features) for i in first]
+
+    changed = MissingClassifier(missing_data, random_state=1)
+    changed.test_column = lambda col: ClassifierResult(col, None, [], 0.0)
+    assert changed.test_all_columns(cache=str(tmp_path))[0].Score == 0.0
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from ..sampling import sample_size, stratified_sample_indices, take_rows, MIN_CLASS_ROWS
+
+
+def test_sample_size():
+    assert sample_size(1000) == 1000
+    assert sample_size(1000, max_rows=100) == 100
+    assert sample_size(1000, sample_fraction=0.25) == 250
+    assert sample_size(1000, max_rows=100, sample_fraction=0.05) == 50
+    assert sample_size(10, max_rows=100) == 10
+
+
+def test_stratified_keeps_rare_class():
+    labels = pd.Series([True] * 15 + [False] * 9985)
+    positions = stratified_sample_indices(labels, 500, random_state=0)
+    assert labels.iloc[positions].sum() == MIN_CLASS_ROWS
+    assert abs(len(positions) - 500) <= MIN_CLASS_ROWS
+
+
+def test_stratified_proportional():
+    labels = pd.Series([True] * 3000 + [False] * 7000)
+    positions = stratified_sample_indices(labels, 1000, random_state=0)
+    assert len(positions) == 1000
+    assert labels.iloc[positions].sum() == 300
+    assert all(np.diff(positions) > 0)
+
+
+def test_take_rows():
+    positions = np.array([0, 2])
+    frame = pd.DataFrame({"A": [1, 2, 3]}, index=[5, 6, 7])
+    assert list(take_rows(frame, positions)["A"]) == [1, 3]
+    matrix = sparse.csc_matrix(np.identity(3))
+    assert take_rows(matrix, positions).shape == (2, 3)
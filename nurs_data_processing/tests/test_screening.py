@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from ..screening import association_p_values, screening_scores
+from ..synthetic import synthetic_data
+
+
+@pytest.fixture
+def data():
+    return synthetic_data(n_rows=500, n_numeric=3, n_categorical=3, n_missing_columns=4,
+                          random_state=1)
+
+
+@pytest.fixture
+def p_values(data):
+    missing = data.isna()
+    return association_p_values(
+        missing.loc[:, missing.any()],
+        data.select_dtypes(exclude="object"), data.select_dtypes("object")
+    )
+
+
+def test_chi_square_matches_scipy(data, p_values):
+    for target in p_values.index:
+        for variable in data.select_dtypes("object").columns.drop(target, errors="ignore"):
+            table = pd.crosstab(data[target].isna(), data[variable].fillna("missing"))
+            expected = stats.chi2_contingency(table, correction=False)[1]
+            assert p_values.loc[target, variable] == pytest.approx(expected)
+
+
+def test_point_biserial_matches_scipy(data, p_values):
+    for target in p_values.index:
+        for variable in data.select_dtypes(exclude="object").columns.drop(target, errors="ignore"):
+            values = data[variable].fillna(data[variable].mean())
+            expected = stats.pointbiserialr(data[target].isna(), values)[1]
+            assert p_values.loc[target, variable] == pytest.approx(expected, rel=1e-6)
+
+
+def test_own_variable_untested(p_values):
+    assert all(np.isnan(p_values.loc[i, i]) for i in p_values.index)
+
+
+def test_screening_scores():
+    p_values = pd.DataFrame({"A": [np.nan, 0.01, 0.5], "B": [0.2, np.nan, 0.9]},
+                            index=["A", "B", "C"])
+    scores = screening_scores(p_values)
+    assert list(scores) == pytest.approx([0.2, 0.01, 1])
+
+
+def test_numeric_missing_together():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"a": rng.normal(size=500), "b": rng.normal(size=500),
+                         "c": rng.normal(size=500)})
+    data.loc[rng.random(500) < 0.3, ["a", "b"]] = np.nan
+    missing = data.isna()
+    p_values = association_p_values(missing[["a", "b"]], data, data.iloc[:, :0])
+    assert p_values.loc["a", "Missing:b"] < 1e-10
+    assert np.isnan(p_values.loc["a", "Missing:a"])
+    assert (screening_scores(p_values) < 0.05).all()
@@ -0,0 +1,77 @@
+"""
+Tests of reading from SQL, using a local SQLite database in place of the NuRS server.
+"""
+import pandas as pd
+import pytest
+import yaml
+
+from nurs_data_processing.api import mine_missing_from_sql
+from nurs_data_processing.sql_engine import NuRS_SQL
+from . import test_data_path, test_data_folder
+from .utilities import missing_mining_checks
+
+
+@pytest.fixture
+def sqlite_config(tmp_path, test_data_path):
+    sql_string = f"sqlite:///{tmp_path / 'nurs.db'}"
+    data = pd.read_csv(test_data_path, index_col=0)
+    data.to_sql("missing_data", NuRS_SQL(sql_string).engine, index=False)
+
+    config_file_path = tmp_path / "config.yaml"
+    with open(config_file_path, "w") as f:
+        yaml.safe_dump({"sql_string": sql_string}, f)
+    return str(config_file_path)
+
+
+def test_from_config_pool(tmp_path):
+    config_file_path = tmp_path / "config.yaml"
+    with open(config_file_path, "w") as f:
+        yaml.safe_dump({"sql_string": "sqlite://", "pool_size": 3, "max_overflow": 1}, f)
+    nurs_sql = NuRS_SQL.from_config(config_file_path)
+    assert (nurs_sql.pool_size, nurs_sql.max_overflow) == (3, 1)
+
+
+def test_select_statement():
+    nurs_sql = NuRS_SQL("sqlite://")
+    assert str(nurs_sql.select_statement("missing_data")) == 'SELECT * FROM missing_data'
+    assert str(nurs_sql.select_statement("SELECT A FROM t")) == "SELECT A FROM t"
+
+
+def test_read_chunks(sqlite_config, test_data_path):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    chunks = list(nurs_sql.read_chunks("missing_data", chunksize=300))
+    assert [len(i) for i in chunks] == [300, 300, 300, 100]
+    data = pd.concat(chunks)
+    expected = pd.read_csv(test_data_path, index_col=0)
+    assert all(data.isna().sum() == expected.isna().sum())
+
+
+def test_mine_missing_from_sql(sqlite_config):
+    result = mine_missing_from_sql(
+        "missing_data", config_file_path=sqlite_config, chunksize=250, random_state=0
+    )
+    missing_mining_checks(result, n=3)
+
+
+def test_mine_missing_from_sql_query(sqlite_config):
+    result = mine_missing_from_sql(
+        "SELECT A, C, D FROM missing_data", config_file_path=sqlite_config, chunksize=250
+    )
+    missing_mining_checks(result, n=2)
+
+
+def test_mine_missing_from_sql_reports_unsampled_columns(tmp_path):
+    sql_string = f"sqlite:///{tmp_path / 'late.db'}"
+    data = pd.DataFrame({"A": [float(i) for i in range(5000)], "B": ["x", "y"] * 2500})
+    data.loc[data.index[-3:], "A"] = None
+    data.to_sql("late_nulls", NuRS_SQL(sql_string).engine, index=False)
+    config_file_path = tmp_path / "config.yaml"
+    with open(config_file_path, "w") as f:
+        yaml.safe_dump({"sql_string": sql_string}, f)
+
+    result = mine_missing_from_sql(
+        "late_nulls", config_file_path=str(config_file_path), chunksize=500,
+        sample_size=100, random_state=0
+    )
+    assert len(result) == 0
+    assert result.unmined == ["A"]
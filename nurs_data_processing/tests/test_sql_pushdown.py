@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from nurs_data_processing.missing_chart import metrics, group_vector, missing_summary
+from nurs_data_processing.sql_engine import NuRS_SQL
+from nurs_data_processing import sql_pushdown
+from . import test_data_path, test_data_folder
+from .test_sql_mining import sqlite_config
+
+
+def test_null_counts(sqlite_config, test_data_path):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    data = pd.read_csv(test_data_path, index_col=0)
+    counts = sql_pushdown.null_counts(nurs_sql, "missing_data")
+    assert counts.to_dict() == data.isna().sum().to_dict()
+
+
+def test_missing_columns_query(sqlite_config):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    columns = sql_pushdown.missing_columns(nurs_sql, "SELECT C, D FROM missing_data")
+    assert list(columns) == ["C"]
+
+
+def test_grouped_missing_counts(sqlite_config, test_data_path):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    data = pd.read_csv(test_data_path, index_col=0)
+    counts = sql_pushdown.grouped_missing_counts(nurs_sql, "missing_data", "C", "B")
+    expected = data["C"].isna().groupby(data["B"].fillna("NaN"))
+    assert counts["N"].to_dict() == expected.size().to_dict()
+    assert counts["Missing"].to_dict() == expected.sum().to_dict()
+
+
+def test_is_categorical(sqlite_config):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    assert sql_pushdown.is_categorical(nurs_sql, "missing_data", "D")
+    assert not sql_pushdown.is_categorical(nurs_sql, "missing_data", "A")
+
+
+def test_summary_matches_metrics(sqlite_config, test_data_path):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    data = pd.read_csv(test_data_path, index_col=0)
+    for feature_col in ["D", "A"]:
+        summary, overall = sql_pushdown.missing_summary_from_sql(
+            nurs_sql, "missing_data", "C", feature_col
+        )
+        expected = pd.DataFrame({
+            i: metrics(df, "C", feature_col)
+            for i, df in data.groupby(group_vector(data, feature_col))
+        }).T
+        assert np.allclose(summary["Missing"].astype(float), expected["Missing"].astype(float))
+        assert np.allclose(summary["Upper"].astype(float), expected["Upper"].astype(float))
+        assert np.isclose(overall, metrics(data, "C", feature_col)["Missing"])
+
+
+def test_missing_chart_from_sql(sqlite_config):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    lines = sql_pushdown.missing_chart_from_sql(nurs_sql, "missing_data", "C", "D")
+    assert len(lines.get_segments()) == 1
+
+
+def test_infer_categorical():
+    assert not sql_pushdown.infer_categorical([Decimal("1.5"), Decimal("2")])
+    assert sql_pushdown.infer_categorical(["a", "b"])
+
+
+def test_grouped_missing_counts_order(sqlite_config, test_data_path):
+    nurs_sql = NuRS_SQL.from_config(sqlite_config)
+    data = pd.read_csv(test_data_path, index_col=0)
+    counts = sql_pushdown.grouped_missing_counts(nurs_sql, "missing_data", "C", "B")
+    assert list(counts.index) == list(missing_summary(data, "C", "B").index)
+    assert "NaN" in counts.index
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed for the command line entry point, in microseconds.
+IMPORT_BUDGET_US = 500000
+HEAVY_MODULES = ("sklearn", "matplotlib", "sqlalchemy", "scipy", "pandas", "pyarrow")
+
+
+def loaded_modules(statement):
+    code = (
+        f"import sys; {statement}; "
+        f"print(','.join(i for i in {HEAVY_MODULES!r} if i in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, universal_newlines=True,
+        check=True
+    ).stdout.strip()
+    return set(output.split(",")) - {""}
+
+
+def import_time_us(module):
+    """
+    Cumulative time to import module and its parent packages, from -X importtime.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top level imports are indented by a single space.
+        if name.startswith(" nurs_data_processing"):
+            total += int(cumulative)
+    return total
+
+
+@pytest.mark.parametrize("statement", [
+    "import nurs_data_processing",
+    "import nurs_data_processing.cli.mine_missing_features",
+    "from nurs_data_processing.cli.missing_parser import missing_parser",
+])
+def test_no_heavy_imports(statement):
+    assert loaded_modules(statement) == set()
+
+
+def test_api_defers_plotting_and_sql():
+    loaded = loaded_modules("import nurs_data_processing.api")
+    assert not loaded & {"matplotlib", "sqlalchemy"}
+
+
+def test_lazy_mine_missing():
+    assert "sklearn" in loaded_modules("from nurs_data_processing import mine_missing")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime needs python 3.7")
+def test_cli_import_budget():
+    assert import_time_us("nurs_data_processing.cli.mine_missing_features") < IMPORT_BUDGET_US
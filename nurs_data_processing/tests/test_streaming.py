@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ..streaming import summarize_chunks, summarize_csv
+from . import test_data_path, test_data_folder
+
+
+def test_summarize_csv(test_data_path):
+    data = pd.read_csv(test_data_path)
+    summary = summarize_csv(test_data_path, chunksize=64, sample_size=100, random_state=0,
+                            keep_mask=True)
+    assert summary.n_rows == len(data)
+    assert all(summary.null_counts == data.isna().sum())
+    assert list(summary.missing_columns) == ["A", "B", "C"]
+    assert summary.vocabularies["D"] == set(data["D"].dropna())
+    assert (summary.missing_mask().values == data.isna().values).all()
+
+
+def test_mask_opt_in(test_data_path):
+    summary = summarize_csv(test_data_path, chunksize=64, sample_size=100)
+    with pytest.raises(ValueError):
+        summary.missing_mask()
+
+
+def test_sample(test_data_path):
+    summary = summarize_csv(test_data_path, chunksize=64, sample_size=100, random_state=0)
+    sample = summary.sample
+    assert len(sample) == 100
+    assert sample.index.is_monotonic_increasing
+    assert sample.dtypes["B"] == "object"
+    assert sample.dtypes["A"] == "float64"
+
+
+def test_sample_reproducible(test_data_path):
+    first = summarize_csv(test_data_path, chunksize=64, sample_size=50, random_state=1)
+    second = summarize_csv(test_data_path, chunksize=64, sample_size=50, random_state=1)
+    assert list(first.sample.index) == list(second.sample.index)
+
+
+def test_dtype_merge():
+    chunks = [
+        pd.DataFrame({"A": [1, 2], "B": [1.0, None]}),
+        pd.DataFrame({"A": [1.5, None], "B": ["x", "y"]}),
+    ]
+    summary = summarize_chunks(chunks)
+    assert summary.dtypes["A"] == np.dtype("float64")
+    assert summary.dtypes["B"] == np.dtype("object")
+    assert list(summary.sample["B"].fillna("NaN")) == ["1.0", "NaN", "x", "y"]
+    assert summary.null_counts["B"] == 1
+
+
+def test_dtype_merge_all_null_chunk():
+    chunks = [
+        pd.DataFrame({"A": [1, 2], "B": [None, None]}),
+        pd.DataFrame({"A": [3, 4], "B": [0.5, 1.5]}),
+        pd.DataFrame({"A": [None, None], "B": [2.5, None]}),
+    ]
+    summary = summarize_chunks(chunks)
+    assert summary.dtypes["A"] == np.dtype("float64")
+    assert summary.dtypes["B"] == np.dtype("float64")
+    assert summary.sample["B"].dtype == np.dtype("float64")
+    assert "B" not in summary.vocabularies
+
+
+def test_vocabulary_truncated():
+    chunks = [pd.DataFrame({"A": list("ABCD")}), pd.DataFrame({"A": list("EFGH")})]
+    summary = summarize_chunks(chunks, max_categories=5)
+    assert "A" in summary.truncated_vocabularies
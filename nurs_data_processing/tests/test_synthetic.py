@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from ..synthetic import synthetic_data
+
+
+def test_synthetic_shape():
+    data = synthetic_data(n_rows=200, n_numeric=3, n_categorical=2, cardinality=4, random_state=0)
+    assert data.shape == (200, 5)
+    assert (data.dtypes[:3] == float).all()
+    assert data["Categorical 0"].nunique() == 4
+    assert data.isna().any().sum() == 2
+
+
+@pytest.mark.parametrize("mechanism", ["MCAR", "MAR", "MNAR"])
+def test_synthetic_missing_rate(mechanism):
+    data = synthetic_data(n_rows=5000, mechanism=mechanism, missing_rate=0.2,
+                          n_missing_columns=4, random_state=1)
+    assert np.allclose(data.isna().mean(), 0.2, atol=0.03)
+
+
+def test_synthetic_mnar_depends_on_value():
+    data = synthetic_data(n_rows=5000, n_numeric=1, n_categorical=0, mechanism="MNAR",
+                          random_state=2)
+    complete = synthetic_data(n_rows=5000, n_numeric=1, n_categorical=0, mechanism="MNAR",
+                              missing_rate=1e-9, random_state=2)
+    removed = complete["Numeric 0"][data["Numeric 0"].isna()]
+    assert removed.mean() > complete["Numeric 0"].mean() + 1
+
+
+def test_synthetic_reproducible():
+    assert synthetic_data(random_state=3).equals(synthetic_data(random_state=3))
+
+
+def test_synthetic_bad_mechanism():
+    with pytest.raises(ValueError):
+        synthetic_data(mechanism="MISSING")
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from ..time_budget import BudgetPlanner, FULL, SUBSAMPLE, SHALLOW
+
+
+@pytest.fixture
+def planner():
+    return BudgetPlanner(200, {"A": 300, "B": 100, "C": 200}, n_rows=100000)
+
+
+def test_order(planner):
+    assert planner.order() == ["B", "C", "A"]
+
+
+def test_relative_cost(planner):
+    assert planner.relative_cost(FULL) == 1
+    assert planner.relative_cost(SUBSAMPLE) == pytest.approx(0.1)
+    assert planner.relative_cost(SHALLOW) < planner.relative_cost(SUBSAMPLE)
+
+
+def test_choose_degrades(planner):
+    assert planner.choose("B", 3) == FULL
+    # One second per unit of cost leaves 50 seconds for each of the last two columns.
+    planner.record("B", FULL, 100)
+    planner.deadline -= 100
+    assert planner.choose("C", 2) == SUBSAMPLE
+    planner.deadline -= 65
+    assert planner.choose("C", 2) == SHALLOW
+
+
+def test_choose_out_of_time():
+    planner = BudgetPlanner(0, {"A": 1}, n_rows=10)
+    assert planner.choose("A", 1) is None
+
+
+def test_choose_before_timing():
+    # Costly enough that even the a priori rate rules out a full fit of the first column.
+    planner = BudgetPlanner(1, {"A": 5 * 10 ** 7}, n_rows=200000)
+    assert planner.choose("A", 1) == SHALLOW
+
+
+def test_budget_start():
+    planner = BudgetPlanner(10, {"A": 1}, n_rows=10, start=time.perf_counter() - 10)
+    assert planner.choose("A", 1) is None
@@ -0,0 +1,131 @@
+"""
+Tools for mining as many columns as fit in a fixed time, switching to cheaper model
+fitting strategies as the deadline approaches.
+"""
+import math
+import time
+from collections import namedtuple
+
+Strategy = namedtuple("Strategy", ("Name", "MaxRows", "MaxDepth"))
+
+# From most to least accurate (and expensive).
+FULL = Strategy("full", None, None)
+SUBSAMPLE = Strategy("subsample", 10000, None)
+SHALLOW = Strategy("shallow", 10000, 4)
+STRATEGIES = (FULL, SUBSAMPLE, SHALLOW)
+
+# Seconds per unit of cost (rows x features) of the full strategy assumed until a
+# column has been timed, a pessimistic guess at the rate of a decision tree fit.
+PRIOR_SECONDS_PER_COST = 1e-6
+
+
+class BudgetPlanner:
+    """
+    Plans the mining of columns within time_budget seconds.
+
+    Columns are mined cheapest first, by expected cost (rows x features), so that as
+    many as possible are mined.  The time per unit of cost of each strategy is
+    measured as columns are mined (until then it is scaled from another strategy's,
+    or from PRIOR_SECONDS_PER_COST), and each column is given the most accurate
+    strategy expected to finish within its share of the remaining time (the
+    remaining time divided by the number of columns left).  Once not even the
+    cheapest strategy is expected to finish before the deadline, planning stops and
+    the remaining columns are left unmined.
+
+    Parameters
+    ----------
+    time_budget: float
+        Seconds available.
+    costs: dict
+        Expected cost of each column to mine.
+    n_rows: int
+        Number of rows in the data set.
+    strategies: tuple [optional]
+        Strategies to choose from, most accurate first.
+    start: float [optional]
+        time.perf_counter() at which the budget started, by default now.
+    """
+
+    def __init__(self, time_budget, costs: dict, n_rows, strategies=STRATEGIES, start=None):
+        start = time.perf_counter() if start is None else start
+        self.deadline = start + time_budget
+        self.costs = costs
+        self.n_rows = n_rows
+        self.strategies = strategies
+        # Seconds taken and cost mined by each strategy.
+        self.seconds = {}
+        self.work = {}
+
+    def order(self) -> list:
+        """
+        Columns to mine, cheapest first.
+        """
+        return sorted(self.costs, key=self.costs.get)
+
+    def relative_cost(self, strategy: Strategy) -> float:
+        """
+        Cost of fitting with strategy relative to the full strategy.  Subsampling
+        scales with the rows kept, and limiting the depth with the depth kept out of
+        the log2(rows) levels of a balanced full tree.
+        """
+        rows = self.n_rows if strategy.MaxRows is None else min(strategy.MaxRows, self.n_rows)
+        scale = rows / max(self.n_rows, 1)
+        if strategy.MaxDepth is not None:
+            scale *= min(strategy.MaxDepth / max(math.log2(max(rows, 2)), 1), 1)
+        return scale
+
+    def rate(self, strategy: Strategy) -> float:
+        """
+        Seconds per unit of cost of mining with strategy: as measured if it has been
+        used, otherwise scaled by relative_cost from the last strategy to be first
+        used, or from PRIOR_SECONDS_PER_COST if none has been.
+        """
+        if self.work.get(strategy.Name):
+            return self.seconds[strategy.Name] / self.work[strategy.Name]
+        for name, work in reversed(self.work.items()):
+            if work:
+                used = next(i for i in self.strategies if i.Name == name)
+                return self.seconds[name] / work \
+                    * self.relative_cost(strategy) / self.relative_cost(used)
+        return PRIOR_SECONDS_PER_COST * self.relative_cost(strategy)
+
+    def estimate(self, column, strategy: Strategy) -> float:
+        """
+        Expected seconds to mine column with strategy.
+        """
+        return self.rate(strategy) * self.costs[column]
+
+    def remaining(self) -> float:
+        """
+        Seconds until the deadline.
+        """
+        return self.deadline - time.perf_counter()
+
+    def choose(self, column, n_left):
+        """
+        Strategy to mine column with, or None if it cannot be mined in time.
+        Parameters
+        ----------
+        column: str
+            The column to mine.
+        n_left: int
+            Number of columns left to mine, including this one.
+        Returns
+        -------
+        Union[Strategy, None]
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+        for strategy in self.strategies:
+            if self.estimate(column, strategy) <= remaining / n_left:
+                return strategy
+        cheapest = self.strategies[-1]
+        return cheapest if self.estimate(column, cheapest) <= remaining else None
+
+    def record(self, column, strategy: Strategy, seconds: float) -> None:
+        """
+        Record the time taken to mine column with strategy.
+        """
+        self.seconds[strategy.Name] = self.seconds.get(strategy.Name, 0.0) + seconds
+        self.work[strategy.Name] = self.work.get(strategy.Name, 0.0) + self.costs[column]
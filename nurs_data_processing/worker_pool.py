@@ -0,0 +1,96 @@
+"""
+Tools for spreading independent mining tasks over a pool of worker processes.
+"""
+import os
+from concurrent.futures import as_completed
+from functools import partial
+from multiprocessing import Pool
+
+_SHARED = {}
+
+
+def resolve_n_jobs(n_jobs=1) -> int:
+    """
+    Convert an 'n_jobs' style argument into a number of worker processes.
+    Follows the sklearn convention where negative values count back from the
+    number of available CPUs (-1 being all CPUs).
+    Parameters
+    ----------
+    n_jobs: int [optional]
+        Requested number of workers.
+    Returns
+    -------
+    int
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _initialize_worker(shared):
+    """
+    Store the shared object once per worker process.
+    """
+    _SHARED["value"] = shared
+
+
+def _call_with_position(function, indexed_item):
+    """
+    Apply function to the shared object of this worker process and the item of a
+    (position, item) pair, returning the position alongside the result.
+    """
+    position, item = indexed_item
+    return position, function(_SHARED["value"], item)
+
+
+def parallel_imap_unordered(function, shared, items, n_jobs=1, executor=None):
+    """
+    Evaluate function(shared, item) for every item, yielding (item, result) pairs as
+    each evaluation completes, so that callers can act on results before the last
+    item is finished.  Closing the generator early cancels work not yet started
+    (or, with a process pool, terminates the pool).
+    Parameters
+    ----------
+    function: callable
+        A picklable (module level) function of (shared, item).
+    shared
+        Object passed as the first argument of every call.
+    items: iterable
+        Values passed as the second argument of each call.
+    n_jobs: int [optional]
+        Number of worker processes.  1 evaluates in the current process, in order.
+    executor: concurrent.futures.Executor [optional]
+        A user supplied executor.  Takes precedence over n_jobs.
+    Yields
+    -------
+    tuple
+        (item, result)
+    """
+    items = list(items)
+    if executor is not None:
+        futures = {executor.submit(function, shared, item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Stop outstanding work if the caller stops early.
+            for future in futures:
+                future.cancel()
+        return
+
+    n_jobs = min(resolve_n_jobs(n_jobs), max(len(items), 1))
+    if n_jobs == 1:
+        for item in items:
+            yield item, function(shared, item)
+        return
+
+    with Pool(n_jobs, initializer=_initialize_worker, initargs=(shared,)) as pool:
+        # Workers return the position of each item rather than sending it back.
+        for position, result in pool.imap_unordered(
+                partial(_call_with_position, function), enumerate(items)):
+            yield items[position], result
+